@@ -0,0 +1,284 @@
+"""
+백엔드 API 혼합 부하 측정 스크립트 (Firebase 없이 메모리 저장소로 돌린다)
+
+GET /issues, POST /issues, PATCH /issues/{id}, DELETE /issues/{id} 를 비율대로 섞어
+동시에 보내고, 처리량과 p50/p95/p99 지연시간을 연산별로 JSON 으로 남긴다.
+기본은 서버를 띄우지 않고 같은 프로세스에서 ASGI 로 직접 부른다.
+이때도 lifespan(시작 준비, 정렬 키 재배치 등)을 돌리고 /readyz 가 200 이 된 뒤 잰다.
+
+    # 기준선 저장
+    python bench/api_load.py --concurrency 50 --requests 5000 --out baseline.json
+
+    # 변경 후 비교 (p95/p99 가 10% 넘게 느려지거나 처리량이 10% 넘게 줄면 종료 코드 1)
+    python bench/api_load.py --concurrency 50 --requests 5000 \\
+        --baseline baseline.json --max-regression 10
+
+    # 이미 떠 있는 서버로 (STORAGE_BACKEND=memory uvicorn server.main:app)
+    python bench/api_load.py --url http://127.0.0.1:8000
+
+캐시 효과를 빼고 저장소 경로만 보려면 ISSUES_CACHE_TTL=0 으로 실행한다.
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import random
+import sys
+import time
+
+import httpx
+
+from load_issues import percentile
+
+OPERATIONS = ("get", "create", "update", "delete")
+DEFAULT_MIX = "get=80,create=8,update=10,delete=2"
+
+# 처리량은 줄면, 지연시간은 늘면 나빠진 것
+HIGHER_IS_BETTER = ("rps",)
+LOWER_IS_BETTER = ("p95_ms", "p99_ms")
+
+
+def parse_mix(text: str) -> dict:
+    mix = {}
+    for part in text.split(","):
+        name, _, weight = part.strip().partition("=")
+        if name not in OPERATIONS:
+            raise ValueError(f"알 수 없는 연산: {name} (가능: {', '.join(OPERATIONS)})")
+        mix[name] = float(weight or 0)
+    if sum(mix.values()) <= 0:
+        raise ValueError("--mix 비율 합이 0 입니다")
+    return mix
+
+
+def make_app(seed_issues: int):
+    """메모리 저장소로 server.main 을 불러오고 안건을 채운다."""
+    os.environ.setdefault("STORAGE_BACKEND", "memory")
+    os.environ.setdefault("ISSUES_MIRROR_ENABLED", "0")
+    # 모든 요청이 한 클라이언트에서 나가므로 클라이언트별 쓰기 속도 제한은 끈다
+    os.environ.setdefault("WRITE_RATE_PER_SEC", "0")
+    # 요청마다 남는 info 로그가 결과 JSON 과 섞이지 않도록
+    os.environ.setdefault("LOG_LEVEL", "WARNING")
+    sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+    from server import main as server
+    from server.ordering import spread_keys
+
+    if server.repository.name != "memory":
+        raise SystemExit(f"메모리 저장소가 아닙니다: {server.repository.name}")
+
+    # 목록은 order_key 로 정렬하므로 키가 없는 안건은 GET /issues 에 나오지 않는다
+    order_keys = spread_keys(seed_issues)
+    server.repository.seed(
+        {
+            "issues": {
+                f"seed{i:05d}": {
+                    "title": f"{i}번 안건",
+                    "summary": "2026년 임금 및 단체협약 교섭 결과 보고",
+                    "company": "도준산업",
+                    "union_opt": "도준산업 노동조합",
+                    "order": i,
+                    "order_key": order_keys[i],
+                }
+                for i in range(seed_issues)
+            }
+        }
+    )
+    return server.app, [f"seed{i:05d}" for i in range(seed_issues)]
+
+
+async def run(args, client: httpx.AsyncClient, issue_ids: list) -> dict:
+    mix = parse_mix(args.mix)
+    names = list(mix)
+    weights = [mix[x] for x in names]
+    rng = random.Random(args.seed)
+
+    latencies = {name: [] for name in OPERATIONS}
+    errors = {name: 0 for name in OPERATIONS}
+    pool = list(issue_ids)
+
+    async def call(name: str):
+        if name == "get":
+            return await client.get("/issues", params={"limit": args.limit})
+        if name == "create":
+            body = {"title": "부하 측정", "summary": "혼합 부하", "order": rng.randint(0, 10**6)}
+            response = await client.post("/issues", json=body)
+            if response.status_code < 400:
+                pool.append(response.json()["id"])
+            return response
+
+        if not pool:
+            return None
+        if name == "update":
+            issue_id = rng.choice(pool)
+            return await client.patch(f"/issues/{issue_id}", json={"summary": "수정됨"})
+
+        # 진행 중인 다른 요청이 지울 대상을 고르지 않도록 먼저 빼 둔다
+        issue_id = pool.pop(rng.randrange(len(pool)))
+        return await client.delete(f"/issues/{issue_id}")
+
+    async def worker(counter, record: bool):
+        for _ in counter:
+            name = rng.choices(names, weights)[0]
+            started = time.perf_counter()
+            try:
+                response = await call(name)
+                elapsed_ms = (time.perf_counter() - started) * 1000
+                failed = response is not None and response.status_code >= 400
+                # 빈 목록은 실제 안건을 읽지 않은 것이므로 오류로 센다
+                if name == "get" and not failed and not response.json():
+                    failed = True
+            except httpx.HTTPError:
+                elapsed_ms = (time.perf_counter() - started) * 1000
+                failed = True
+
+            if record:
+                latencies[name].append(elapsed_ms)
+                errors[name] += failed
+
+    async def phase(total: int, record: bool):
+        counter = iter(range(total))
+        await asyncio.gather(*(worker(counter, record) for _ in range(args.concurrency)))
+
+    # 첫 요청들(import, 캐시 채우기 등)은 집계에서 뺀다
+    await phase(args.warmup, record=False)
+
+    started_at = time.perf_counter()
+    await phase(args.requests, record=True)
+    elapsed = time.perf_counter() - started_at
+
+    def summarize(values: list, error_count: int) -> dict:
+        return {
+            "requests": len(values),
+            "errors": error_count,
+            "rps": round(len(values) / elapsed, 1) if elapsed else 0.0,
+            "p50_ms": round(percentile(values, 50), 2),
+            "p95_ms": round(percentile(values, 95), 2),
+            "p99_ms": round(percentile(values, 99), 2),
+            "max_ms": round(max(values), 2) if values else 0.0,
+        }
+
+    everything = [x for name in OPERATIONS for x in latencies[name]]
+    return {
+        "target": args.url or "in-process",
+        "concurrency": args.concurrency,
+        "requests": args.requests,
+        "warmup": args.warmup,
+        "seed_issues": None if args.url else args.seed_issues,
+        "mix": mix,
+        "elapsed_sec": round(elapsed, 3),
+        **summarize(everything, sum(errors.values())),
+        "operations": {
+            name: summarize(latencies[name], errors[name])
+            for name in OPERATIONS
+            if latencies[name]
+        },
+    }
+
+
+def find_regressions(result: dict, baseline: dict, max_regression: float) -> list:
+    """전체와 연산별 rps / p95 / p99 가 기준선보다 max_regression(%) 넘게 나빠진 항목"""
+    sections = [("total", result, baseline)] + [
+        (name, row, baseline.get("operations", {}).get(name))
+        for name, row in result.get("operations", {}).items()
+    ]
+
+    regressions = []
+    for label, row, before in sections:
+        if not before:
+            continue
+        for key in HIGHER_IS_BETTER + LOWER_IS_BETTER:
+            old, new = before.get(key) or 0, row.get(key) or 0
+            if not old:
+                continue
+            change = (new - old) / old * 100
+            worse = -change if key in HIGHER_IS_BETTER else change
+            if worse > max_regression:
+                regressions.append(f"{label}.{key}: {old} -> {new} ({change:+.1f}%)")
+    return regressions
+
+
+async def wait_ready(client: httpx.AsyncClient, timeout: float) -> None:
+    deadline = time.monotonic() + timeout
+    while True:
+        response = await client.get("/readyz")
+        if response.status_code == 200:
+            return
+        if time.monotonic() > deadline:
+            raise SystemExit(f"/readyz 가 준비되지 않았습니다: {response.text}")
+        await asyncio.sleep(0.05)
+
+
+async def check_first_page(client: httpx.AsyncClient, limit: int) -> None:
+    """빈 목록을 재면 의미가 없으므로 측정 전에 확인한다"""
+    response = await client.get("/issues", params={"limit": limit, "fields": "title"})
+    if response.status_code != 200 or not response.json():
+        raise SystemExit(f"GET /issues 첫 페이지가 비었습니다 ({response.status_code})")
+
+
+async def main_async(args) -> dict:
+    limits = httpx.Limits(
+        max_connections=args.concurrency, max_keepalive_connections=args.concurrency
+    )
+
+    if args.url:
+        async with httpx.AsyncClient(
+            base_url=args.url, limits=limits, timeout=args.timeout
+        ) as client:
+            # 수정/삭제 대상은 서버에 이미 있는 안건에서 고른다
+            response = await client.get("/issues", params={"limit": 500, "fields": "title"})
+            issue_ids = [x["id"] for x in response.json()]
+            await check_first_page(client, args.limit)
+            return await run(args, client, issue_ids)
+
+    app, issue_ids = make_app(args.seed_issues)
+    # ASGITransport 는 lifespan 을 돌리지 않으므로 직접 들어간다 (실제로 띄운 앱과 같은 상태에서 잰다)
+    async with app.router.lifespan_context(app):
+        async with httpx.AsyncClient(
+            transport=httpx.ASGITransport(app=app),
+            base_url="http://bench",
+            timeout=args.timeout,
+        ) as client:
+            await wait_ready(client, args.timeout)
+            await check_first_page(client, args.limit)
+            return await run(args, client, issue_ids)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="백엔드 API 혼합 부하 측정")
+    parser.add_argument("--url", help="이미 떠 있는 서버 주소 (없으면 같은 프로세스에서 실행)")
+    parser.add_argument("--concurrency", type=int, default=50)
+    parser.add_argument("--requests", type=int, default=5000)
+    parser.add_argument("--warmup", type=int, default=200, help="집계에서 빼는 처음 요청 수")
+    parser.add_argument("--mix", default=DEFAULT_MIX, help="연산 비율 (예: get=80,create=8,update=10,delete=2)")
+    parser.add_argument("--limit", type=int, default=100, help="GET /issues 페이지 크기")
+    parser.add_argument("--seed-issues", type=int, default=1000, help="미리 넣어 둘 안건 수")
+    parser.add_argument("--seed", type=int, default=1, help="연산 선택 난수 시드")
+    parser.add_argument("--timeout", type=float, default=30.0)
+    parser.add_argument("--out", help="결과를 JSON 으로 저장 (다음 실행의 --baseline)")
+    parser.add_argument("--baseline", help="비교할 기준선 JSON")
+    parser.add_argument("--max-regression", type=float, default=10.0, help="허용하는 악화 비율(%%)")
+    args = parser.parse_args()
+
+    result = asyncio.run(main_async(args))
+    print(json.dumps(result, ensure_ascii=False, indent=2))
+
+    if args.out:
+        with open(args.out, "w", encoding="utf-8") as f:
+            json.dump(result, f, ensure_ascii=False, indent=2)
+
+    if args.baseline:
+        with open(args.baseline, "r", encoding="utf-8") as f:
+            baseline = json.load(f)
+
+        regressions = find_regressions(result, baseline, args.max_regression)
+        if regressions:
+            print(f"\n기준선 대비 {args.max_regression}% 넘게 나빠짐:", file=sys.stderr)
+            for line in regressions:
+                print(f"  {line}", file=sys.stderr)
+            sys.exit(1)
+        print(f"\n기준선 대비 {args.max_regression}% 이내")
+
+
+if __name__ == "__main__":
+    main()
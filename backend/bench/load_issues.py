@@ -0,0 +1,102 @@
+"""
+GET /issues 부하 측정 스크립트
+
+동기(def) 핸들러 버전과 비동기(async def) 버전을 같은 조건에서 돌려
+requests/sec 와 p99 지연시간을 비교한다.
+
+    # 1) 변경 전 커밋으로 서버 실행 후
+    python bench/load_issues.py --url http://127.0.0.1:8000/issues \\
+        --concurrency 500 --requests 20000 --out before.json
+
+    # 2) 변경 후 커밋으로 서버 실행 후
+    python bench/load_issues.py --url http://127.0.0.1:8000/issues \\
+        --concurrency 500 --requests 20000 --compare before.json
+
+캐시 효과를 빼고 Firestore 호출 경로만 보려면 서버를 ISSUES_CACHE_TTL=0 으로 띄운다.
+"""
+
+import argparse
+import asyncio
+import json
+import time
+
+import httpx
+
+
+def percentile(values: list, p: float) -> float:
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    index = min(len(ordered) - 1, max(0, int(round(p / 100 * len(ordered))) - 1))
+    return ordered[index]
+
+
+async def run(url: str, concurrency: int, total: int, timeout: float) -> dict:
+    latencies = []
+    errors = 0
+    counter = iter(range(total))
+
+    limits = httpx.Limits(
+        max_connections=concurrency, max_keepalive_connections=concurrency
+    )
+
+    async with httpx.AsyncClient(limits=limits, timeout=timeout) as client:
+
+        async def worker():
+            nonlocal errors
+            for _ in counter:
+                started = time.perf_counter()
+                try:
+                    r = await client.get(url)
+                    if r.status_code >= 400:
+                        errors += 1
+                except httpx.HTTPError:
+                    errors += 1
+                latencies.append((time.perf_counter() - started) * 1000)
+
+        started_at = time.perf_counter()
+        await asyncio.gather(*(worker() for _ in range(concurrency)))
+        elapsed = time.perf_counter() - started_at
+
+    return {
+        "url": url,
+        "concurrency": concurrency,
+        "requests": len(latencies),
+        "errors": errors,
+        "elapsed_sec": round(elapsed, 3),
+        "rps": round(len(latencies) / elapsed, 1) if elapsed else 0.0,
+        "p50_ms": round(percentile(latencies, 50), 2),
+        "p99_ms": round(percentile(latencies, 99), 2),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="GET /issues 부하 측정")
+    parser.add_argument("--url", default="http://127.0.0.1:8000/issues")
+    parser.add_argument("--concurrency", type=int, default=500)
+    parser.add_argument("--requests", type=int, default=20000)
+    parser.add_argument("--timeout", type=float, default=30.0)
+    parser.add_argument("--out", help="결과를 저장할 JSON 파일")
+    parser.add_argument("--compare", help="비교할 이전 결과 JSON 파일")
+    args = parser.parse_args()
+
+    result = asyncio.run(run(args.url, args.concurrency, args.requests, args.timeout))
+    print(json.dumps(result, ensure_ascii=False, indent=2))
+
+    if args.out:
+        with open(args.out, "w", encoding="utf-8") as f:
+            json.dump(result, f, ensure_ascii=False, indent=2)
+
+    if args.compare:
+        with open(args.compare, "r", encoding="utf-8") as f:
+            before = json.load(f)
+
+        for key in ("rps", "p50_ms", "p99_ms"):
+            old = before.get(key) or 0
+            new = result.get(key) or 0
+            change = ((new - old) / old * 100) if old else 0.0
+            print(f"{key:>7}: {old} -> {new} ({change:+.1f}%)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,137 @@
+"""
+GET /issues 응답 직렬화/압축 비교 스크립트
+
+한글 위주의 안건 목록을 만들어
+- 직렬화 시간: 표준 json vs orjson
+- 전송 바이트: 무압축 vs gzip vs brotli (+ 압축 시간)
+을 비교한다. 서버 없이 돌아간다.
+
+    python bench/serialization.py --issues 500 --repeat 200
+    python bench/serialization.py --issues 500 --out serialization.json
+"""
+
+import argparse
+import gzip
+import json
+import random
+import time
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
+
+SENTENCES = (
+    "조합원 여러분의 의견을 수렴하여 사측과 교섭한 결과를 알려드립니다.",
+    "기본급 인상률과 성과급 지급 기준에 대한 잠정 합의안입니다.",
+    "교대 근무 조정안에 대해 찬반 투표를 진행합니다.",
+    "안전 보건 위원회 회의 결과와 후속 조치 계획을 공유합니다.",
+    "복지 포인트 사용처 확대에 대한 설문에 참여해 주세요.",
+    "정기 대의원 대회 일정과 안건을 안내드립니다.",
+)
+
+
+def make_issues(count: int) -> list:
+    # 실제 안건처럼 문장을 섞어서 지나치게 잘 압축되지 않게 한다
+    rng = random.Random(count)
+    issues = []
+    for i in range(count):
+        issues.append(
+            {
+                "id": f"issue{i:05d}",
+                "title": f"{i}번 안건: 2026년 임금 및 단체협약 교섭 결과 보고",
+                "summary": " ".join(rng.choice(SENTENCES) for _ in range(rng.randint(2, 5))),
+                "company": "도준산업",
+                "union": "도준산업 노동조합",
+                "status": "open" if i % 3 else "closed",
+                "type": "vote" if i % 2 else "notice",
+                "order": i,
+                "options": ["찬성", "반대", "보류"],
+            }
+        )
+    return issues
+
+
+def timed(fn, repeat: int) -> tuple:
+    """(마지막 결과, 1회 평균 ms)"""
+    started = time.perf_counter()
+    for _ in range(repeat):
+        result = fn()
+    return result, (time.perf_counter() - started) * 1000 / repeat
+
+
+def run(count: int, repeat: int) -> dict:
+    issues = make_issues(count)
+    report = {"issues": count, "repeat": repeat, "serialize": {}, "encode": {}}
+
+    body, ms = timed(
+        lambda: json.dumps(issues, ensure_ascii=False, separators=(",", ":")).encode(
+            "utf-8"
+        ),
+        repeat,
+    )
+    report["serialize"]["json"] = {"ms": round(ms, 3), "bytes": len(body)}
+
+    # FastAPI 기본 JSONResponse 와 같은 설정 (ensure_ascii=True 라 한글이 \\uXXXX 6바이트)
+    ascii_body, ms = timed(lambda: json.dumps(issues).encode("utf-8"), repeat)
+    report["serialize"]["json_ascii"] = {"ms": round(ms, 3), "bytes": len(ascii_body)}
+
+    if orjson is not None:
+        fast_body, ms = timed(lambda: orjson.dumps(issues), repeat)
+        report["serialize"]["orjson"] = {"ms": round(ms, 3), "bytes": len(fast_body)}
+
+    report["encode"]["identity"] = {"ms": 0.0, "bytes": len(body)}
+
+    compressed, ms = timed(lambda: gzip.compress(body, compresslevel=6), repeat)
+    report["encode"]["gzip"] = {"ms": round(ms, 3), "bytes": len(compressed)}
+
+    if brotli is not None:
+        compressed, ms = timed(lambda: brotli.compress(body, quality=4), repeat)
+        report["encode"]["br"] = {"ms": round(ms, 3), "bytes": len(compressed)}
+
+    return report
+
+
+def print_report(report: dict, baseline: dict | None = None) -> None:
+    print(f"issues={report['issues']}  repeat={report['repeat']}")
+
+    for section in ("serialize", "encode"):
+        print(f"\n[{section}]")
+        for name, row in report[section].items():
+            line = f"  {name:<12} {row['ms']:>9.3f} ms  {row['bytes']:>10,d} bytes"
+            before = (baseline or {}).get(section, {}).get(name)
+            if before:
+                line += f"  (이전 {before['ms']:.3f} ms / {before['bytes']:,d} bytes)"
+            print(line)
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--issues", type=int, default=500)
+    parser.add_argument("--repeat", type=int, default=100)
+    parser.add_argument("--out", help="결과를 JSON 으로 저장")
+    parser.add_argument("--compare", help="이전 결과 JSON 과 비교")
+    args = parser.parse_args()
+
+    report = run(args.issues, args.repeat)
+
+    baseline = None
+    if args.compare:
+        with open(args.compare, "r", encoding="utf-8") as f:
+            baseline = json.load(f)
+
+    print_report(report, baseline)
+
+    if args.out:
+        with open(args.out, "w", encoding="utf-8") as f:
+            json.dump(report, f, ensure_ascii=False, indent=2)
+
+
+if __name__ == "__main__":
+    main()
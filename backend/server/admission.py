@@ -0,0 +1,229 @@
+import asyncio
+import collections
+import math
+import time
+
+from .metrics import registry
+from .serialization import dumps
+from .tracing import add_span
+
+admission_in_flight = registry.gauge(
+    "admission_in_flight", "처리 중인 요청 수 (요청 종류별)", ("class",)
+)
+admission_queue_depth = registry.gauge(
+    "admission_queue_depth", "빈 자리를 기다리는 요청 수", ("class",)
+)
+admission_queue_wait = registry.histogram(
+    "admission_queue_wait_seconds", "빈 자리를 기다린 시간", ("class",)
+)
+admission_rejections = registry.counter(
+    "admission_rejections_total", "거절한 요청 수", ("class", "reason")
+)
+
+
+class Rejected(Exception):
+    """status: 429(클라이언트별 한도) / 503(서버 과부하), retry_after: 초"""
+
+    def __init__(self, status: int, reason: str, retry_after: float):
+        super().__init__(reason)
+        self.status = status
+        self.reason = reason
+        self.retry_after = retry_after
+
+
+class ConcurrencyLimiter:
+    """
+    동시에 처리하는 요청 수를 limit 으로 묶고, 넘치면 queue_size 까지만 줄 세운다.
+    줄이 꽉 찼거나 queue_timeout 안에 자리가 나지 않으면 바로 Rejected(503).
+    (워커 프로세스마다 따로 센다)
+    """
+
+    def __init__(self, name: str, limit: int, queue_size: int, queue_timeout: float):
+        self.name = name
+        self.limit = limit
+        self.queue_size = queue_size
+        self.queue_timeout = queue_timeout
+        self.active = 0
+        self._waiters = collections.deque()
+
+    @property
+    def queued(self) -> int:
+        return len(self._waiters)
+
+    def _publish(self) -> None:
+        admission_in_flight.set((self.name,), self.active)
+        admission_queue_depth.set((self.name,), len(self._waiters))
+
+    async def acquire(self, retry_after: float = 1.0) -> float:
+        """자리를 얻을 때까지 기다린 초를 돌려준다."""
+        if self.active < self.limit and not self._waiters:
+            self.active += 1
+            self._publish()
+            return 0.0
+
+        if len(self._waiters) >= self.queue_size:
+            raise Rejected(503, "queue_full", retry_after)
+
+        waiter = asyncio.get_running_loop().create_future()
+        self._waiters.append(waiter)
+        self._publish()
+        started = time.perf_counter()
+
+        try:
+            # release() 가 자리를 넘겨주면 waiter 가 끝난다 (active 는 그대로)
+            await asyncio.wait_for(waiter, self.queue_timeout)
+        except asyncio.TimeoutError:
+            raise Rejected(503, "queue_timeout", retry_after)
+        except asyncio.CancelledError:
+            if waiter.done() and not waiter.cancelled():
+                self.release()
+            raise
+        finally:
+            if waiter in self._waiters:
+                self._waiters.remove(waiter)
+            self._publish()
+
+        waited = time.perf_counter() - started
+        admission_queue_wait.observe((self.name,), waited)
+        return waited
+
+    def release(self) -> None:
+        while self._waiters:
+            waiter = self._waiters.popleft()
+            if not waiter.done():
+                waiter.set_result(None)
+                self._publish()
+                return
+
+        self.active -= 1
+        self._publish()
+
+
+class RateLimiter:
+    """
+    클라이언트별 토큰 버킷. 초당 rate 개씩 채워지고 최대 burst 개까지 모인다.
+    오래 안 온 클라이언트는 max_clients 를 넘으면 오래된 순으로 잊는다.
+    """
+
+    def __init__(self, rate: float, burst: int, max_clients: int = 10000):
+        self.rate = rate
+        self.burst = burst
+        self.max_clients = max_clients
+        self._buckets = collections.OrderedDict()
+
+    def take(self, key: str, now: float | None = None) -> float:
+        """토큰 하나를 쓴다. 허용이면 0, 아니면 다음 토큰까지 기다릴 초"""
+        now = time.monotonic() if now is None else now
+        tokens, updated = self._buckets.pop(key, (self.burst, now))
+        tokens = min(self.burst, tokens + (now - updated) * self.rate)
+
+        wait = 0.0
+        if tokens >= 1:
+            tokens -= 1
+        else:
+            wait = (1 - tokens) / self.rate
+
+        self._buckets[key] = (tokens, now)
+        while len(self._buckets) > self.max_clients:
+            self._buckets.popitem(last=False)
+        return wait
+
+
+def client_key(scope, trust_forwarded: bool = False, identity: str | None = None) -> str:
+    """
+    검증된 사용자(identity)가 있으면 그 사용자, 없으면 클라이언트 IP 로 구분한다.
+    (검증 안 된 Authorization 헤더로 나누면 매번 다른 헤더를 보내 한도를 피할 수 있다)
+    """
+    if identity:
+        return "user:" + identity
+
+    headers = dict(scope.get("headers") or [])
+    forwarded = headers.get(b"x-forwarded-for")
+    if trust_forwarded and forwarded:
+        return "ip:" + forwarded.split(b",")[0].strip().decode("latin-1")
+
+    client = scope.get("client")
+    return "ip:" + (client[0] if client else "unknown")
+
+
+class AdmissionMiddleware:
+    """
+    classify(scope) -> 요청 종류("read" / "write" ...) 또는 None(제한 없음)
+    identify(scope) -> 인증이 검증된 사용자 id 또는 None (async, 속도 제한 키로만 쓴다)
+    종류별로 ConcurrencyLimiter(503) 자리를 얻고, RateLimiter(429) 를 본 뒤 처리한다.
+    """
+
+    def __init__(
+        self,
+        app,
+        classify,
+        limiters: dict,
+        rate_limiters: dict | None = None,
+        retry_after: float = 1.0,
+        trust_forwarded: bool = False,
+        identify=None,
+    ):
+        self.app = app
+        self.classify = classify
+        self.limiters = limiters
+        self.rate_limiters = rate_limiters or {}
+        self.retry_after = retry_after
+        self.trust_forwarded = trust_forwarded
+        self.identify = identify
+
+    async def __call__(self, scope, receive, send):
+        name = self.classify(scope) if scope["type"] == "http" else None
+        limiter = self.limiters.get(name)
+        if limiter is None:
+            await self.app(scope, receive, send)
+            return
+
+        try:
+            started = time.perf_counter()
+            waited = await limiter.acquire(self.retry_after)
+            if waited:
+                add_span("queue", started, waited, name)
+        except Rejected as e:
+            admission_rejections.inc((name, e.reason))
+            await self._reject(send, e)
+            return
+
+        # 사용자 확인(토큰 검증)도 자리를 얻은 뒤에 해서 동시 처리 수 안에 묶는다
+        rate_limiter = self.rate_limiters.get(name)
+        if rate_limiter is not None:
+            try:
+                identity = await self.identify(scope) if self.identify else None
+                wait = rate_limiter.take(client_key(scope, self.trust_forwarded, identity))
+            except BaseException:
+                limiter.release()
+                raise
+            if wait > 0:
+                limiter.release()
+                admission_rejections.inc((name, "rate_limited"))
+                await self._reject(send, Rejected(429, "rate_limited", wait))
+                return
+
+        try:
+            await self.app(scope, receive, send)
+        finally:
+            limiter.release()
+
+    async def _reject(self, send, rejected: Rejected) -> None:
+        detail = (
+            "요청이 너무 많습니다. 잠시 후 다시 시도하세요"
+            if rejected.status == 429
+            else "서버가 바쁩니다. 잠시 후 다시 시도하세요"
+        )
+        body = dumps({"detail": detail, "reason": rejected.reason})
+        await send(
+            {
+                "type": "http.response.start",
+                "status": rejected.status,
+                "headers": [
+                    (b"content-type", b"application/json"),
+                    (b"content-length", str(len(body)).encode()),
+                    (b"retry-after", str(max(1, math.ceil(rejected.retry_after))).encode()),
+                ],
+            }
+        )
+        await send({"type": "http.response.body", "body": body})
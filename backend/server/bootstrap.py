@@ -0,0 +1,89 @@
+from .feed import is_visible, to_text
+from .results import serialize_results
+from .vote_hub import summarize_vote_stats
+
+VOTE_TYPES = ("vote", "survey")
+
+
+def serialize_version_meta(data: dict | None) -> dict:
+    """meta/version 문서 -> 모바일 fetch_remote_version + fetch_version_meta 를 합친 모양"""
+    data = data or {}
+
+    try:
+        version = int(data.get("version", 0) or 0)
+    except (TypeError, ValueError):
+        version = 0
+
+    return {
+        "version": version,
+        "latestVersion": str(data.get("latestVersion", "0.0.0")),
+        "minimumVersion": str(data.get("minimumVersion", "0.0.0")),
+        "updateRequired": bool(data.get("updateRequired", False)),
+        "message": str(data.get("message", "")),
+        "downloadUrl": str(data.get("downloadUrl", "")),
+    }
+
+
+def serialize_ballot(data: dict | None) -> dict | None:
+    """votes/{issueId}/ballots/{uid} 문서 -> 모바일 fetch_my_ballot 과 같은 모양"""
+    if data is None:
+        return None
+
+    return {
+        "uid": to_text(data.get("uid")),
+        "issueId": to_text(data.get("issueId")),
+        "type": to_text(data.get("type")),
+        "selectedOptions": [str(x) for x in data.get("selectedOptions") or []],
+        # 예전 앱이 쓰는 찬반 응답 (yes / no / hold)
+        "choice": to_text(data.get("choice")),
+        "submittedAt": to_text(data.get("submittedAt")),
+        "updatedAt": to_text(data.get("updatedAt")),
+    }
+
+
+def results_visible(issue: dict) -> bool:
+    """모바일 should_show_results 와 같은 결과 공개 정책"""
+    visibility = (issue.get("resultVisibility") or "public").strip().lower()
+    if visibility == "admin_only":
+        return False
+    if visibility == "after_close":
+        return issue.get("status") == "closed"
+    return True
+
+
+def stats_readable(issue: dict | None) -> bool:
+    """집계를 보여줘도 되는 안건인지 (피드에 보이는 투표/설문이고 결과 공개 정책을 통과)"""
+    return (
+        issue is not None
+        and is_visible(issue)
+        and issue.get("type") in VOTE_TYPES
+        and results_visible(issue)
+    )
+
+
+def vote_issue_ids(issues: list) -> list:
+    return [x["id"] for x in issues if x.get("type") in VOTE_TYPES]
+
+
+def stats_issue_ids(issues: list) -> list:
+    return [x["id"] for x in issues if stats_readable(x)]
+
+
+def build_bootstrap(
+    issues: list, version: dict | None, ballots: dict, stats: dict, results: dict | None = None
+) -> dict:
+    """
+    ballots: {issueId: ballot 문서 dict 또는 None}
+    stats: {issueId: vote_stats 문서 dict 또는 None}
+    results: {issueId: vote_results 문서 dict} (마감 후 확정된 결과. stats 보다 우선)
+    """
+    summaries = {issue_id: summarize_vote_stats(data) for issue_id, data in stats.items()}
+    summaries.update(
+        (issue_id, serialize_results(data)) for issue_id, data in (results or {}).items()
+    )
+    return {
+        "issues": issues,
+        "version": serialize_version_meta(version),
+        "ballots": {issue_id: serialize_ballot(data) for issue_id, data in ballots.items()},
+        "stats": summaries,
+    }
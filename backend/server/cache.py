@@ -0,0 +1,545 @@
+import fcntl
+import hashlib
+import json
+import mmap
+import os
+import socket
+import struct
+import tempfile
+import threading
+import time
+import uuid
+from collections import OrderedDict
+from urllib.parse import urlparse
+
+
+def compute_etag(payload) -> str:
+    """응답 본문 내용으로 강한(strong) ETag 를 만든다."""
+    body = json.dumps(
+        payload,
+        ensure_ascii=False,
+        sort_keys=True,
+        separators=(",", ":"),
+        default=str,
+    )
+    digest = hashlib.sha256(body.encode("utf-8")).hexdigest()
+    return f'"{digest[:32]}"'
+
+
+# 압축 미들웨어가 ETag 에 붙이는 인코딩 접미사 ("abc" -> "abc-gzip")
+ETAG_ENCODING_SUFFIXES = ("-gzip", "-br")
+
+
+def encoded_etag(etag: str, encoding: str) -> str:
+    """압축된 표현은 원본과 바이트가 다르므로 인코딩별로 다른 ETag 를 준다"""
+    if not etag.endswith('"'):
+        return etag
+    return f'{etag[:-1]}-{encoding}"'
+
+
+def _strip_encoding(tag: str) -> str:
+    for suffix in ETAG_ENCODING_SUFFIXES:
+        if tag.endswith(suffix + '"'):
+            return tag[: -len(suffix) - 1] + '"'
+    return tag
+
+
+def etag_matches(if_none_match: str | None, etag: str) -> bool:
+    if not if_none_match or not etag:
+        return False
+
+    if if_none_match.strip() == "*":
+        return True
+
+    # If-None-Match 는 약한 비교(weak comparison)를 쓰고,
+    # 압축된 표현으로 받아 간 ETag(인코딩 접미사)도 같은 내용으로 본다
+    target = etag[2:] if etag.startswith("W/") else etag
+    for candidate in if_none_match.split(","):
+        candidate = candidate.strip()
+        if candidate.startswith("W/"):
+            candidate = candidate[2:]
+        if _strip_encoding(candidate) == target:
+            return True
+
+    return False
+
+
+def encode_entry(meta: dict, body: bytes) -> bytes:
+    """캐시 값 = [4바이트 meta 길이][meta JSON][본문]"""
+    header = json.dumps(meta, separators=(",", ":")).encode("utf-8")
+    return struct.pack("!I", len(header)) + header + body
+
+
+def decode_entry(value) -> tuple:
+    """반환값: (meta, body) - body 는 value 를 복사하지 않는 memoryview"""
+    view = memoryview(value)
+    (size,) = struct.unpack_from("!I", view, 0)
+    meta = json.loads(bytes(view[4 : 4 + size]))
+    return meta, view[4 + size :]
+
+
+# =============================
+# 캐시 백엔드
+#
+# 공통 인터페이스
+#   get(key) -> bytes | memoryview | None
+#   set(key, value: bytes, generation=None)
+#                           generation 을 주면 그 사이 invalidate 가 있었을 때 저장하지 않는다
+#   generation() -> int     invalidate 될 때마다 올라가는 세대 번호
+#   invalidate()            모든 키 무효화 (공유 백엔드는 모든 워커에 전파)
+#   claim(key) -> bool      여러 워커 중 한 곳만 채우도록 선점 (True 면 내가 채운다)
+#   release(key)            claim 해제 (채운 뒤 호출)
+#   try_lead(name) -> bool  워커 중 하나만 맡을 일(스냅샷 리스너 등)의 리더 선출/유지
+#                           리더인 동안에도 주기적으로 다시 부른다 (LeaderWatchdog)
+#   resign(name)            리더 자리를 내려놓는다 (종료할 때, 다른 워커가 바로 가져가도록)
+#   blocking                네트워크 I/O 가 있으면 True (이벤트 루프 밖에서 호출)
+# =============================
+
+
+class TTLCache:
+    """프로세스 안에서만 쓰는 LRU + TTL 캐시 (워커 1개일 때 기본값)"""
+
+    blocking = False
+
+    def __init__(self, ttl: float = 5.0, max_entries: int = 1024):
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self._items = OrderedDict()
+        self._lock = threading.Lock()
+        self._generation = 0
+
+    def generation(self) -> int:
+        return self._generation
+
+    def get(self, key):
+        with self._lock:
+            item = self._items.get(key)
+            if item is None:
+                return None
+
+            expires_at, value = item
+            if expires_at < time.monotonic():
+                del self._items[key]
+                return None
+
+            self._items.move_to_end(key)
+            return value
+
+    def set(self, key, value, generation=None):
+        if self.ttl <= 0:
+            return
+
+        with self._lock:
+            if generation is not None and generation != self._generation:
+                return
+            self._items[key] = (time.monotonic() + self.ttl, value)
+            self._items.move_to_end(key)
+            while len(self._items) > self.max_entries:
+                self._items.popitem(last=False)
+
+    def invalidate(self, key=None):
+        with self._lock:
+            if key is None:
+                self._items.clear()
+                self._generation += 1
+            else:
+                self._items.pop(key, None)
+
+    def claim(self, key) -> bool:
+        return True
+
+    def release(self, key) -> None:
+        pass
+
+    def try_lead(self, name: str) -> bool:
+        return True
+
+    def resign(self, name: str) -> None:
+        pass
+
+
+class SharedMemoryCache:
+    """
+    같은 호스트의 워커들이 공유하는 mmap 스냅샷 캐시.
+
+    - 값은 키마다 파일 하나에 쓰고 os.replace 로 원자적으로 교체한다 (쓰는 쪽은 한 워커)
+    - 읽는 쪽은 파일을 mmap 해서 memoryview 로 돌려준다 (복사 없음)
+    - 세대(generation) 번호를 공유 헤더에 두고, invalidate 는 세대만 올린다
+    """
+
+    blocking = False
+    CLAIM_TIMEOUT_SEC = 5.0
+
+    def __init__(self, directory: str | None = None, ttl: float = 5.0):
+        self.ttl = ttl
+        self.directory = directory or os.path.join(
+            "/dev/shm" if os.path.isdir("/dev/shm") else tempfile.gettempdir(),
+            "dojun_cache",
+        )
+        os.makedirs(self.directory, exist_ok=True)
+
+        gen_path = os.path.join(self.directory, "generation")
+        self._gen_fd = os.open(gen_path, os.O_RDWR | os.O_CREAT, 0o600)
+        fcntl.flock(self._gen_fd, fcntl.LOCK_EX)
+        try:
+            if os.fstat(self._gen_fd).st_size < 8:
+                os.ftruncate(self._gen_fd, 8)
+        finally:
+            fcntl.flock(self._gen_fd, fcntl.LOCK_UN)
+        self._gen_map = mmap.mmap(self._gen_fd, 8)
+
+        self._maps = {}
+        self._maps_lock = threading.Lock()
+        self._lead_fds = {}
+
+    def generation(self) -> int:
+        return struct.unpack_from("!Q", self._gen_map, 0)[0]
+
+    def _path(self, key, generation: int) -> str:
+        digest = hashlib.sha1(str(key).encode("utf-8")).hexdigest()
+        return os.path.join(self.directory, f"{digest}.{generation}")
+
+    def get(self, key):
+        path = self._path(key, self.generation())
+        try:
+            stat = os.stat(path)
+        except FileNotFoundError:
+            return None
+
+        with self._maps_lock:
+            cached = self._maps.get(path)
+            if cached is None or cached[0] != stat.st_ino:
+                with open(path, "rb") as f:
+                    mapped = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+                cached = (stat.st_ino, mapped)
+                self._maps[path] = cached
+
+        view = memoryview(cached[1])
+        (expires_at,) = struct.unpack_from("!d", view, 0)
+        if expires_at < time.time():
+            return None
+        return view[8:]
+
+    def set(self, key, value, generation=None):
+        if self.ttl <= 0:
+            return
+
+        current = self.generation()
+        if generation is not None and generation != current:
+            return
+
+        generation = current
+        path = self._path(key, generation)
+        tmp_path = f"{path}.{os.getpid()}.tmp"
+
+        with open(tmp_path, "wb") as f:
+            f.write(struct.pack("!d", time.time() + self.ttl))
+            f.write(value)
+        os.replace(tmp_path, path)
+
+        self._sweep(generation)
+
+    def invalidate(self, key=None):
+        fcntl.flock(self._gen_fd, fcntl.LOCK_EX)
+        try:
+            struct.pack_into("!Q", self._gen_map, 0, self.generation() + 1)
+        finally:
+            fcntl.flock(self._gen_fd, fcntl.LOCK_UN)
+
+    def claim(self, key) -> bool:
+        path = self._path(key, self.generation()) + ".lock"
+        try:
+            fd = os.open(path, os.O_CREAT | os.O_EXCL | os.O_WRONLY, 0o600)
+        except FileExistsError:
+            try:
+                # 채우던 워커가 죽었으면 오래된 잠금을 치운다
+                if time.time() - os.stat(path).st_mtime > self.CLAIM_TIMEOUT_SEC:
+                    os.unlink(path)
+                    return self.claim(key)
+            except FileNotFoundError:
+                return self.claim(key)
+            return False
+        os.close(fd)
+        return True
+
+    def release(self, key) -> None:
+        try:
+            os.unlink(self._path(key, self.generation()) + ".lock")
+        except FileNotFoundError:
+            pass
+
+    def try_lead(self, name: str) -> bool:
+        path = os.path.join(self.directory, f"{name}.leader")
+        fd = self._lead_fds.get(name)
+        if fd is not None:
+            # 잠금 파일이 지워지거나 바뀌었으면 다른 워커가 새 파일로 리더가 될 수 있으므로 다시 잡는다
+            try:
+                if os.stat(path).st_ino == os.fstat(fd).st_ino:
+                    return True
+            except FileNotFoundError:
+                pass
+            self.resign(name)
+
+        fd = os.open(path, os.O_CREAT | os.O_RDWR, 0o600)
+        try:
+            # 프로세스가 살아 있는 동안 잠금을 유지한다 (죽으면 OS 가 풀어줌)
+            fcntl.flock(fd, fcntl.LOCK_EX | fcntl.LOCK_NB)
+        except BlockingIOError:
+            os.close(fd)
+            return False
+
+        self._lead_fds[name] = fd
+        return True
+
+    def resign(self, name: str) -> None:
+        fd = self._lead_fds.pop(name, None)
+        if fd is not None:
+            fcntl.flock(fd, fcntl.LOCK_UN)
+            os.close(fd)
+
+    def _sweep(self, generation: int) -> None:
+        """지난 세대 파일과 그 mmap 을 정리한다."""
+        suffixes = (f".{generation}", f".{generation}.lock")
+        for name in os.listdir(self.directory):
+            if "." not in name or name.endswith(".leader") or name == "generation":
+                continue
+            if name.endswith(".tmp") or name.endswith(suffixes):
+                continue
+            try:
+                os.unlink(os.path.join(self.directory, name))
+            except FileNotFoundError:
+                pass
+
+        with self._maps_lock:
+            for path in [p for p in self._maps if not p.endswith(f".{generation}")]:
+                # 아직 응답 중인 memoryview 가 있을 수 있으므로 close 하지 않고 참조만 놓는다
+                del self._maps[path]
+
+
+class RespError(Exception):
+    pass
+
+
+class RespConnection:
+    """Redis 프로토콜(RESP2) 최소 구현 클라이언트 연결"""
+
+    def __init__(self, host: str, port: int, db: int = 0, password: str | None = None, timeout: float = 2.0):
+        self.host = host
+        self.port = port
+        self.db = db
+        self.password = password
+        self.timeout = timeout
+        self._sock = None
+        self._file = None
+
+    def connect(self):
+        self._sock = socket.create_connection((self.host, self.port), timeout=self.timeout)
+        self._file = self._sock.makefile("rb")
+        if self.password:
+            self.send("AUTH", self.password)
+            self.read_reply()
+        if self.db:
+            self.send("SELECT", self.db)
+            self.read_reply()
+
+    def close(self):
+        for closable in (self._file, self._sock):
+            if closable is not None:
+                try:
+                    closable.close()
+                except OSError:
+                    pass
+        self._sock = None
+        self._file = None
+
+    def send(self, *args):
+        if self._sock is None:
+            self.connect()
+
+        parts = [f"*{len(args)}\r\n".encode()]
+        for arg in args:
+            if isinstance(arg, (bytes, bytearray, memoryview)):
+                data = bytes(arg)
+            else:
+                data = str(arg).encode("utf-8")
+            parts.append(f"${len(data)}\r\n".encode() + data + b"\r\n")
+        self._sock.sendall(b"".join(parts))
+
+    def read_reply(self):
+        line = self._file.readline()
+        if not line:
+            raise ConnectionError("RESP 연결이 끊어졌습니다")
+
+        kind, rest = line[:1], line[1:-2]
+        if kind == b"+":
+            return rest.decode()
+        if kind == b"-":
+            raise RespError(rest.decode())
+        if kind == b":":
+            return int(rest)
+        if kind == b"$":
+            size = int(rest)
+            if size < 0:
+                return None
+            data = self._file.read(size + 2)
+            return data[:-2]
+        if kind == b"*":
+            size = int(rest)
+            if size < 0:
+                return None
+            return [self.read_reply() for _ in range(size)]
+        raise RespError(f"알 수 없는 응답: {line!r}")
+
+
+class RedisCache:
+    """
+    Redis 프로토콜 서버를 여러 호스트/워커가 공유하는 캐시.
+    세대 번호를 INCR 로 올리고 PUBLISH 로 알려서, 각 워커는 구독 스레드로 세대를 따라간다.
+    """
+
+    blocking = True
+    CLAIM_TIMEOUT_MS = 5000
+    # 리더 키가 아직 내 것일 때만 만료를 늘리거나 지운다 (GET 과 EXPIRE/DEL 사이에 주인이 바뀌지 않게)
+    LEADER_RENEW_SCRIPT = (
+        "if redis.call('GET', KEYS[1]) == ARGV[1] then "
+        "return redis.call('PEXPIRE', KEYS[1], ARGV[2]) end return 0"
+    )
+    LEADER_RESIGN_SCRIPT = (
+        "if redis.call('GET', KEYS[1]) == ARGV[1] then "
+        "return redis.call('DEL', KEYS[1]) end return 0"
+    )
+
+    def __init__(
+        self,
+        url: str = "redis://127.0.0.1:6379/0",
+        ttl: float = 5.0,
+        prefix: str = "dojun:issues",
+        leader_ttl: float = 40.0,
+    ):
+        parsed = urlparse(url)
+        self.ttl = ttl
+        self.leader_ttl = leader_ttl
+        self.prefix = prefix
+        self._conn_args = dict(
+            host=parsed.hostname or "127.0.0.1",
+            port=parsed.port or 6379,
+            db=int((parsed.path or "/0").lstrip("/") or 0),
+            password=parsed.password,
+        )
+        self._conn = RespConnection(**self._conn_args)
+        self._lock = threading.Lock()
+        self._token = uuid.uuid4().hex
+        self._generation = None
+        self._closed = threading.Event()
+
+        self._subscriber = threading.Thread(target=self._listen, daemon=True)
+        self._subscriber.start()
+
+    @property
+    def _gen_key(self) -> str:
+        return f"{self.prefix}:gen"
+
+    @property
+    def _channel(self) -> str:
+        return f"{self.prefix}:invalidate"
+
+    def execute(self, *args):
+        with self._lock:
+            for attempt in (1, 2):
+                try:
+                    self._conn.send(*args)
+                    return self._conn.read_reply()
+                except (OSError, ConnectionError):
+                    self._conn.close()
+                    if attempt == 2:
+                        raise
+
+    def generation(self) -> int:
+        if self._generation is None:
+            self._generation = int(self.execute("GET", self._gen_key) or 0)
+        return self._generation
+
+    def _listen(self):
+        while not self._closed.is_set():
+            conn = RespConnection(**self._conn_args)
+            try:
+                conn.connect()
+                conn._sock.settimeout(None)
+                conn.send("SUBSCRIBE", self._channel)
+                conn.read_reply()
+                # 구독 중 놓친 invalidate 가 있을 수 있으므로 다시 읽는다
+                self._generation = None
+                while not self._closed.is_set():
+                    message = conn.read_reply()
+                    if isinstance(message, list) and message[0] == b"message":
+                        self._generation = int(message[2])
+            except (OSError, ConnectionError, RespError, ValueError):
+                self._generation = None
+                self._closed.wait(1)
+            finally:
+                conn.close()
+
+    def _key(self, key) -> str:
+        digest = hashlib.sha1(str(key).encode("utf-8")).hexdigest()
+        return f"{self.prefix}:{self.generation()}:{digest}"
+
+    def get(self, key):
+        return self.execute("GET", self._key(key))
+
+    def set(self, key, value, generation=None):
+        if self.ttl <= 0:
+            return
+        if generation is not None and generation != self.generation():
+            return
+        self.execute("SET", self._key(key), value, "PX", int(self.ttl * 1000))
+
+    def invalidate(self, key=None):
+        generation = self.execute("INCR", self._gen_key)
+        self._generation = generation
+        self.execute("PUBLISH", self._channel, generation)
+
+    def claim(self, key) -> bool:
+        reply = self.execute(
+            "SET", self._key(key) + ":lock", self._token, "NX", "PX", self.CLAIM_TIMEOUT_MS
+        )
+        return reply == "OK"
+
+    def release(self, key) -> None:
+        self.execute("DEL", self._key(key) + ":lock")
+
+    def try_lead(self, name: str) -> bool:
+        """
+        리더 키를 잡거나, 이미 내 것이면 만료를 늘린다 (leader_ttl 안에 다시 불러야 유지).
+        리더가 죽거나 연장하지 못하면 키가 만료되고 다음에 부른 워커가 리더가 된다.
+        """
+        key = f"{self.prefix}:leader:{name}"
+        ttl_ms = int(self.leader_ttl * 1000)
+        if self.execute("SET", key, self._token, "NX", "PX", ttl_ms) == "OK":
+            return True
+        return self.execute("EVAL", self.LEADER_RENEW_SCRIPT, 1, key, self._token, ttl_ms) == 1
+
+    def resign(self, name: str) -> None:
+        self.execute("EVAL", self.LEADER_RESIGN_SCRIPT, 1, f"{self.prefix}:leader:{name}", self._token)
+
+    def close(self):
+        self._closed.set()
+        with self._lock:
+            self._conn.close()
+
+
+def make_cache_backend(kind: str, ttl: float, **options):
+    """CACHE_BACKEND 환경변수 값(local / shm / redis)으로 백엔드를 만든다."""
+    kind = (kind or "local").strip().lower()
+
+    if kind == "local":
+        return TTLCache(ttl=ttl, max_entries=int(options.get("max_entries") or 1024))
+    if kind == "shm":
+        return SharedMemoryCache(directory=options.get("directory") or None, ttl=ttl)
+    if kind == "redis":
+        return RedisCache(
+            url=options.get("url") or "redis://127.0.0.1:6379/0",
+            ttl=ttl,
+            leader_ttl=float(options.get("leader_ttl") or 40.0),
+        )
+
+    raise ValueError(f"알 수 없는 CACHE_BACKEND: {kind}")
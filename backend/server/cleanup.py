@@ -0,0 +1,213 @@
+import asyncio
+import logging
+import time
+import uuid
+from datetime import datetime, timezone
+
+from .metrics import registry
+from .repository import ballots_collection
+from .results import RESULTS_COLLECTION
+
+logger = logging.getLogger(__name__)
+
+# 진행 중인 삭제 작업 (문서 id = 안건 id). 재시작하면 여기 남은 작업을 이어서 한다
+JOBS_COLLECTION = "deletion_jobs"
+
+cascade_deleted = registry.counter(
+    "cascade_deleted_documents_total", "안건 삭제 뒤 함께 지운 문서 수", ("collection",)
+)
+cascade_jobs = registry.gauge("cascade_delete_jobs", "진행 중인 연쇄 삭제 작업 수")
+
+
+def _now() -> str:
+    return datetime.now(timezone.utc).isoformat()
+
+
+class CascadeDeleter:
+    """
+    삭제된 안건의 votes/{id}/ballots/*, vote_stats/{id}, vote_results/{id} 를 뒤에서 지운다.
+
+    - ballots 를 id 순으로 batch_size * parallelism 개씩 읽고, batch_size 개 묶음을 동시에 지운다
+    - 라운드마다 진행 상황(cursor, 지운 수)을 deletion_jobs/{id} 에 남긴다.
+      프로세스가 죽어도 resume() 이 마지막 cursor 부터 이어서 지운다
+    - 작업 문서에 맡은 워커(owner)와 lease 만료 시각을 같이 남긴다. resume() 은 다른 워커가
+      lease 안에서 진행 중인 작업은 건드리지 않는다 (같은 작업을 두 곳에서 지우지 않도록)
+    - resume() 은 리더 한 곳에서만 부른다 (start() 가 주기적으로)
+    - 실패하면 지수 백오프로 다시 시도한다
+    """
+
+    def __init__(
+        self,
+        repository,
+        batch_size: int = 500,
+        parallelism: int = 4,
+        retry_base: float = 1.0,
+        retry_max: float = 60.0,
+        lease: float = 300.0,
+        interval: float = 300.0,
+    ):
+        self.repository = repository
+        self.batch_size = batch_size
+        self.parallelism = parallelism
+        self.retry_base = retry_base
+        self.retry_max = retry_max
+        self.lease = lease
+        self.interval = interval
+        self.owner = uuid.uuid4().hex
+        # issue_id -> 진행 상황 (끝난 작업도 /admin/cleanup 에서 보이도록 남겨 둔다)
+        self.jobs = {}
+        self._tasks = {}
+        self._resumer = None
+
+    async def enqueue(self, issue_id: str) -> dict:
+        """작업을 저장소에 먼저 기록하고 시작한다 (기록이 끝나면 중단돼도 잃지 않는다)"""
+        if issue_id in self._tasks:
+            return self.jobs[issue_id]
+
+        job = {"issueId": issue_id, "cursor": None, "ballots": 0, "createdAt": _now()}
+        await self._save(issue_id, job)
+        self._start(issue_id, job)
+        return self.jobs[issue_id]
+
+    async def resume(self) -> None:
+        """저장소에 남은 작업을 모두 다시 시작한다 (시작 준비 단계에서 부른다)"""
+        after = None
+        while True:
+            rows = await self.repository.page_documents(JOBS_COLLECTION, after, 100)
+            for issue_id, job in rows:
+                if issue_id not in self._tasks and not self._leased_elsewhere(job):
+                    logger.info(
+                        "연쇄 삭제 이어서 시작",
+                        extra={"issue_id": issue_id, "cursor": job.get("cursor")},
+                    )
+                    self._start(issue_id, job)
+            if len(rows) < 100:
+                return
+            after = rows[-1][0]
+
+    def start(self) -> None:
+        """interval 초마다 resume() 한다 (리더가 된 워커에서)"""
+        if self._resumer is None:
+            self._resumer = asyncio.create_task(self._resume_forever())
+
+    def stop(self) -> None:
+        """주기 resume 만 멈춘다 (진행 중인 작업은 lease 를 쥐고 끝까지 간다)"""
+        if self._resumer is not None:
+            self._resumer.cancel()
+            self._resumer = None
+
+    def cancel(self) -> None:
+        # 진행 상황은 저장소에 있으므로 다음 시작 때 이어진다
+        self.stop()
+        for task in list(self._tasks.values()):
+            task.cancel()
+
+    def _leased_elsewhere(self, job: dict) -> bool:
+        lease_until = job.get("leaseUntil") or 0
+        return job.get("owner") not in (None, self.owner) and lease_until > time.time()
+
+    async def _save(self, issue_id: str, job: dict) -> None:
+        await self.repository.set_document(
+            JOBS_COLLECTION,
+            issue_id,
+            {
+                **{key: job[key] for key in ("issueId", "cursor", "ballots", "createdAt")},
+                "owner": self.owner,
+                "leaseUntil": time.time() + self.lease,
+            },
+        )
+
+    async def _resume_forever(self) -> None:
+        while True:
+            try:
+                await self.resume()
+            except Exception as e:
+                logger.warning("연쇄 삭제 작업 확인 실패", extra={"error": repr(e)})
+            await asyncio.sleep(self.interval)
+
+    def stats(self) -> dict:
+        return {"running": len(self._tasks), "jobs": list(self.jobs.values())}
+
+    def _start(self, issue_id: str, job: dict) -> None:
+        self.jobs[issue_id] = {
+            "issueId": issue_id,
+            "cursor": job.get("cursor"),
+            "ballots": int(job.get("ballots") or 0),
+            "createdAt": job.get("createdAt"),
+            "status": "running",
+            "error": "",
+        }
+        task = asyncio.create_task(self._run(issue_id))
+        self._tasks[issue_id] = task
+        cascade_jobs.set((), len(self._tasks))
+
+        def finished(_task):
+            self._tasks.pop(issue_id, None)
+            cascade_jobs.set((), len(self._tasks))
+
+        task.add_done_callback(finished)
+
+    async def _run(self, issue_id: str) -> None:
+        job = self.jobs[issue_id]
+        delay = self.retry_base
+
+        while True:
+            try:
+                await self._delete_all(issue_id, job)
+                break
+            except asyncio.CancelledError:
+                job["status"] = "paused"
+                raise
+            except Exception as e:
+                job["status"] = "retrying"
+                job["error"] = repr(e)
+                logger.warning(
+                    "연쇄 삭제 실패, %.0f초 뒤 다시 시도",
+                    delay,
+                    extra={"issue_id": issue_id, "cursor": job["cursor"], "error": repr(e)},
+                )
+                await asyncio.sleep(delay)
+                delay = min(self.retry_max, delay * 2)
+
+        job.update(status="done", error="", finishedAt=_now())
+        logger.info(
+            "연쇄 삭제 완료", extra={"issue_id": issue_id, "ballots": job["ballots"]}
+        )
+
+    async def _delete_all(self, issue_id: str, job: dict) -> None:
+        collection = ballots_collection(issue_id)
+        job["status"] = "running"
+        # 이 워커가 맡았다고 먼저 남긴다 (재시도할 때마다 lease 도 늘어난다)
+        await self._save(issue_id, job)
+
+        while True:
+            rows = await self.repository.page_documents(
+                collection,
+                job["cursor"],
+                self.batch_size * self.parallelism,
+                keys_only=True,
+            )
+            if not rows:
+                break
+
+            doc_ids = [doc_id for doc_id, _ in rows]
+            await asyncio.gather(
+                *(
+                    self.repository.delete_documents(
+                        collection, doc_ids[start : start + self.batch_size]
+                    )
+                    for start in range(0, len(doc_ids), self.batch_size)
+                )
+            )
+            cascade_deleted.inc(("ballots",), len(doc_ids))
+
+            job["ballots"] += len(doc_ids)
+            job["cursor"] = doc_ids[-1]
+            await self._save(issue_id, job)
+
+        # 부모 문서 votes/{id} 는 없을 수도 있다 (지울 때 없는 문서는 그냥 넘어간다)
+        await self.repository.delete_documents("vote_stats", [issue_id])
+        await self.repository.delete_documents(RESULTS_COLLECTION, [issue_id])
+        await self.repository.delete_documents("votes", [issue_id])
+        cascade_deleted.inc(("vote_stats",))
+        await self.repository.delete_documents(JOBS_COLLECTION, [issue_id])
@@ -0,0 +1,190 @@
+import zlib
+
+try:
+    import brotli
+except ImportError:  # brotli 가 없으면 gzip 만 협상한다
+    brotli = None
+
+from .cache import encoded_etag
+
+# 이미 압축됐거나 흘려보내야 하는 응답은 건드리지 않는다
+SKIP_CONTENT_TYPES = ("text/event-stream", "image/", "video/", "application/zip")
+
+
+def choose_encoding(accept_encoding: str) -> str | None:
+    """Accept-Encoding 에서 q>0 인 br / gzip 중 하나를 고른다 (br 우선)"""
+    accepted = set()
+    for part in (accept_encoding or "").lower().split(","):
+        name, _, params = part.strip().partition(";")
+        q = 1.0
+        for param in params.split(";"):
+            key, _, value = param.strip().partition("=")
+            if key == "q":
+                try:
+                    q = float(value)
+                except ValueError:
+                    q = 0.0
+        if q > 0:
+            accepted.add(name.strip())
+
+    if brotli is not None and "br" in accepted:
+        return "br"
+    if "gzip" in accepted or "*" in accepted:
+        return "gzip"
+    return None
+
+
+class _Compressor:
+    def __init__(self, encoding: str, gzip_level: int, brotli_quality: int):
+        self.encoding = encoding
+        if encoding == "br":
+            self._impl = brotli.Compressor(quality=brotli_quality)
+        else:
+            # wbits 16+ -> gzip 헤더/트레일러
+            self._impl = zlib.compressobj(gzip_level, zlib.DEFLATED, 16 + zlib.MAX_WBITS)
+
+    def compress(self, data: bytes) -> bytes:
+        if self.encoding == "br":
+            return self._impl.process(data) + self._impl.flush()
+        return self._impl.compress(data) + self._impl.flush(zlib.Z_SYNC_FLUSH)
+
+    def finish(self, data: bytes = b"") -> bytes:
+        if self.encoding == "br":
+            return self._impl.process(data) + self._impl.finish()
+        return self._impl.compress(data) + self._impl.flush()
+
+
+class CompressionMiddleware:
+    """
+    Accept-Encoding 에 따라 br / gzip 으로 응답을 압축하는 ASGI 미들웨어.
+
+    - 한 번에 끝나는 응답은 minimum_size 바이트 이상일 때만 압축한다
+    - 나누어 오는 응답(StreamingResponse)은 청크마다 flush 하며 압축한다 (SSE 는 제외)
+    """
+
+    def __init__(
+        self,
+        app,
+        minimum_size: int = 1024,
+        gzip_level: int = 6,
+        brotli_quality: int = 4,
+    ):
+        self.app = app
+        self.minimum_size = minimum_size
+        self.gzip_level = gzip_level
+        self.brotli_quality = brotli_quality
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        headers = dict(scope.get("headers") or [])
+        encoding = choose_encoding(headers.get(b"accept-encoding", b"").decode("latin-1"))
+        if encoding is None:
+            # 압축하지 않아도 다른 Accept-Encoding 이면 응답이 달라지므로 Vary 는 붙인다
+            await self.app(scope, receive, _vary_only(send))
+            return
+
+        start_message = None
+        compressor = None
+        passthrough = False
+
+        async def send_wrapper(message):
+            nonlocal start_message, compressor, passthrough
+
+            if message["type"] == "http.response.start":
+                start_message = message
+                response_headers = dict(message.get("headers") or [])
+                content_type = response_headers.get(b"content-type", b"").decode("latin-1")
+                passthrough = (
+                    b"content-encoding" in response_headers
+                    or message["status"] < 200
+                    or message["status"] in (204, 304)
+                    or content_type.startswith(SKIP_CONTENT_TYPES)
+                )
+                if passthrough:
+                    await send(_with_vary(message))
+                return
+
+            if message["type"] != "http.response.body" or passthrough:
+                await send(message)
+                return
+
+            body = message.get("body", b"")
+            more_body = message.get("more_body", False)
+
+            if compressor is None:
+                if not more_body and len(body) < self.minimum_size:
+                    passthrough = True
+                    await send(_with_vary(start_message))
+                    await send(message)
+                    return
+
+                compressor = _Compressor(encoding, self.gzip_level, self.brotli_quality)
+
+                if not more_body:
+                    data = compressor.finish(body)
+                    await send(_compressed_start(start_message, encoding, len(data)))
+                    await send({"type": "http.response.body", "body": data})
+                    return
+
+                await send(_compressed_start(start_message, encoding, None))
+
+            if more_body:
+                data = compressor.compress(body)
+            else:
+                data = compressor.finish(body)
+
+            await send({"type": "http.response.body", "body": data, "more_body": more_body})
+
+        await self.app(scope, receive, send_wrapper)
+
+
+def _merge_vary(headers: list) -> list:
+    result = []
+    vary = None
+    for key, value in headers:
+        if key.lower() == b"vary":
+            vary = value
+        else:
+            result.append((key, value))
+
+    values = [x.strip() for x in (vary or b"").decode("latin-1").split(",") if x.strip()]
+    if "accept-encoding" not in (x.lower() for x in values):
+        values.append("Accept-Encoding")
+    result.append((b"vary", ", ".join(values).encode("latin-1")))
+    return result
+
+
+def _with_vary(message: dict) -> dict:
+    return {**message, "headers": _merge_vary(list(message.get("headers") or []))}
+
+
+def _vary_only(send):
+    async def send_wrapper(message):
+        if message["type"] == "http.response.start":
+            message = _with_vary(message)
+        await send(message)
+
+    return send_wrapper
+
+
+def _compressed_start(message: dict, encoding: str, length: int | None) -> dict:
+    """
+    length 가 None 이면(스트리밍) Content-Length 없이 chunked 로 나간다.
+    ETag 는 인코딩 접미사를 붙여 identity / gzip / br 표현이 서로 다른 값을 갖게 한다.
+    """
+    headers = []
+    for key, value in message.get("headers") or []:
+        name = key.lower()
+        if name == b"content-length":
+            continue
+        if name == b"etag":
+            value = encoded_etag(value.decode("latin-1"), encoding).encode("latin-1")
+        headers.append((key, value))
+    headers.append((b"content-encoding", encoding.encode("latin-1")))
+    if length is not None:
+        headers.append((b"content-length", str(length).encode("latin-1")))
+
+    return {**message, "headers": _merge_vary(headers)}
@@ -0,0 +1,125 @@
+import asyncio
+import json
+import threading
+import uuid
+from collections import deque
+
+
+def format_sse(event_id: str | None, event: str, data) -> str:
+    lines = []
+    if event_id is not None:
+        lines.append(f"id: {event_id}")
+    lines.append(f"event: {event}")
+    body = json.dumps(data, ensure_ascii=False, separators=(",", ":"), default=str)
+    lines.append(f"data: {body}")
+    return "\n".join(lines) + "\n\n"
+
+
+class IssueEventHub:
+    """
+    Firestore on_snapshot 리스너 하나의 변경 이벤트를 연결된 모든 SSE 클라이언트에 나눠준다.
+
+    - 이벤트는 id 를 붙여 최근 history 개만 보관하고, Last-Event-ID 로 이어받기를 지원한다
+    - id 는 "{epoch}-{번호}" 이다. 번호는 프로세스마다 0 부터 세므로, 재시작했거나 다른 워커에서
+      받은 id(epoch 가 다름)나 아직 없는 번호로는 이어받을 수 없다고 본다 (-> 전체 다시 읽기)
+    - 너무 느려서 큐가 가득 찬 클라이언트는 끊는다 (재접속하면 history 에서 이어받음)
+    """
+
+    def __init__(self, history: int = 1000, queue_size: int = 256, epoch: str | None = None):
+        self.queue_size = queue_size
+        self.epoch = epoch or uuid.uuid4().hex[:12]
+        self._history = deque(maxlen=history)
+        self._subscribers = set()
+        self._last_id = 0
+        self._loop = None
+        self._start_lock = threading.Lock()
+
+    @property
+    def last_id(self) -> int:
+        return self._last_id
+
+    @property
+    def last_event_id(self) -> str:
+        return self.event_id(self._last_id)
+
+    def event_id(self, number: int) -> str:
+        return f"{self.epoch}-{number}"
+
+    @property
+    def subscriber_count(self) -> int:
+        return len(self._subscribers)
+
+    def publish(self, event: str, data) -> None:
+        """이벤트 루프 스레드에서만 호출한다."""
+        self._last_id += 1
+        message = format_sse(self.event_id(self._last_id), event, data)
+        self._history.append((self._last_id, message))
+
+        for queue in list(self._subscribers):
+            try:
+                queue.put_nowait(message)
+            except asyncio.QueueFull:
+                self._subscribers.discard(queue)
+                # 꽉 찬 큐를 비우고 종료 신호만 남긴다
+                while not queue.empty():
+                    queue.get_nowait()
+                queue.put_nowait(None)
+
+    def publish_threadsafe(self, event: str, data) -> None:
+        if self._loop is not None:
+            self._loop.call_soon_threadsafe(self.publish, event, data)
+
+    def subscribe(self, last_event_id: str | None = None):
+        """
+        반환값: (queue, backlog)
+        backlog 가 None 이면 요청한 id 가 이미 history 밖이라 이어받을 수 없다는 뜻
+        """
+        queue = asyncio.Queue(maxsize=self.queue_size)
+        self._subscribers.add(queue)
+
+        if not last_event_id:
+            return queue, []
+
+        epoch, _, number = last_event_id.rpartition("-")
+        try:
+            since = int(number)
+        except ValueError:
+            return queue, None
+
+        # 다른 프로세스가 준 id 거나 아직 보내지 않은 번호면 그 사이 변경을 알 수 없다
+        if epoch != self.epoch or since < 0 or since > self._last_id:
+            return queue, None
+        if since == self._last_id:
+            return queue, []
+
+        oldest = self._history[0][0] if self._history else self._last_id + 1
+        if since + 1 < oldest:
+            return queue, None
+
+        return queue, [message for event_id, message in self._history if event_id > since]
+
+    def unsubscribe(self, queue) -> None:
+        self._subscribers.discard(queue)
+
+    def attach(self, mirror, serialize) -> None:
+        """
+        CollectionMirror 의 변경 콜백에 붙는다 (리스너는 미러와 공유).
+        이벤트 루프 안에서 한 번만 호출한다.
+        """
+        with self._start_lock:
+            if self._loop is not None:
+                return
+
+            self._loop = asyncio.get_running_loop()
+
+            def on_changes(changes):
+                for change in changes:
+                    doc = change.document
+                    kind = change.type.name.lower()
+                    if kind == "removed":
+                        data = {"id": doc.id}
+                    else:
+                        data = serialize(doc.id, doc.to_dict() or {})
+                    self.publish_threadsafe(kind, data)
+
+            mirror.add_listener(on_changes)
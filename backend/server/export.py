@@ -0,0 +1,100 @@
+import csv
+import io
+import logging
+import re
+from urllib.parse import quote
+
+from .serialization import dumps
+
+logger = logging.getLogger(__name__)
+
+# format 쿼리 값 -> (Content-Type, 파일 확장자)
+EXPORT_FORMATS = {
+    "ndjson": ("application/x-ndjson", "ndjson"),
+    "csv": ("text/csv; charset=utf-8", "csv"),
+}
+
+# 엑셀이 UTF-8 CSV 의 한글을 깨뜨리지 않도록 처음부터 받을 때만 BOM 을 붙인다
+CSV_BOM = "\ufeff".encode("utf-8")
+
+
+def content_disposition(filename: str) -> str:
+    """
+    다운로드 파일 이름. 헤더는 latin-1 만 되므로 filename 에는 ASCII 로 바꾼 이름을,
+    filename* 에는 RFC 5987 로 인코딩한 원래 이름(한글 안건 id 등)을 넣는다.
+    """
+    fallback = re.sub(r'[^A-Za-z0-9._-]', "_", filename)
+    return f"attachment; filename=\"{fallback}\"; filename*=UTF-8''{quote(filename, safe='')}"
+
+
+def csv_value(value) -> str:
+    """CSV 칸 하나: 목록은 | 로 잇고, 시각은 ISO 8601, 없으면 빈칸"""
+    if value is None:
+        return ""
+    if isinstance(value, bool):
+        return "true" if value else "false"
+    if isinstance(value, (list, tuple)):
+        return "|".join(csv_value(x) for x in value)
+    if isinstance(value, dict):
+        return dumps(value).decode("utf-8")
+    if hasattr(value, "isoformat"):
+        return value.isoformat()
+    return str(value)
+
+
+def ndjson_chunk(records: list) -> bytes:
+    return b"".join(dumps(record) + b"\n" for record in records)
+
+
+def csv_chunk(records: list, columns: tuple, header: bool = False) -> bytes:
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    if header:
+        writer.writerow(columns)
+    for record in records:
+        writer.writerow([csv_value(record.get(column)) for column in columns])
+    return buffer.getvalue().encode("utf-8")
+
+
+async def stream_export(
+    fetch_page,
+    to_records,
+    fmt: str,
+    columns: tuple = (),
+    after: str | None = None,
+    page_size: int = 500,
+    limit: int | None = None,
+):
+    """
+    fetch_page(after, n) -> [(doc_id, data)] 를 문서 id 순으로 끝까지 (또는 문서 limit 개까지)
+    읽으면서 페이지마다 한 덩어리씩 내보낸다. 메모리에는 한 페이지만 들고 있는다.
+
+    to_records(doc_id, data) 는 문서 하나를 행 목록으로 바꾼다 (CSV 집계는 선택지마다 한 행).
+    끊기면 마지막으로 받은 행의 id 를 after 로 넘겨 이어 받는다.
+    """
+    if fmt == "csv" and after is None:
+        yield CSV_BOM + csv_chunk([], columns, header=True)
+
+    remaining = limit
+    while remaining is None or remaining > 0:
+        size = page_size if remaining is None else min(page_size, remaining)
+        try:
+            rows = await fetch_page(after, size)
+        except Exception:
+            # 이미 200 을 보낸 뒤라 상태 코드를 바꿀 수 없다. 잘린 응답은 마지막 id 부터 다시 받는다
+            logger.exception("내보내기 중단", extra={"after": after})
+            raise
+        if not rows:
+            return
+
+        records = [record for doc_id, data in rows for record in to_records(doc_id, data)]
+        if fmt == "csv":
+            yield csv_chunk(records, columns)
+        else:
+            yield ndjson_chunk(records)
+
+        after = rows[-1][0]
+        if remaining is not None:
+            remaining -= len(rows)
+        if len(rows) < size:
+            return
@@ -0,0 +1,257 @@
+import hashlib
+import json
+import logging
+import threading
+from datetime import datetime, timezone
+
+logger = logging.getLogger(__name__)
+
+FEED_COLLECTION = "public_feed"
+FEED_DOCUMENT = "current"
+
+# Firestore 문서 하나는 1MiB 까지라서 payload 문자열을 이 크기 아래로 나눈다
+FEED_CHUNK_BYTES = 900_000
+
+
+def _to_bool(value, default: bool) -> bool:
+    if isinstance(value, bool):
+        return value
+    if isinstance(value, str):
+        return value.strip().lower() in ("true", "1", "yes", "y")
+    if isinstance(value, (int, float)):
+        return value != 0
+    return default
+
+
+def _to_int(value, default: int) -> int:
+    try:
+        return int(value or default)
+    except (TypeError, ValueError):
+        return default
+
+
+def to_text(value) -> str:
+    if isinstance(value, datetime):
+        if hasattr(value, "rfc3339"):
+            return value.rfc3339()
+        if value.tzinfo is None:
+            value = value.replace(tzinfo=timezone.utc)
+        return value.astimezone(timezone.utc).isoformat().replace("+00:00", "Z")
+    return str(value or "").strip()
+
+
+def normalize_public_issue(doc_id: str, row: dict) -> dict:
+    """모바일 main.normalize_issue 와 같은 규칙으로 issues_public 문서를 정규화한다."""
+    row = dict(row or {})
+
+    created_at = to_text(
+        row.get("createdAt")
+        or row.get("created_at")
+        or row.get("updatedAt")
+        or row.get("updated_at")
+        or row.get("startAt")
+    )
+    updated_at = to_text(
+        row.get("updatedAt")
+        or row.get("updated_at")
+        or row.get("createdAt")
+        or row.get("created_at")
+    )
+
+    return {
+        "id": doc_id,
+        "type": to_text(row.get("type") or "notice").lower(),
+        "status": to_text(row.get("status") or "draft").lower(),
+        "title": to_text(row.get("title")),
+        "summary": to_text(row.get("summary")),
+        "content": to_text(row.get("content")),
+        "category": to_text(row.get("category")),
+        "scope": to_text(row.get("scope")),
+        "company": to_text(row.get("company")),
+        "union": to_text(row.get("union")),
+        "resultVisibility": to_text(row.get("resultVisibility") or "public").lower(),
+        "imageUrl": to_text(row.get("imageUrl")),
+        "options": [str(x) for x in (row.get("options") or row.get("option") or [])],
+        "multiple": bool(row.get("multiple", False)),
+        "maxSelections": _to_int(row.get("maxSelections", 1), 1),
+        # active 필드가 없으면 공개 데이터로 간주
+        "active": _to_bool(row.get("active"), True),
+        "isPinned": _to_bool(row.get("isPinned"), False),
+        "order": _to_int(row.get("order", 999999), 999999),
+        "orderKey": to_text(row.get("orderKey")),
+        "startAt": to_text(row.get("startAt")),
+        "endAt": to_text(row.get("endAt")),
+        "createdAt": created_at,
+        "updatedAt": updated_at,
+    }
+
+
+def is_visible(issue: dict) -> bool:
+    """모바일 should_display_issue(tab="전체") 와 같은 공개 정책"""
+    if not issue.get("id") or issue.get("active") is False:
+        return False
+    if issue.get("type") not in ("notice", "vote", "survey"):
+        return False
+    return issue.get("status") in ("open", "closed")
+
+
+def sort_key(issue: dict):
+    # 정렬 키가 있으면 그것으로, 없는 예전 문서는 그 뒤에 order 순으로 (모바일 sort_issue_key 와 같음)
+    order_key = issue.get("orderKey")
+    return (
+        -1 if issue.get("isPinned") else 0,
+        (0, order_key) if order_key else (1, issue.get("order", 999999)),
+        issue.get("createdAt") or issue.get("updatedAt") or "",
+    )
+
+
+def build_feed(rows) -> list:
+    """rows: [(doc_id, data), ...] -> 정규화/필터/정렬된 공개 안건 목록"""
+    issues = [normalize_public_issue(doc_id, data) for doc_id, data in rows]
+    issues = [x for x in issues if is_visible(x)]
+    issues.sort(key=sort_key)
+    return issues
+
+
+def chunk_payload(payload: str, max_bytes: int = FEED_CHUNK_BYTES) -> list:
+    """UTF-8 기준 max_bytes 를 넘지 않게 문자열을 나눈다 (한글은 3바이트)."""
+    raw = payload.encode("utf-8")
+    chunks = []
+    start = 0
+
+    while start < len(raw):
+        end = min(start + max_bytes, len(raw))
+        # 글자 중간(continuation byte)에서 자르지 않도록 뒤로 물린다
+        while end < len(raw) and (raw[end] & 0xC0) == 0x80:
+            end -= 1
+        chunks.append(raw[start:end].decode("utf-8"))
+        start = end
+
+    return chunks or [""]
+
+
+class FeedPublisher:
+    """
+    issues_public 이 바뀌면 public_feed/current 문서를 다시 만든다.
+
+    - 변경이 몰려도 debounce 초 뒤 한 번만 만든다 (리스너 스레드와 분리된 타이머 스레드)
+    - 내용 해시가 같으면 쓰지 않는다
+    - 청크가 여러 개면 current_v{version}_{n} 문서에 나누어 담고, 한 WriteBatch 로 원자적으로 교체한다
+    """
+
+    def __init__(
+        self,
+        client_factory,
+        source_rows,
+        debounce: float = 1.0,
+        chunk_bytes: int = FEED_CHUNK_BYTES,
+    ):
+        self._client_factory = client_factory
+        self._source_rows = source_rows
+        self.debounce = debounce
+        self.chunk_bytes = chunk_bytes
+        self._timer = None
+        self._lock = threading.Lock()
+        self._publish_lock = threading.Lock()
+
+        self.version = None
+        self.last_hash = None
+        self.last_chunks = 1
+        self.last_published_at = None
+        self.last_error = ""
+
+    def schedule(self, *_args) -> None:
+        with self._lock:
+            if self._timer is not None:
+                self._timer.cancel()
+            self._timer = threading.Timer(self.debounce, self._run)
+            self._timer.daemon = True
+            self._timer.start()
+
+    def cancel(self) -> None:
+        with self._lock:
+            if self._timer is not None:
+                self._timer.cancel()
+                self._timer = None
+
+    def _run(self) -> None:
+        try:
+            rows = self._source_rows()
+            if rows is None:
+                # 원본이 아직 준비되지 않았으면 잠시 뒤 다시 시도
+                self.schedule()
+                return
+            self.publish(build_feed(rows))
+        except Exception as e:
+            self.last_error = str(e)
+            logger.exception("public feed 발행 실패")
+
+    def publish(self, issues: list) -> bool:
+        payload = json.dumps(issues, ensure_ascii=False, separators=(",", ":"))
+        digest = hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+        with self._publish_lock:
+            if digest == self.last_hash:
+                return False
+
+            db = self._client_factory()
+            head_ref = db.collection(FEED_COLLECTION).document(FEED_DOCUMENT)
+
+            if self.version is None:
+                head = head_ref.get()
+                data = (head.to_dict() or {}) if head.exists else {}
+                self.version = int(data.get("version", 0) or 0)
+                self.last_chunks = int(data.get("chunks", 1) or 1)
+                if data.get("hash") == digest:
+                    self.last_hash = digest
+                    return False
+
+            previous_version = self.version
+            previous_chunks = self.last_chunks
+            version = previous_version + 1
+            chunks = chunk_payload(payload, self.chunk_bytes)
+
+            batch = db.batch()
+            for index, chunk in enumerate(chunks[1:], start=1):
+                batch.set(
+                    db.collection(FEED_COLLECTION).document(f"{FEED_DOCUMENT}_v{version}_{index}"),
+                    {"version": version, "index": index, "payload": chunk},
+                )
+
+            batch.set(
+                head_ref,
+                {
+                    "version": version,
+                    "hash": digest,
+                    "count": len(issues),
+                    "chunks": len(chunks),
+                    "payload": chunks[0],
+                    "updatedAt": datetime.now(timezone.utc),
+                },
+            )
+
+            for index in range(1, previous_chunks):
+                batch.delete(
+                    db.collection(FEED_COLLECTION).document(
+                        f"{FEED_DOCUMENT}_v{previous_version}_{index}"
+                    )
+                )
+
+            batch.commit()
+
+            self.version = version
+            self.last_hash = digest
+            self.last_chunks = len(chunks)
+            self.last_published_at = datetime.now(timezone.utc)
+            self.last_error = ""
+            return True
+
+    def stats(self) -> dict:
+        return {
+            "version": self.version,
+            "chunks": self.last_chunks,
+            "last_published_at": (
+                self.last_published_at.isoformat() if self.last_published_at else None
+            ),
+            "last_error": self.last_error,
+        }
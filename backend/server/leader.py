@@ -0,0 +1,108 @@
+import asyncio
+import logging
+import time
+
+from .metrics import registry
+
+logger = logging.getLogger(__name__)
+
+leader_gauge = registry.gauge("worker_leader", "이 워커가 리더인지 (1/0)", ("name",))
+
+
+class LeaderWatchdog:
+    """
+    워커 중 한 곳만 맡는 일(스냅샷 리스너, 피드 발행, 재배치 등)의 리더를 주기적으로 다시 뽑는다.
+
+    - try_lead 를 interval 초마다 불러 리더 자리를 잡거나 유지한다 (redis 는 이때 만료를 늘림)
+    - 리더가 되면 on_elected(), 리더를 잃으면 on_demoted() 를 부른다
+    - 리더가 죽으면 잠금이 풀리거나(shm) 만료돼서(redis) 다른 워커가 다음 검사 때 가져간다
+    - 종료할 때 stop() 이 resign 으로 자리를 내려놓아 만료를 기다리지 않게 한다
+    - 캐시에 닿지 않으면 lease 초 동안은 상태를 유지하고, 그 뒤에는 리더에서 내려온다
+      (그동안 리더 키가 만료돼 다른 워커가 리더가 됐을 수 있다)
+    """
+
+    def __init__(
+        self,
+        name: str,
+        try_lead,
+        on_elected,
+        on_demoted,
+        interval: float = 10.0,
+        lease: float = 30.0,
+        resign=None,
+    ):
+        self.name = name
+        self.try_lead = try_lead
+        self.on_elected = on_elected
+        self.on_demoted = on_demoted
+        self.interval = interval
+        self.lease = lease
+        self.resign = resign
+        self._task = None
+        self._confirmed_at = None
+
+        self.leader = None
+        self.elections = 0
+        self.last_error = ""
+
+    async def check(self) -> bool:
+        try:
+            leader = await self.try_lead(self.name)
+            self._confirmed_at = time.monotonic()
+            self.last_error = ""
+        except Exception as e:
+            self.last_error = repr(e)
+            logger.warning("리더 확인 실패", extra={"leader": self.name, "error": repr(e)})
+            expired = (
+                self._confirmed_at is None
+                or time.monotonic() - self._confirmed_at > self.lease
+            )
+            leader = bool(self.leader) and not expired
+
+        if leader and not self.leader:
+            logger.info("리더가 됨", extra={"leader": self.name})
+            self.elections += 1
+            await self.on_elected()
+        elif not leader and self.leader:
+            logger.warning("리더에서 내려옴", extra={"leader": self.name})
+            await self.on_demoted()
+
+        self.leader = leader
+        leader_gauge.set((self.name,), 1 if leader else 0)
+        return leader
+
+    def start(self) -> None:
+        if self._task is None:
+            self._task = asyncio.create_task(self._run_forever())
+
+    def cancel(self) -> None:
+        if self._task is not None:
+            self._task.cancel()
+            self._task = None
+
+    async def stop(self) -> None:
+        self.cancel()
+        if self.leader and self.resign is not None:
+            try:
+                await self.resign(self.name)
+            except Exception as e:
+                logger.warning("리더 자리 반납 실패", extra={"leader": self.name, "error": repr(e)})
+        self.leader = False
+        leader_gauge.set((self.name,), 0)
+
+    def stats(self) -> dict:
+        return {
+            "leader": self.leader,
+            "elections": self.elections,
+            "last_error": self.last_error,
+        }
+
+    async def _run_forever(self) -> None:
+        while True:
+            await asyncio.sleep(self.interval)
+            try:
+                await self.check()
+            except Exception as e:
+                # on_elected/on_demoted 실패. 다음 검사 때 다시 시도한다
+                self.last_error = repr(e)
+                logger.warning("리더 작업 전환 실패", extra={"leader": self.name, "error": repr(e)})
@@ -0,0 +1,82 @@
+import atexit
+import copy
+import logging
+import logging.handlers
+import queue
+import sys
+from datetime import datetime, timezone
+
+from .serialization import dumps
+
+# LogRecord 기본 속성 (이 밖의 속성은 extra= 로 넘긴 구조화 필드)
+_RECORD_ATTRS = set(vars(logging.makeLogRecord({}))) | {"message", "asctime", "taskName"}
+
+_listener = None
+_exc_formatter = logging.Formatter()
+
+
+class JsonFormatter(logging.Formatter):
+    """한 줄에 JSON 하나: ts / level / logger / msg + extra 필드"""
+
+    def format(self, record: logging.LogRecord) -> str:
+        entry = {
+            "ts": datetime.fromtimestamp(record.created, timezone.utc).isoformat(),
+            "level": record.levelname,
+            "logger": record.name,
+            "msg": record.getMessage(),
+        }
+        for key, value in vars(record).items():
+            if key not in _RECORD_ATTRS and not key.startswith("_"):
+                entry[key] = value
+        if record.exc_info and not record.exc_text:
+            record.exc_text = self.formatException(record.exc_info)
+        if record.exc_text:
+            entry["exc"] = record.exc_text
+        return dumps(entry).decode("utf-8")
+
+
+class DeferredQueueHandler(logging.handlers.QueueHandler):
+    """
+    기본 QueueHandler 는 넣기 전에 레코드 전체를 포맷한다.
+    여기서는 msg % args 와 예외 traceback 만 넣는 쪽에서 문자열로 굳히고
+    (args 나 예외에 걸린 객체가 나중에 바뀌거나 붙잡혀 있지 않도록)
+    extra 필드를 합친 JSON 포맷과 출력은 리스너 스레드에서 한다.
+    """
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        record = copy.copy(record)
+        record.msg = record.getMessage()
+        record.args = None
+        if record.exc_info:
+            if not record.exc_text:
+                record.exc_text = _exc_formatter.formatException(record.exc_info)
+            record.exc_info = None
+        return record
+
+
+def setup_logging(level: str = "INFO", fmt: str = "json", stream=None) -> None:
+    """
+    루트 로거에 큐 핸들러를 단다. 요청 처리 쪽은 큐에 넣기만 하고
+    포맷과 stderr 쓰기는 QueueListener 스레드가 한다. 여러 번 불러도 한 번만 설정한다.
+    """
+    global _listener
+
+    root = logging.getLogger()
+    root.setLevel(level.upper())
+    if _listener is not None:
+        return
+
+    output = logging.StreamHandler(stream or sys.stderr)
+    if fmt == "json":
+        output.setFormatter(JsonFormatter())
+    else:
+        output.setFormatter(
+            logging.Formatter("%(asctime)s %(levelname)s %(name)s: %(message)s")
+        )
+
+    records = queue.SimpleQueue()
+    root.addHandler(DeferredQueueHandler(records))
+    _listener = logging.handlers.QueueListener(records, output)
+    _listener.start()
+    # 종료 시 큐에 남은 로그를 마저 쓴다
+    atexit.register(_listener.stop)
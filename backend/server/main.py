@@ -1,19 +1,78 @@
 from fastapi import FastAPI
-import firebase_admin
-from firebase_admin import credentials, firestore
-from pydantic import BaseModel
+import asyncio
+import base64
+from firebase_admin import auth
+from google.api_core.exceptions import GoogleAPICallError
+from pydantic import BaseModel, ConfigDict
+from contextlib import asynccontextmanager, contextmanager
 from datetime import datetime
-from fastapi import FastAPI, Request
-from fastapi.responses import HTMLResponse
+from typing import Literal
+from fastapi import FastAPI, Request, WebSocket, WebSocketDisconnect
+from fastapi.responses import HTMLResponse, Response, StreamingResponse
 from fastapi.templating import Jinja2Templates
-from fastapi import Depends, HTTPException, status
+from fastapi import Depends, Header, HTTPException, Query, status
 from fastapi.security import HTTPBasic, HTTPBasicCredentials
+import json
+import logging
 import secrets
+import time
 from dotenv import load_dotenv
 import os
 
+from .cleanup import CascadeDeleter
+from .cache import (
+    compute_etag,
+    decode_entry,
+    encode_entry,
+    etag_matches,
+    make_cache_backend,
+)
+from .bootstrap import (
+    VOTE_TYPES,
+    build_bootstrap,
+    stats_readable,
+    serialize_ballot,
+    serialize_version_meta,
+    stats_issue_ids,
+    vote_issue_ids,
+)
+from .admission import AdmissionMiddleware, ConcurrencyLimiter, RateLimiter
+from .compression import CompressionMiddleware
+from .events import IssueEventHub, format_sse
+from .export import EXPORT_FORMATS, content_disposition, stream_export
+from .feed import FeedPublisher, build_feed, is_visible, normalize_public_issue
+from .leader import LeaderWatchdog
+from .logs import setup_logging
+from .metrics import (
+    FirestoreSlots,
+    Gauge,
+    MetricsMiddleware,
+    registry as metrics_registry,
+)
+from .mirror import CollectionMirror
+from .ordering import ORDER_KEY_FIELD, OrderRebalancer, is_order_key, key_between
+from .vote_hub import VoteResultsHub, VoteSubscriber, revoked_frame, summarize_vote_stats
+from .pagination import decode_cursor, encode_cursor
+from .publish import PUBLISH_SOURCE_FIELDS, PublicProjector
+from .readiness import Readiness, warm_up
+from .results import RESULTS_COLLECTION, ResultsFreezer, ballot_selections, serialize_results
+from .repository import (
+    DocumentNotFound,
+    PreconditionFailed,
+    RepositoryError,
+    ballots_collection,
+    ensure_firebase_app,
+    make_repository,
+)
+from .serialization import FastJSONResponse, dumps
+from .tracing import SlowTraceStore, TracingMiddleware, span
+
 load_dotenv()
 
+# 로그는 큐에 넣기만 하고 포맷/출력은 별도 스레드에서 (LOG_FORMAT=text 면 사람이 읽는 형식)
+setup_logging(os.getenv("LOG_LEVEL", "INFO"), os.getenv("LOG_FORMAT", "json"))
+logger = logging.getLogger(__name__)
+
 security = HTTPBasic()
 
 templates = Jinja2Templates(directory="server/templates")
@@ -35,15 +94,406 @@ class IssueUpdate(BaseModel):
     order: int
 
 
-app = FastAPI()
+class IssuePatch(BaseModel):
+    model_config = ConfigDict(extra="forbid")
 
-# Firebase 초기화
-cred = credentials.Certificate("server/firebase_key.json")
-firebase_admin.initialize_app(cred)
-db = firestore.client()
+    title: str | None = None
+    summary: str | None = None
+    company: str | None = None
+    union_opt: str | None = None
+    order: int | None = None
 
 
-def admin_auth(credentials: HTTPBasicCredentials = Depends(security)):
+class IssueMove(BaseModel):
+    # 이 안건 바로 뒤로 옮긴다 (None 이면 맨 앞)
+    after: str | None = None
+
+
+class IssueBatchOperation(BaseModel):
+    op: Literal["create", "update", "delete", "reorder"]
+    id: str | None = None
+    data: dict = {}
+    order: int | None = None
+    # reorder: 이 안건 바로 뒤로 옮긴다 (null 이면 맨 앞). POST /issues/{id}:move 와 같다
+    after: str | None = None
+
+
+class IssueBatchRequest(BaseModel):
+    operations: list[IssueBatchOperation]
+
+
+class ReadOperation(BaseModel):
+    op: Literal["issue", "ballot", "stats", "version"]
+    id: str | None = None
+
+
+class ReadBatchRequest(BaseModel):
+    operations: list[ReadOperation]
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    # Firebase 초기화/채널 연결/캐시 채우기는 뒤에서 한다 (그동안 /healthz 는 응답, /readyz 는 503)
+    results_freezer.bind(asyncio.get_running_loop())
+    warmup_task = asyncio.create_task(
+        warm_up(
+            readiness,
+            [
+                ("storage", repository.warm_up),
+                ("leader", start_leadership),
+                ("issues_cache", warm_issues_cache),
+            ],
+            timeout=WARMUP_STEP_TIMEOUT_SEC,
+        )
+    )
+
+    yield
+
+    # 로드밸런서가 먼저 빼 가도록 종료가 시작되면 바로 not ready
+    readiness.mark_draining()
+    warmup_task.cancel()
+    await leader_watchdog.stop()
+    cascade_deleter.cancel()
+    order_rebalancer.cancel()
+    results_freezer.cancel()
+    feed_publisher.cancel()
+    issue_projector.cancel()
+    stop_issue_mirrors()
+    repository.close()
+
+
+app = FastAPI(lifespan=lifespan, default_response_class=FastJSONResponse)
+
+# 읽기/쓰기별 동시 처리 수와 대기열 상한, 클라이언트별 요청 속도 제한 (워커마다)
+# 넘치는 요청은 Firestore 가 타임아웃 날 때까지 쌓지 않고 바로 429/503 + Retry-After
+ADMISSION_ENABLED = os.getenv("ADMISSION_ENABLED", "1") == "1"
+# 오래 열려 있는 스트림과 상태 확인은 제한하지 않는다
+ADMISSION_EXEMPT_PATHS = {"/healthz", "/readyz", "/metrics", "/issues/stream"}
+
+
+def admission_class(scope) -> str | None:
+    if scope["path"] in ADMISSION_EXEMPT_PATHS:
+        return None
+    # POST /batch 는 모바일 읽기 묶음이다
+    if scope["method"] in ("GET", "HEAD", "OPTIONS") or scope["path"] == "/batch":
+        return "read"
+    return "write"
+
+
+async def admission_identity(scope) -> str | None:
+    """속도 제한 키로 쓸 검증된 사용자. 검증에 실패하면 None (IP 로 센다)"""
+    authorization = dict(scope.get("headers") or []).get(b"authorization", b"")
+    scheme, _, value = authorization.decode("latin-1").partition(" ")
+    scheme = scheme.lower()
+
+    if scheme == "bearer" and value:
+        try:
+            uid = await verify_mobile_token(value)
+        except HTTPException:
+            return None
+        # 라우트의 mobile_user 가 같은 토큰을 다시 검증하지 않도록 남겨 둔다
+        scope.setdefault("state", {})["mobile_identity"] = (value, uid)
+        return "mobile:" + uid
+
+    if scheme == "basic" and value:
+        try:
+            username, _, password = base64.b64decode(value).decode("utf-8").partition(":")
+        except (ValueError, UnicodeDecodeError):
+            return None
+        try:
+            ok = admin_credentials_ok(username, password)
+        except RuntimeError:
+            # 관리자 계정이 설정되지 않았으면 라우트가 알리게 두고 여기서는 IP 로 센다
+            return None
+        if ok:
+            return "admin:" + username
+
+    return None
+
+
+def make_rate_limiter(prefix: str, rate: str, burst: str):
+    per_sec = float(os.getenv(f"{prefix}_RATE_PER_SEC", rate))
+    if per_sec <= 0:
+        return None
+    return RateLimiter(per_sec, int(os.getenv(f"{prefix}_BURST", burst)))
+
+
+admission_limiters = {
+    name: ConcurrencyLimiter(
+        name,
+        limit=int(os.getenv(f"{prefix}_MAX_CONCURRENCY", limit)),
+        queue_size=int(os.getenv(f"{prefix}_QUEUE_SIZE", queue)),
+        queue_timeout=float(os.getenv(f"{prefix}_QUEUE_TIMEOUT_SEC", "2")),
+    )
+    for name, prefix, limit, queue in (
+        ("read", "READ", "256", "512"),
+        ("write", "WRITE", "32", "64"),
+    )
+}
+admission_rate_limiters = {
+    "read": make_rate_limiter("READ", "0", "100"),
+    "write": make_rate_limiter("WRITE", "20", "40"),
+}
+if ADMISSION_ENABLED:
+    app.add_middleware(
+        AdmissionMiddleware,
+        classify=admission_class,
+        limiters=admission_limiters,
+        rate_limiters={k: v for k, v in admission_rate_limiters.items() if v},
+        retry_after=float(os.getenv("OVERLOAD_RETRY_AFTER_SEC", "1")),
+        trust_forwarded=os.getenv("ADMISSION_TRUST_FORWARDED", "0") == "1",
+        identify=admission_identity,
+    )
+
+# 한글 본문은 UTF-8 로 3바이트라 압축 효과가 크다 (작은 응답은 그대로 보냄)
+app.add_middleware(
+    CompressionMiddleware,
+    minimum_size=int(os.getenv("COMPRESS_MIN_BYTES", "1024")),
+)
+# 요청별 구간(인증/Firestore/직렬화)을 Server-Timing 으로 보내고 느린 요청은 남겨 둔다
+slow_traces = SlowTraceStore(capacity=int(os.getenv("SLOW_TRACE_CAPACITY", "50")))
+app.add_middleware(TracingMiddleware, store=slow_traces)
+# 가장 바깥에서 압축 시간까지 포함해 route 별로 잰다
+app.add_middleware(MetricsMiddleware)
+
+# 동시에 진행되는 Firestore 호출 수 상한 (gRPC 채널 과부하 방지)
+FIRESTORE_MAX_CONCURRENCY = int(os.getenv("FIRESTORE_MAX_CONCURRENCY", "64"))
+firestore_slots = FirestoreSlots(FIRESTORE_MAX_CONCURRENCY)
+
+# 저장소 (firestore / memory / sqlite). Firebase 는 처음 쓸 때 초기화한다
+# memory / sqlite 는 인증 정보 없이 HTTP 계층을 돌려 보거나 데모용 로컬 복제본을 띄울 때 쓴다
+STORAGE_BACKEND = os.getenv("STORAGE_BACKEND", "firestore")
+repository = make_repository(
+    STORAGE_BACKEND,
+    slots=firestore_slots,
+    path=os.getenv("SQLITE_PATH"),
+    seed_file=os.getenv("STORAGE_SEED_FILE"),
+)
+
+# MOBILE_AUTH=insecure 면 Bearer 토큰을 그대로 uid 로 쓴다 (오프라인 저장소 전용)
+MOBILE_AUTH = os.getenv("MOBILE_AUTH", "firebase")
+if MOBILE_AUTH == "insecure" and repository.supports_watch:
+    raise RuntimeError("MOBILE_AUTH=insecure 는 memory / sqlite 저장소에서만 쓸 수 있습니다")
+
+# GET /issues 응답 캐시 (쓰기 요청이 오면 즉시 무효화)
+ISSUES_CACHE_TTL = float(os.getenv("ISSUES_CACHE_TTL", "5"))
+ISSUES_CACHE_MAX_AGE = int(os.getenv("ISSUES_CACHE_MAX_AGE", "5"))
+# 워커가 여러 개면 CACHE_BACKEND=shm(같은 호스트) 또는 redis 로 캐시와 무효화를 공유한다
+CACHE_BACKEND = os.getenv("CACHE_BACKEND", "local")
+CACHE_FILL_WAIT_SEC = float(os.getenv("CACHE_FILL_WAIT_SEC", "2"))
+LEADER_CHECK_INTERVAL_SEC = float(os.getenv("LEADER_CHECK_INTERVAL_SEC", "10"))
+LEADER_LEASE_SEC = float(os.getenv("LEADER_LEASE_SEC", "30"))
+issues_cache = make_cache_backend(
+    CACHE_BACKEND,
+    ttl=ISSUES_CACHE_TTL,
+    directory=os.getenv("CACHE_SHM_DIR"),
+    url=os.getenv("REDIS_URL"),
+    # 캐시에 닿지 않는 리더는 마지막 확인 뒤 lease 동안 버티고 다음 검사 때 내려오므로,
+    # 리더 키는 그보다 오래 남아야 두 워커가 동시에 리더가 되지 않는다
+    leader_ttl=LEADER_LEASE_SEC + LEADER_CHECK_INTERVAL_SEC,
+)
+issues_load_locks = {}
+
+
+# GET /issues 페이지 크기. limit 도 cursor 도 없으면 예전처럼 전체를 준다 (limit 을 모르는 구버전 앱)
+ISSUES_DEFAULT_LIMIT = int(os.getenv("ISSUES_DEFAULT_LIMIT", "100"))
+ISSUES_MAX_LIMIT = int(os.getenv("ISSUES_MAX_LIMIT", "500"))
+
+# 응답 필드명 -> Firestore 필드명
+ISSUE_FIELD_MAP = {
+    "title": "title",
+    "summary": "summary",
+    "company": "company",
+    "union": "union_opt",
+    "order": "order",
+    "order_key": ORDER_KEY_FIELD,
+    "status": "status",
+    "type": "type",
+    "scope": "scope",
+}
+DEFAULT_ISSUE_FIELDS = ("title", "summary", "company", "union")
+
+# issues / issues_public 메모리 미러 (on_snapshot 리스너로 유지, Firestore 저장소에서만)
+ISSUES_MIRROR_ENABLED = (
+    os.getenv("ISSUES_MIRROR_ENABLED", "1") == "1" and repository.supports_watch
+)
+PUBLIC_ISSUE_FIELDS = (
+    "title",
+    "summary",
+    "content",
+    "category",
+    "scope",
+    "status",
+    "type",
+    "resultVisibility",
+    "company",
+    "union",
+    "multiple",
+    "maxSelections",
+    "options",
+    "startAt",
+    "endAt",
+    "createdAt",
+    "updatedAt",
+    "imageUrl",
+    "active",
+    "isPinned",
+    "order",
+    "orderKey",
+)
+issue_mirrors = {
+    "issues": CollectionMirror(
+        "issues",
+        tuple(
+            dict.fromkeys(
+                tuple(ISSUE_FIELD_MAP.values()) + ("updated_at",) + PUBLISH_SOURCE_FIELDS
+            )
+        ),
+        order_field=ORDER_KEY_FIELD,
+    ),
+    "issues_public": CollectionMirror("issues_public", PUBLIC_ISSUE_FIELDS),
+}
+issues_mirror = issue_mirrors["issues"]
+
+# 시작 준비 상태 (/readyz)
+readiness = Readiness()
+WARMUP_STEP_TIMEOUT_SEC = float(os.getenv("WARMUP_STEP_TIMEOUT_SEC", "30"))
+
+# POST /issues:batch 한 번에 받는 연산 수 / WriteBatch 한 번에 커밋하는 쓰기 수
+ISSUES_BATCH_MAX_OPS = int(os.getenv("ISSUES_BATCH_MAX_OPS", "1000"))
+
+# POST /batch 한 번에 받는 읽기 연산 수
+READ_BATCH_MAX_OPS = int(os.getenv("READ_BATCH_MAX_OPS", "50"))
+FIRESTORE_BATCH_SIZE = 500
+
+# 안건을 지우면 votes/{id}/ballots, vote_stats/{id}, vote_results/{id} 는 뒤에서 500개 묶음씩 지운다
+cascade_deleter = CascadeDeleter(
+    repository,
+    batch_size=FIRESTORE_BATCH_SIZE,
+    parallelism=int(os.getenv("CASCADE_DELETE_PARALLELISM", "4")),
+    interval=float(os.getenv("CASCADE_DELETE_RESUME_INTERVAL_SEC", "300")),
+)
+
+# 정렬 키를 만들 수 없을 때(재배치 대기 중) 클라이언트가 다시 시도할 때까지 기다릴 초
+ORDER_KEY_RETRY_AFTER_SEC = int(os.getenv("ORDER_KEY_RETRY_AFTER_SEC", "2"))
+# 정렬 키가 없는 안건(예전 문서, 관리자 웹이 바로 만든 문서)에 키를 붙이고, 길어진 키는 다시 나눈다
+order_rebalancer = OrderRebalancer(
+    repository,
+    batch_size=FIRESTORE_BATCH_SIZE,
+    interval=float(os.getenv("ORDER_REBALANCE_INTERVAL_SEC", "300")),
+    on_written=lambda: invalidate_issues_cache(),
+)
+
+# 마감된 투표/설문의 최종 결과를 vote_results 에 한 번 확정한다 (참여율 분모는 전체 조합원 수)
+results_freezer = ResultsFreezer(
+    repository,
+    eligible=int(os.getenv("VOTE_ELIGIBLE_MEMBERS", "0")),
+    page_size=FIRESTORE_BATCH_SIZE,
+)
+# 확정된 결과도 다시 열리거나 공개 정책(admin_only 등)이 바뀔 수 있으므로 공유 캐시에는 두지 않고,
+# 클라이언트만 잠깐 재사용한 뒤 ETag(체크섬)로 다시 확인한다
+FINAL_RESULTS_CACHE_CONTROL = (
+    f"private, max-age={int(os.getenv('FINAL_RESULTS_MAX_AGE_SEC', '300'))}"
+)
+
+# /admin/export/* 가 저장소에서 한 번에 읽는 문서 수 (메모리에는 이만큼만 올라간다)
+EXPORT_PAGE_SIZE = int(os.getenv("EXPORT_PAGE_SIZE", "500"))
+EXPORT_ISSUE_COLUMNS = ("id",) + tuple(
+    dict.fromkeys(
+        tuple(ISSUE_FIELD_MAP.values()) + ("updated_at",) + PUBLISH_SOURCE_FIELDS
+    )
+)
+EXPORT_BALLOT_COLUMNS = (
+    "uid",
+    "issueId",
+    "type",
+    "selectedOptions",
+    "choice",
+    "submittedAt",
+    "updatedAt",
+)
+EXPORT_STATS_COLUMNS = ("issueId", "total", "option", "count")
+
+
+def issues_cache_headers(etag: str, extra: dict | None = None) -> dict:
+    return {
+        "ETag": etag,
+        "Cache-Control": f"public, max-age={ISSUES_CACHE_MAX_AGE}, must-revalidate",
+        **(extra or {}),
+    }
+
+
+def conditional_json(request: Request, body, etag: str, extra: dict | None = None):
+    """body 는 이미 직렬화된 JSON bytes (또는 캐시의 memoryview)"""
+    headers = issues_cache_headers(etag, extra)
+
+    if etag_matches(request.headers.get("if-none-match"), etag):
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+
+    return Response(content=body, media_type="application/json", headers=headers)
+
+
+def dump_json(payload) -> bytes:
+    with span("serialize"):
+        return dumps(payload)
+
+
+async def cache_call(fn, *args):
+    # 네트워크 캐시(redis)는 이벤트 루프를 막지 않도록 스레드에서 부른다
+    if issues_cache.blocking:
+        return await asyncio.to_thread(fn, *args)
+    return fn(*args)
+
+
+async def invalidate_issues_cache():
+    await cache_call(issues_cache.invalidate)
+
+
+async def cached_entry(cache_key: str, loader):
+    """
+    캐시에서 (meta, body) 를 꺼내고, 없으면 loader() -> (meta, payload) 로 채운다.
+    같은 키는 프로세스 안에서는 asyncio.Lock, 워커 사이에서는 claim 으로 한 번만 채운다.
+    """
+    cached = await cache_call(issues_cache.get, cache_key)
+    if cached is not None:
+        return decode_entry(cached)
+
+    lock = issues_load_locks.setdefault(cache_key, asyncio.Lock())
+    try:
+        async with lock:
+            cached = await cache_call(issues_cache.get, cache_key)
+            if cached is not None:
+                return decode_entry(cached)
+
+            claimed = await cache_call(issues_cache.claim, cache_key)
+            if not claimed:
+                # 다른 워커가 채우는 중이면 잠깐 기다렸다가 가져간다
+                deadline = time.monotonic() + CACHE_FILL_WAIT_SEC
+                while time.monotonic() < deadline:
+                    await asyncio.sleep(0.02)
+                    cached = await cache_call(issues_cache.get, cache_key)
+                    if cached is not None:
+                        return decode_entry(cached)
+
+            try:
+                # 읽는 도중 invalidate 되면 오래된 값을 새 세대에 넣지 않는다
+                generation = await cache_call(issues_cache.generation)
+                meta, payload = await loader()
+                body = dump_json(payload)
+                meta = {**meta, "etag": compute_etag(payload)}
+                await cache_call(
+                    issues_cache.set, cache_key, encode_entry(meta, body), generation
+                )
+            finally:
+                if claimed:
+                    await cache_call(issues_cache.release, cache_key)
+
+            return meta, body
+    finally:
+        issues_load_locks.pop(cache_key, None)
+
+
+def admin_credentials_ok(username: str, password: str) -> bool:
     correct_username = os.getenv("ADMIN_USERNAME")
     correct_password = os.getenv("ADMIN_PASSWORD")
 
@@ -52,10 +502,16 @@ def admin_auth(credentials: HTTPBasicCredentials = Depends(security)):
             "ADMIN_USERNAME / ADMIN_PASSWORD 환경변수가 설정되지 않았습니다"
         )
 
-    is_user_ok = secrets.compare_digest(credentials.username, correct_username)
-    is_pass_ok = secrets.compare_digest(credentials.password, correct_password)
+    is_user_ok = secrets.compare_digest(username.encode("utf-8"), correct_username.encode("utf-8"))
+    is_pass_ok = secrets.compare_digest(password.encode("utf-8"), correct_password.encode("utf-8"))
+    return is_user_ok and is_pass_ok
+
 
-    if not (is_user_ok and is_pass_ok):
+def admin_auth(credentials: HTTPBasicCredentials = Depends(security)):
+    with span("auth"):
+        ok = admin_credentials_ok(credentials.username, credentials.password)
+
+    if not ok:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="인증 실패",
@@ -65,82 +521,1251 @@ def admin_auth(credentials: HTTPBasicCredentials = Depends(security)):
     return credentials.username
 
 
+async def mobile_user(request: Request, authorization: str | None = Header(None)) -> str:
+    """모바일 익명 로그인 ID 토큰(Bearer)을 검증하고 uid 를 돌려준다."""
+    scheme, _, token = (authorization or "").partition(" ")
+    token = token if scheme.lower() == "bearer" else None
+
+    # 입장 제어에서 이미 검증했으면 그 결과를 쓴다
+    verified = getattr(request.state, "mobile_identity", None)
+    if token and verified and verified[0] == token:
+        return verified[1]
+    return await verify_mobile_token(token)
+
+
+async def verify_mobile_token(token: str | None) -> str:
+    if not token:
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="로그인 토큰이 없습니다",
+            headers={"WWW-Authenticate": "Bearer"},
+        )
+
+    if MOBILE_AUTH == "insecure":
+        return token
+
+    try:
+        # 공개키는 firebase_admin 이 캐시하지만 첫 조회는 네트워크를 탄다
+        with span("auth"):
+            await asyncio.to_thread(ensure_firebase_app)
+            decoded = await asyncio.to_thread(auth.verify_id_token, token)
+    except (ValueError, auth.InvalidIdTokenError, auth.CertificateFetchError) as e:
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail=f"토큰 검증 실패: {e}",
+            headers={"WWW-Authenticate": "Bearer"},
+        )
+
+    return decoded["uid"]
+
+
 @app.get("/admin", response_class=HTMLResponse)
 def admin_page(request: Request, user: str = Depends(admin_auth)):
     return templates.TemplateResponse("admin.html", {"request": request, "user": user})
 
 
+def parse_issue_fields(fields: str | None) -> tuple:
+    if not fields:
+        return DEFAULT_ISSUE_FIELDS
+
+    names = tuple(dict.fromkeys(x.strip() for x in fields.split(",") if x.strip()))
+    unknown = [x for x in names if x != "id" and x not in ISSUE_FIELD_MAP]
+    if unknown:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"알 수 없는 fields: {', '.join(unknown)}",
+        )
+
+    return tuple(x for x in names if x != "id")
+
+
+def serialize_issue(doc_id: str, data: dict, fields: tuple = DEFAULT_ISSUE_FIELDS):
+    item = {"id": doc_id}  # 👈 추가!
+    for name in fields:
+        item[name] = data.get(ISSUE_FIELD_MAP[name], "")
+    return item
+
+
+async def load_issues(
+    limit: int | None,
+    cursor: str | None = None,
+    fields: tuple = DEFAULT_ISSUE_FIELDS,
+    filters: dict | None = None,
+):
+    """
+    정렬 키(order_key), 문서 id 순으로 limit 개만 읽는다. 미러가 준비됐으면 메모리에서 바로 답한다.
+    limit 이 None 이면 ISSUES_MAX_LIMIT 씩 끝까지 읽는다.
+    반환값: (results, next_cursor)  - 다음 페이지가 없으면 next_cursor 는 None
+    """
+    after = None
+    if cursor:
+        try:
+            after = decode_cursor(cursor)
+        except ValueError as e:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST, detail=str(e)
+            )
+
+    rows = []
+    while True:
+        page_size = limit or ISSUES_MAX_LIMIT
+        if issues_mirror.ready:
+            page, has_more = issues_mirror.query(filters, after, page_size)
+        else:
+            page, has_more = await repository.list_issues(
+                filters, after, page_size, [ISSUE_FIELD_MAP[x] for x in fields]
+            )
+        rows += page
+        if limit is not None or not has_more or not page:
+            break
+        doc_id, data = page[-1]
+        after = (data.get(ORDER_KEY_FIELD, ""), doc_id)
+
+    results = [serialize_issue(doc_id, data, fields) for doc_id, data in rows]
+    next_cursor = None
+    if has_more and rows:
+        doc_id, data = rows[-1]
+        next_cursor = encode_cursor(data.get(ORDER_KEY_FIELD, ""), doc_id)
+    return results, next_cursor
+
+
+async def issues_page(limit: int | None, cursor, selected: tuple, filters: dict):
+    cache_key = json.dumps(
+        ["issues", limit, cursor, selected, filters["status"], filters["type"], filters["scope"]]
+    )
+
+    async def loader():
+        results, next_cursor = await load_issues(limit, cursor, selected, filters)
+        return {"cursor": next_cursor}, results
+
+    return await cached_entry(cache_key, loader)
+
+
+async def warm_issues_cache():
+    # 앱 첫 화면과 같은 요청(GET /issues 기본값)을 미리 캐시에 채운다
+    await issues_page(
+        None,
+        None,
+        DEFAULT_ISSUE_FIELDS,
+        {"status": None, "type": None, "scope": None},
+    )
+
+
 @app.get("/issues")
-def get_issues():
-    docs = db.collection("issues").order_by("order").stream()
-    results = []
+async def get_issues(
+    request: Request,
+    limit: int | None = Query(None, ge=1, le=ISSUES_MAX_LIMIT),
+    cursor: str | None = None,
+    fields: str | None = None,
+    status_: str | None = Query(None, alias="status"),
+    type_: str | None = Query(None, alias="type"),
+    scope: str | None = None,
+):
+    selected = parse_issue_fields(fields)
+    filters = {"status": status_, "type": type_, "scope": scope}
+    # cursor 만 보내면 기본 페이지 크기, 둘 다 없으면 전체
+    if limit is None and cursor:
+        limit = ISSUES_DEFAULT_LIMIT
+
+    try:
+        meta, body = await issues_page(limit, cursor, selected, filters)
+    except RepositoryError as e:
+        raise HTTPException(status_code=502, detail=f"안건 목록 조회 실패: {e}")
+    next_cursor = meta.get("cursor")
+    extra = {"X-Next-Cursor": next_cursor} if next_cursor else None
+    return conditional_json(request, body, meta["etag"], extra)
+
+
+# 컬렉션별로 on_snapshot 리스너는 하나만 두고 SSE 클라이언트에 나눠준다
+ISSUE_STREAM_SOURCES = ("issues", "issues_public")
+SSE_HEARTBEAT_SEC = float(os.getenv("SSE_HEARTBEAT_SEC", "15"))
+issue_event_hubs = {
+    source: IssueEventHub(
+        history=int(os.getenv("SSE_HISTORY_SIZE", "1000")),
+        queue_size=int(os.getenv("SSE_QUEUE_SIZE", "256")),
+    )
+    for source in ISSUE_STREAM_SOURCES
+}
+
+
+def get_watch_db():
+    return repository.watch_client()
+
+
+def require_watch():
+    if not repository.supports_watch:
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail=f"{repository.name} 저장소에서는 실시간 스트림을 쓸 수 없습니다",
+        )
+
+
+def start_issue_mirrors():
+    for source, mirror in issue_mirrors.items():
+        mirror.start(get_watch_db().collection(source))
+
+
+def stop_issue_mirrors():
+    for mirror in issue_mirrors.values():
+        mirror.stop()
+
+
+async def on_leader_elected():
+    # 워커가 여럿이어도 스냅샷 리스너는 리더 한 곳만 띄운다 (나머지는 공유 캐시를 읽음)
+    if ISSUES_MIRROR_ENABLED:
+        # 동기 클라이언트 생성과 리스너 등록은 이벤트 루프 밖에서
+        await asyncio.to_thread(start_issue_mirrors)
+        # 첫 스냅샷이 들어오면 공개 피드가 최신인지 한 번 확인한다 (같으면 쓰지 않음)
+        feed_publisher.schedule()
+    # 정렬 키 채우기/재배치는 리더만 (준비 단계에서 워커마다 전체를 훑지 않는다)
+    order_rebalancer.start()
+    order_rebalancer.schedule()
+    # 남은 삭제 작업은 리더만 이어서 한다 (워커마다 이어서 하면 같은 작업을 여러 곳에서 지운다)
+    cascade_deleter.start()
+    # 리더가 없던 동안(또는 서버가 꺼져 있는 동안) 마감된 안건
+    results_freezer.start_sweep(load_vote_issues)
+
+
+async def on_leader_demoted():
+    order_rebalancer.cancel()
+    cascade_deleter.stop()
+    # SSE 구독자가 쓰는 미러는 남긴다 (그 미러의 리더 작업은 같은 결과를 다시 쓸 뿐이다)
+    for source, mirror in issue_mirrors.items():
+        if not issue_event_hubs[source].subscriber_count:
+            await asyncio.to_thread(mirror.stop)
+
+
+async def start_leadership():
+    await leader_watchdog.check()
+    leader_watchdog.start()
+
+
+def leader_only(callback):
+    """
+    미러 리스너를 리더에서만 돌게 한다. 리더가 아닌 워커도 SSE 구독자가 있으면 미러를 띄우는데,
+    그때 투영/피드 발행/결과 확정/재배치가 워커마다 한 번씩 돌지 않도록 한다.
+    """
+
+    def listener(changes):
+        if leader_watchdog.leader:
+            callback(changes)
+
+    return listener
+
+
+def schedule_order_backfill(changes):
+    if any(
+        change.type.name != "REMOVED"
+        and not is_order_key((change.document.to_dict() or {}).get(ORDER_KEY_FIELD))
+        for change in changes
+    ):
+        order_rebalancer.schedule()
+
+
+issues_mirror.add_listener(leader_only(schedule_order_backfill))
+
+
+# 관리자 웹처럼 백엔드를 거치지 않은 쓰기도 GET /issues 캐시에 반영되도록
+# (local 캐시는 워커마다 try_lead 가 True 라 워커마다 비운다)
+issues_mirror.add_listener(leader_only(lambda changes: issues_cache.invalidate()))
+
+
+def public_feed_rows():
+    mirror = issue_mirrors["issues_public"]
+    return mirror.values() if mirror.ready else None
+
+
+# issues_public 이 바뀌면 public_feed/current 한 문서로 다시 만든다 (모바일 첫 화면은 1회 읽기)
+feed_publisher = FeedPublisher(
+    get_watch_db,
+    public_feed_rows,
+    debounce=float(os.getenv("FEED_DEBOUNCE_SEC", "1")),
+)
+issue_mirrors["issues_public"].add_listener(leader_only(feed_publisher.schedule))
+
+
+async def load_vote_issues() -> list:
+    mirror = issue_mirrors["issues_public"]
+    rows = mirror.values() if mirror.ready else await repository.list_public_issues()
+    issues = [normalize_public_issue(doc_id, data) for doc_id, data in rows]
+    return [x for x in issues if x["type"] in VOTE_TYPES]
+
+
+def schedule_results_freeze(changes):
+    for change in changes:
+        if change.type.name == "REMOVED":
+            results_freezer.schedule_discard(change.document.id)
+            continue
+        issue = normalize_public_issue(change.document.id, change.document.to_dict() or {})
+        if issue["type"] not in VOTE_TYPES:
+            continue
+        if issue["status"] == "closed":
+            results_freezer.schedule(issue["id"], issue["options"])
+        else:
+            results_freezer.schedule_discard(issue["id"])
+
+
+# 공개본이 closed 로 바뀌면 최종 결과를 확정하고, 다시 열리면 지운다
+issue_mirrors["issues_public"].add_listener(leader_only(schedule_results_freeze))
+
+# issues 변경을 issues_public 으로 투영한다 (달라진 문서/필드만, 그때만 updatedAt 갱신)
+ISSUES_PUBLISH_ENABLED = os.getenv("ISSUES_PUBLISH_ENABLED", "1") == "1"
+issue_projector = PublicProjector(
+    get_watch_db,
+    issue_mirrors["issues"],
+    issue_mirrors["issues_public"],
+    debounce=float(os.getenv("ISSUES_PUBLISH_DEBOUNCE_SEC", "0.5")),
+    batch_size=FIRESTORE_BATCH_SIZE,
+)
+if ISSUES_PUBLISH_ENABLED:
+    issues_mirror.add_listener(leader_only(issue_projector.schedule))
+
+
+# 미러/피드 발행/재배치/결과 확정은 리더 한 곳에서. 리더가 죽으면 lease 가 끝난 뒤 다른 워커가 맡는다
+leader_watchdog = LeaderWatchdog(
+    "issue-mirror",
+    lambda name: cache_call(issues_cache.try_lead, name),
+    on_leader_elected,
+    on_leader_demoted,
+    interval=LEADER_CHECK_INTERVAL_SEC,
+    lease=LEADER_LEASE_SEC,
+    resign=lambda name: cache_call(issues_cache.resign, name),
+)
+
+
+async def ensure_issue_listener(source: str) -> IssueEventHub:
+    """
+    SSE 용으로 미러를 띄운다 (리더가 아니어도). 리더 전용 리스너는 leader_only 로 감싸 두었으므로
+    이 워커에서는 허브 콜백만 실제로 일한다.
+    """
+    mirror = issue_mirrors[source]
+    if not mirror.started:
+        # 동기 클라이언트 생성과 리스너 등록은 이벤트 루프 밖에서
+        await asyncio.to_thread(lambda: mirror.start(get_watch_db().collection(source)))
+
+    hub = issue_event_hubs[source]
+    if source == "issues":
+        hub.attach(
+            mirror,
+            lambda doc_id, data: serialize_issue(doc_id, data, tuple(ISSUE_FIELD_MAP)),
+        )
+    else:
+        hub.attach(mirror, lambda doc_id, data: {"id": doc_id, **data})
+
+    return hub
+
+
+def collect_runtime_metrics() -> list:
+    """미러/스트림 상태를 /metrics 를 읽을 때마다 게이지로 만든다."""
+    documents = Gauge("issue_mirror_documents", "미러에 올라온 문서 수", ("collection",))
+    ready = Gauge("issue_mirror_ready", "첫 스냅샷을 받았는지 (1/0)", ("collection",))
+    lag = Gauge("issue_mirror_lag_seconds", "스냅샷 read_time 과 반영 시각 차이", ("collection",))
+    size = Gauge("issue_mirror_approx_bytes", "미러 메모리 사용량 추정", ("collection",))
+    subscribers = Gauge("issue_stream_subscribers", "SSE 구독자 수", ("source",))
+    ready_gauge = Gauge("worker_ready", "요청을 받을 준비가 됐는지 (1/0)")
+    ready_gauge.set((), 1 if readiness.ready else 0)
+
+    for source, mirror in issue_mirrors.items():
+        stats = mirror.stats()
+        documents.set((source,), stats["documents"])
+        ready.set((source,), 1 if stats["ready"] else 0)
+        size.set((source,), stats["approx_bytes"])
+        if stats["lag_seconds"] is not None:
+            lag.set((source,), stats["lag_seconds"])
+
+    for source, hub in issue_event_hubs.items():
+        subscribers.set((source,), hub.subscriber_count)
+
+    return [documents, ready, lag, size, subscribers, ready_gauge]
+
+
+metrics_registry.add_collector(collect_runtime_metrics)
+
+
+@app.get("/metrics")
+def metrics():
+    return Response(
+        content=metrics_registry.render(),
+        media_type="text/plain; version=0.0.4; charset=utf-8",
+    )
+
+
+@app.get("/healthz")
+def healthz():
+    """프로세스가 살아 있고 이벤트 루프가 응답하는지 (liveness)"""
+    return {"status": "ok"}
 
-    for d in docs:
-        data = d.to_dict()
-        results.append(
+
+@app.get("/readyz")
+def readyz():
+    """Firebase 연결과 캐시 준비가 끝났는지 (readiness). 준비 전/종료 중에는 503"""
+    body = {**readiness.snapshot(), "storage": repository.name, "leader": leader_watchdog.leader}
+    if not readiness.ready:
+        return FastJSONResponse(body, status_code=status.HTTP_503_SERVICE_UNAVAILABLE)
+    return body
+
+
+@app.get("/admin/traces")
+def slowest_traces(user: str = Depends(admin_auth)):
+    """가장 느렸던 요청들의 구간 기록 (느린 순)"""
+    return {"capacity": slow_traces.capacity, "traces": slow_traces.slowest()}
+
+
+@app.delete("/admin/traces")
+def clear_traces(user: str = Depends(admin_auth)):
+    slow_traces.clear()
+    return {"result": "cleared"}
+
+
+@app.get("/admin/mirror")
+def mirror_stats(user: str = Depends(admin_auth)):
+    stats = {source: mirror.stats() for source, mirror in issue_mirrors.items()}
+    stats["public_feed"] = feed_publisher.stats()
+    stats["publish"] = issue_projector.stats()
+    stats["ordering"] = order_rebalancer.stats()
+    stats["results"] = results_freezer.stats()
+    stats["leader"] = leader_watchdog.stats()
+    return stats
+
+
+@app.get("/admin/cleanup")
+def cleanup_jobs(user: str = Depends(admin_auth)):
+    """안건 삭제 뒤 투표 응답/집계 정리 작업의 진행 상황"""
+    return cascade_deleter.stats()
+
+
+@app.post("/admin/cleanup/{issue_id}", status_code=status.HTTP_202_ACCEPTED)
+async def start_cleanup(issue_id: str, user: str = Depends(admin_auth)):
+    """이미 지운 안건의 남은 투표 응답/집계를 지운다 (이 기능 전에 지운 안건 등)"""
+    try:
+        (issue,) = await repository.get_documents("issues", [issue_id])
+        if issue is not None:
+            raise HTTPException(
+                status_code=status.HTTP_409_CONFLICT,
+                detail="안건이 아직 있습니다. 안건을 먼저 삭제하세요",
+            )
+        return await cascade_deleter.enqueue(issue_id)
+    except RepositoryError as e:
+        raise HTTPException(status_code=502, detail=f"정리 작업 등록 실패: {e}")
+
+
+@app.post("/admin/results/{issue_id}/freeze")
+async def freeze_results(issue_id: str, user: str = Depends(admin_auth)):
+    """마감된 안건의 최종 결과를 지금 확정한다 (이미 있으면 있는 것을 돌려준다)"""
+    try:
+        (data,) = await repository.get_public_issues([issue_id])
+        issue = None if data is None else normalize_public_issue(issue_id, data)
+        if issue is None or issue["type"] not in VOTE_TYPES:
+            raise HTTPException(status_code=404, detail="투표/설문 안건이 없습니다")
+        if issue["status"] != "closed":
+            raise HTTPException(
+                status_code=status.HTTP_409_CONFLICT, detail="마감된 안건만 확정할 수 있습니다"
+            )
+        return serialize_results(await results_freezer.freeze(issue_id, issue["options"]))
+    except RepositoryError as e:
+        raise HTTPException(status_code=502, detail=f"최종 결과 확정 실패: {e}")
+
+
+@app.post("/admin/publish")
+async def publish_issues(user: str = Depends(admin_auth)):
+    """issues 전체를 issues_public 과 비교해서 달라진 문서만 다시 쓴다."""
+    require_watch()
+    try:
+        return await asyncio.to_thread(issue_projector.publish_all)
+    except GoogleAPICallError as e:
+        raise HTTPException(status_code=502, detail=f"공개본 동기화 실패: {e}")
+
+
+def export_response(
+    collection: str,
+    to_records,
+    fmt: str,
+    columns: tuple,
+    after: str | None,
+    limit: int | None,
+    filename: str,
+):
+    """collection 을 문서 id 순으로 페이지씩 읽어 chunked 응답으로 흘려보낸다"""
+    media_type, extension = EXPORT_FORMATS[fmt]
+
+    async def fetch_page(cursor, size):
+        return await repository.page_documents(collection, cursor, size)
+
+    return StreamingResponse(
+        stream_export(
+            fetch_page,
+            to_records,
+            fmt,
+            columns,
+            after=after,
+            page_size=EXPORT_PAGE_SIZE,
+            limit=limit,
+        ),
+        media_type=media_type,
+        headers={
+            "Content-Disposition": content_disposition(f"{filename}.{extension}"),
+            "Cache-Control": "no-store",
+        },
+    )
+
+
+@app.get("/admin/export/issues")
+def export_issues(
+    format: Literal["ndjson", "csv"] = "ndjson",
+    after: str | None = Query(None, description="이어 받기: 마지막으로 받은 안건 id"),
+    limit: int | None = Query(None, ge=1, description="최대 문서 수"),
+    user: str = Depends(admin_auth),
+):
+    return export_response(
+        "issues",
+        lambda doc_id, data: [{"id": doc_id, **data}],
+        format,
+        EXPORT_ISSUE_COLUMNS,
+        after,
+        limit,
+        "issues",
+    )
+
+
+@app.get("/admin/export/issues/{issue_id}/ballots")
+def export_ballots(
+    issue_id: str,
+    format: Literal["ndjson", "csv"] = "ndjson",
+    after: str | None = Query(None, description="이어 받기: 마지막으로 받은 uid"),
+    limit: int | None = Query(None, ge=1, description="최대 문서 수"),
+    user: str = Depends(admin_auth),
+):
+    def to_records(uid, data):
+        ballot = serialize_ballot(data)
+        # 예전 응답 문서에는 uid / issueId 필드가 없을 수 있다
+        ballot["uid"] = ballot["uid"] or uid
+        ballot["issueId"] = ballot["issueId"] or issue_id
+        # 예전 앱의 choice(yes/no/hold)는 찬성/반대/보류 선택지로도 보여준다
+        ballot["selectedOptions"] = [str(x) for x in ballot_selections(data)]
+        return [ballot]
+
+    return export_response(
+        ballots_collection(issue_id),
+        to_records,
+        format,
+        EXPORT_BALLOT_COLUMNS,
+        after,
+        limit,
+        f"ballots-{issue_id}",
+    )
+
+
+@app.get("/admin/export/stats")
+def export_stats(
+    format: Literal["ndjson", "csv"] = "ndjson",
+    after: str | None = Query(None, description="이어 받기: 마지막으로 받은 안건 id"),
+    limit: int | None = Query(None, ge=1, description="최대 문서 수"),
+    user: str = Depends(admin_auth),
+):
+    def to_records(issue_id, data):
+        summary = summarize_vote_stats(data)
+        if format == "ndjson":
+            return [{"issueId": issue_id, **summary}]
+        # CSV 는 선택지마다 한 행
+        rows = [
             {
-                "id": d.id,  # 👈 추가!
-                "title": data.get("title", ""),
-                "summary": data.get("summary", ""),
-                "company": data.get("company", ""),
-                "union": data.get("union_opt", ""),
+                "issueId": issue_id,
+                "total": summary["total"],
+                "option": option["label"],
+                "count": option["count"],
             }
+            for option in summary["options"]
+        ]
+        return rows or [{"issueId": issue_id, "total": summary["total"]}]
+
+    return export_response(
+        "vote_stats", to_records, format, EXPORT_STATS_COLUMNS, after, limit, "vote_stats"
+    )
+
+
+@app.get("/issues/stream")
+async def stream_issues(
+    request: Request,
+    source: Literal["issues", "issues_public"] = "issues",
+    last_event_id: str | None = Header(None),
+):
+    require_watch()
+    hub = await ensure_issue_listener(source)
+    # EventSource 가 아닌 클라이언트는 쿼리로도 이어받기 지점을 줄 수 있다
+    resume_from = last_event_id or request.query_params.get("last_event_id")
+    queue, backlog = hub.subscribe(resume_from)
+
+    async def event_source():
+        try:
+            yield "retry: 5000\n\n"
+
+            if backlog is None:
+                # 이어받을 수 없으면 전체를 다시 읽으라고 알린다
+                yield format_sse(hub.last_event_id, "reset", {})
+            else:
+                for message in backlog:
+                    yield message
+
+            while True:
+                try:
+                    message = await asyncio.wait_for(queue.get(), SSE_HEARTBEAT_SEC)
+                except asyncio.TimeoutError:
+                    yield ": ping\n\n"
+                    continue
+
+                if message is None:
+                    break
+                yield message
+        finally:
+            hub.unsubscribe(queue)
+
+    return StreamingResponse(
+        event_source(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
+
+
+# 투표 집계 실시간 방송 (안건별 최대 250ms 에 1번)
+VOTE_WS_INTERVAL_SEC = float(os.getenv("VOTE_WS_INTERVAL_SEC", "0.25"))
+VOTE_WS_MAX_SUBSCRIPTIONS = int(os.getenv("VOTE_WS_MAX_SUBSCRIPTIONS", "50"))
+vote_results_hub = VoteResultsHub(interval=VOTE_WS_INTERVAL_SEC)
+
+
+def revoke_hidden_vote_results(changes):
+    # 결과 공개 정책이 바뀌거나(after_close 로 재개, admin_only 등) 안건이 내려가면 구독을 끊는다
+    hidden = [
+        change.document.id
+        for change in changes
+        if change.type.name == "REMOVED"
+        or not stats_readable(
+            normalize_public_issue(change.document.id, change.document.to_dict() or {})
         )
+    ]
+    if hidden:
+        vote_results_hub.schedule_revoke(hidden)
 
-    return results
 
+issue_mirrors["issues_public"].add_listener(revoke_hidden_vote_results)
+
+
+def ensure_vote_listener() -> VoteResultsHub:
+    vote_results_hub.start(get_watch_db().collection("vote_stats"))
+    return vote_results_hub
+
+
+@app.websocket("/ws/votes")
+async def vote_results_ws(websocket: WebSocket):
+    """
+    접속: Authorization: Bearer <ID 토큰> 헤더 또는 ?token=<ID 토큰> (브라우저)
+    클라이언트 -> 서버: {"subscribe": [issueId, ...]} / {"unsubscribe": [issueId, ...]}
+    서버 -> 클라이언트: {"type": "stats", "issueId": ..., "stats": {"total", "options"}}
+                      {"type": "revoked", "issueId": ...} (결과를 볼 수 없는 안건. 구독하지 않음/끊음)
+    """
+    if not repository.supports_watch:
+        await websocket.close(code=1013)
+        return
+
+    scheme, _, token = (websocket.headers.get("authorization") or "").partition(" ")
+    try:
+        await verify_mobile_token(
+            token if scheme.lower() == "bearer" else websocket.query_params.get("token")
+        )
+    except HTTPException:
+        await websocket.close(code=1008)
+        return
+
+    await websocket.accept()
+    hub = ensure_vote_listener()
+    # 공개 정책 변경을 보려고 이 워커에서도 issues_public 미러를 띄운다 (이미 떠 있으면 그대로)
+    issue_mirrors["issues_public"].start(get_watch_db().collection("issues_public"))
+    subscriber = VoteSubscriber()
+
+    async def sender():
+        while True:
+            for frame in await subscriber.next_frames():
+                await websocket.send_json(frame)
+
+    send_task = asyncio.create_task(sender())
+
+    try:
+        while True:
+            try:
+                message = await websocket.receive_json()
+            except ValueError:
+                continue
+
+            if not isinstance(message, dict):
+                continue
+
+            remaining = VOTE_WS_MAX_SUBSCRIPTIONS - len(subscriber.issue_ids)
+            subscribe_ids = [str(x) for x in message.get("subscribe") or []]
+            subscribe_ids = subscribe_ids[: max(0, remaining)]
+            if subscribe_ids:
+                issues = await load_public_issues_by_id(subscribe_ids)
+                readable = [x["id"] for x in issues if stats_readable(x)]
+                hub.subscribe(subscriber, readable)
+                for issue_id in set(subscribe_ids) - set(readable):
+                    subscriber.offer(issue_id, revoked_frame(issue_id))
+            hub.unsubscribe(
+                subscriber, [str(x) for x in message.get("unsubscribe") or []]
+            )
+    except WebSocketDisconnect:
+        pass
+    finally:
+        send_task.cancel()
+        hub.unsubscribe(subscriber)
+
+
+async def order_key_after(after_id: str | None, moving: str | None = None) -> str:
+    """after_id 바로 뒤(None 이면 맨 앞)에 올 정렬 키. 키가 없거나 겹치면 ValueError"""
+    lower = None
+    cursor = None
+    if after_id is not None:
+        (after,) = await repository.get_documents("issues", [after_id])
+        if after is None:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND, detail=f"after 안건이 없습니다: {after_id}"
+            )
+        lower = after.get(ORDER_KEY_FIELD)
+        if not is_order_key(lower):
+            raise ValueError(f"{after_id} 에 정렬 키가 없습니다")
+        cursor = (lower, after_id)
+
+    # 바로 다음 안건 (옮기는 안건 자신은 빼고)
+    rows, _ = await repository.list_issues(None, cursor, 2, [ORDER_KEY_FIELD])
+    upper = next(
+        (data.get(ORDER_KEY_FIELD) for doc_id, data in rows if doc_id != moving), None
+    )
+    return key_between(lower, upper)
+
+
+async def new_order_key(after_id: str | None = None, moving: str | None = None, end=False):
+    """
+    새 정렬 키. end 면 맨 끝, 아니면 after_id 바로 뒤. 옮기는 문서 하나만 쓰면 된다.
+    키가 겹치거나 비어 있으면 리더의 재배치를 앞당기고 409 (요청 안에서 전체를 다시 나누지 않는다)
+    """
+    try:
+        if end:
+            return key_between(await repository.last_order_key(), None)
+        return await order_key_after(after_id, moving)
+    except ValueError:
+        order_rebalancer.schedule()
+        raise HTTPException(
+            status_code=status.HTTP_409_CONFLICT,
+            detail="정렬 키를 만들 수 없습니다. 잠시 뒤 다시 시도하세요",
+            headers={"Retry-After": str(ORDER_KEY_RETRY_AFTER_SEC)},
+        )
 
-@app.post("/issues")
-def create_issue(issue: IssueCreate):
-    print("🔥 POST /issues 호출됨")
-    print("🔥 받은 데이터:", issue)
 
-    doc_ref = db.collection("issues").document()
+async def batch_order_keys(moves: list, creates: list) -> tuple:
+    """
+    배치 안의 reorder / create 에 정렬 키를 붙인다. 앞 연산이 옮긴 자리를 뒤 연산이 본다.
+    moves: [(index, issue_id, after_id)] (after_id 가 None 이면 맨 앞), creates: [index]
+    -> ({index: 정렬 키}, {index: 오류 메시지})
+    """
+    assigned = {}
+    keys = {}
+    errors = {}
 
-    doc_ref.set(
+    for index, issue_id, after_id in moves:
+        try:
+            lower = None
+            cursor = None
+            if after_id is not None:
+                lower = assigned.get(after_id)
+                if lower is None:
+                    (after,) = await repository.get_documents("issues", [after_id])
+                    if after is None:
+                        raise ValueError(f"after 안건이 없습니다: {after_id}")
+                    lower = after.get(ORDER_KEY_FIELD)
+                    if not is_order_key(lower):
+                        raise ValueError(
+                            f"{after_id} 에 정렬 키가 없습니다. 잠시 뒤 다시 시도하세요"
+                        )
+                cursor = (lower, after_id)
+
+            # 저장소의 바로 다음 안건들 (이 배치에서 이미 옮긴 안건은 저장된 키가 낡았으므로 빼고 본다)
+            moved = set(assigned) | {issue_id}
+            rows, _ = await repository.list_issues(None, cursor, len(moved) + 1, [ORDER_KEY_FIELD])
+            candidates = [
+                data[ORDER_KEY_FIELD]
+                for doc_id, data in rows
+                if doc_id not in moved and is_order_key(data.get(ORDER_KEY_FIELD))
+            ]
+            candidates += [
+                key
+                for doc_id, key in assigned.items()
+                if doc_id != issue_id and (lower is None or key > lower)
+            ]
+            key = key_between(lower, min(candidates, default=None))
+        except ValueError as e:
+            errors[index] = str(e)
+            continue
+        assigned[issue_id] = key
+        keys[index] = key
+
+    # 새 안건은 보낸 순서대로 맨 끝에 (이 배치에서 맨 끝으로 옮긴 안건보다도 뒤)
+    if creates:
+        last = max(
+            filter(None, [await repository.last_order_key(), *assigned.values()]), default=None
+        )
+        for index in creates:
+            last = key_between(last, None)
+            keys[index] = last
+
+    return keys, errors
+
+
+@app.post("/issues")
+async def create_issue(
+    issue: IssueCreate,
+    after: str | None = Query(None, description="이 안건 바로 뒤에 넣는다 (없으면 맨 끝)"),
+):
+    order_key = await new_order_key(after, end=after is None)
+    issue_id = await repository.create_issue(
         {
             "title": issue.title,
             "summary": issue.summary,
             "company": issue.company,
             "union_opt": issue.union_opt,
             "order": issue.order,
+            ORDER_KEY_FIELD: order_key,
             "updated_at": datetime.utcnow(),
         }
     )
 
-    print("🔥 Firestore set() 실행 완료, id =", doc_ref.id)
+    logger.info("안건 생성", extra={"issue_id": issue_id})
+    await invalidate_issues_cache()
 
-    return {"status": "ok", "id": doc_ref.id}
+    return {"status": "ok", "id": issue_id}
 
 
-@app.delete("/issues/{issue_id}")
-def delete_issue(issue_id: str):
-    doc_ref = db.collection("issues").document(issue_id)
-    doc = doc_ref.get()
+def prepare_batch_operation(op: IssueBatchOperation):
+    """배치 연산 하나를 검증해서 (kind, issue_id, data) 로 바꾼다. 잘못된 연산은 ValueError."""
+    if op.op == "create":
+        issue = IssueCreate(**op.data)
+        issue_id = op.id or repository.new_issue_id()
+        return "create", issue_id, {**issue.model_dump(), "updated_at": datetime.utcnow()}
+
+    if not op.id:
+        raise ValueError(f"{op.op} 연산에는 id 가 필요합니다")
+
+    if op.op == "delete":
+        return "delete", op.id, None
+
+    if op.op == "reorder":
+        # 목록은 order_key 로 정렬하므로 예전 order 만 바꾸면 아무 효과가 없다
+        if "after" not in op.model_fields_set:
+            raise ValueError(
+                "reorder 연산에는 after 가 필요합니다 (맨 앞은 null, order 는 더 이상 쓰지 않음)"
+            )
+        if op.after == op.id:
+            raise ValueError("자기 자신 뒤로는 옮길 수 없습니다")
+        # 정렬 키는 batch_order_keys 가 채운다
+        return "update", op.id, {"updated_at": datetime.now()}
 
-    if not doc.exists:
-        return {"error": "not found"}
+    # 보낸 필드만 쓴다 (알 수 없는 필드는 IssuePatch 가 거부)
+    data = IssuePatch(**op.data).model_dump(exclude_unset=True, exclude_none=True)
+    if not data:
+        raise ValueError("update 연산에 변경할 필드가 없습니다")
+    return "update", op.id, {**data, "updated_at": datetime.now()}
+
+
+async def batch_existence_errors(prepared: list) -> dict:
+    """
+    update / reorder / delete 대상이 없거나 create 할 id 가 이미 있으면 그 연산만 실패로 고른다.
+    (WriteBatch 는 하나만 실패해도 묶음 전체가 실패하므로 커밋 전에 미리 거른다)
+    배치 안의 앞 연산(create / delete)이 만든 상태를 뒤 연산이 본다. -> {index: 오류 메시지}
+    """
+    issue_ids = list(dict.fromkeys(issue_id for _, _, _, issue_id, _ in prepared))
+    stored = await repository.get_documents("issues", issue_ids)
+    exists = {issue_id: data is not None for issue_id, data in zip(issue_ids, stored)}
+
+    errors = {}
+    for index, _, kind, issue_id, _ in prepared:
+        if kind == "create" and exists[issue_id]:
+            errors[index] = f"이미 있는 안건입니다: {issue_id}"
+        elif kind != "create" and not exists[issue_id]:
+            errors[index] = f"안건이 없습니다: {issue_id}"
+        else:
+            exists[issue_id] = kind != "delete"
+    return errors
+
+
+@app.post("/issues:batch")
+async def batch_issues(payload: IssueBatchRequest):
+    operations = payload.operations
+    if len(operations) > ISSUES_BATCH_MAX_OPS:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"한 번에 최대 {ISSUES_BATCH_MAX_OPS}개 연산까지 가능합니다",
+        )
+
+    results = [None] * len(operations)
+    prepared = []
+
+    for index, op in enumerate(operations):
+        try:
+            kind, issue_id, data = prepare_batch_operation(op)
+        except ValueError as e:
+            results[index] = {
+                "index": index,
+                "op": op.op,
+                "id": op.id,
+                "status": "error",
+                "error": str(e),
+            }
+            continue
+        prepared.append((index, op, kind, issue_id, data))
 
-    doc_ref.delete()
+    errors = await batch_existence_errors(prepared) if prepared else {}
+    for index, op, _, issue_id, _ in prepared:
+        if index in errors:
+            results[index] = {
+                "index": index,
+                "op": op.op,
+                "id": issue_id,
+                "status": "error",
+                "error": errors[index],
+            }
+    prepared = [x for x in prepared if x[0] not in errors]
+
+    keys, errors = await batch_order_keys(
+        [
+            (index, issue_id, op.after)
+            for index, op, _, issue_id, _ in prepared
+            if op.op == "reorder"
+        ],
+        [index for index, _, kind, _, _ in prepared if kind == "create"],
+    )
+    for index, op, _, issue_id, data in prepared:
+        if index in errors:
+            results[index] = {
+                "index": index,
+                "op": op.op,
+                "id": issue_id,
+                "status": "error",
+                "error": errors[index],
+            }
+        elif index in keys:
+            data[ORDER_KEY_FIELD] = keys[index]
+    prepared = [x for x in prepared if x[0] not in errors]
+
+    committed = False
+    deleted = []
+
+    # 묶음 단위로 원자적이다 (Firestore WriteBatch). 없는 안건 / 중복 create 는 위에서 걸렀으므로
+    # 여기서 실패하는 건 저장소 오류나 그 사이 다른 요청과의 경합이고, 그 묶음 전체가 error 가 된다
+    for start in range(0, len(prepared), FIRESTORE_BATCH_SIZE):
+        chunk = prepared[start : start + FIRESTORE_BATCH_SIZE]
+
+        error = None
+        try:
+            await repository.commit_issue_writes(
+                [(kind, issue_id, data) for _, _, kind, issue_id, data in chunk]
+            )
+            committed = True
+        except RepositoryError as e:
+            logger.warning(
+                "batch commit 실패", extra={"operations": len(chunk), "error": str(e)}
+            )
+            error = str(e)
+
+        for index, op, kind, issue_id, _ in chunk:
+            result = {"index": index, "op": op.op, "id": issue_id}
+            if error is None:
+                result["status"] = "ok"
+                if kind == "delete":
+                    deleted.append(issue_id)
+            else:
+                result.update({"status": "error", "error": error})
+            results[index] = result
+
+    # 묶음이 몇 개든 캐시는 한 번만 비운다
+    if committed:
+        await invalidate_issues_cache()
+    await start_cascade_delete(deleted)
+
+    succeeded = sum(1 for r in results if r["status"] == "ok")
+    return {
+        "ok": succeeded,
+        "failed": len(results) - succeeded,
+        "results": results,
+    }
+
+
+@contextmanager
+def repository_write_errors():
+    """
+    저장소 예외를 HTTP 상태로 바꾼다.
+    last_update_time 이 있으면 저장소가 '마지막 수정 시각이 같아야 함' 조건으로 쓴다 (낙관적 동시성 제어)
+    """
+    try:
+        yield
+    except ValueError:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="last_update_time 은 RFC3339 형식이어야 합니다 (예: 2026-01-01T00:00:00.123456Z)",
+        )
+    except DocumentNotFound:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="not found")
+    except PreconditionFailed:
+        raise HTTPException(
+            status_code=status.HTTP_412_PRECONDITION_FAILED,
+            detail="다른 곳에서 먼저 수정되었습니다. 다시 불러온 뒤 시도하세요",
+        )
+
+
+@app.delete("/issues/{issue_id}")
+async def delete_issue(issue_id: str, last_update_time: str | None = None):
+    with repository_write_errors():
+        await repository.delete_issue(issue_id, last_update_time)
+
+    await invalidate_issues_cache()
+    await start_cascade_delete([issue_id])
     return {"result": "deleted"}
 
 
+async def start_cascade_delete(issue_ids: list) -> None:
+    """삭제된 안건의 투표 응답/집계 정리를 뒤에서 시작한다 (안건 삭제 자체는 이미 끝났다)"""
+    for issue_id in issue_ids:
+        try:
+            await cascade_deleter.enqueue(issue_id)
+        except RepositoryError as e:
+            # POST /admin/cleanup/{id} 로 다시 시작할 수 있다
+            logger.warning(
+                "연쇄 삭제 작업 등록 실패", extra={"issue_id": issue_id, "error": str(e)}
+            )
+
+
+async def write_issue_update(issue_id: str, data: dict, last_update_time: str | None):
+    with repository_write_errors():
+        update_time = await repository.update_issue(
+            issue_id, {**data, "updated_at": datetime.now()}, last_update_time
+        )
+
+    await invalidate_issues_cache()
+    return update_time
+
+
+@app.post("/issues/{issue_id}:move")
+async def move_issue(issue_id: str, move: IssueMove, last_update_time: str | None = None):
+    """정렬 키만 바꿔서 옮긴다 (다른 안건의 순서는 그대로, 쓰기는 이 문서 하나)"""
+    if move.after == issue_id:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST, detail="자기 자신 뒤로는 옮길 수 없습니다"
+        )
+
+    order_key = await new_order_key(move.after, moving=issue_id)
+    update_time = await write_issue_update(
+        issue_id, {ORDER_KEY_FIELD: order_key}, last_update_time
+    )
+    return {"result": "moved", "order_key": order_key, "update_time": update_time}
+
+
 @app.put("/issues/{issue_id}")
-def update_issue(issue_id: str, issue: IssueUpdate):
-    ref = db.collection("issues").document(issue_id)
+async def update_issue(
+    issue_id: str, issue: IssueUpdate, last_update_time: str | None = None
+):
+    update_time = await write_issue_update(
+        issue_id, issue.model_dump(), last_update_time
+    )
+    return {"result": "updated", "update_time": update_time}
 
-    if not ref.get().exists:
-        return {"error": "not found"}
 
-    ref.update(
-        {
-            "title": issue.title,
-            "summary": issue.summary,
-            "company": issue.company,
-            "union_opt": issue.union_opt,
-            "order": issue.order,
-            "updated_at": datetime.now(),
-        }
+@app.patch("/issues/{issue_id}")
+async def patch_issue(
+    issue_id: str, issue: IssuePatch, last_update_time: str | None = None
+):
+    data = issue.model_dump(exclude_unset=True, exclude_none=True)
+    if not data:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST, detail="변경할 필드가 없습니다"
+        )
+
+    update_time = await write_issue_update(issue_id, data, last_update_time)
+    return {"result": "updated", "update_time": update_time}
+
+
+async def load_public_issues() -> list:
+    """공개 안건 목록 (모바일 정규화/필터/정렬 적용). 미러가 준비됐으면 읽기 없이 만든다."""
+    mirror = issue_mirrors["issues_public"]
+    if mirror.ready:
+        return build_feed(mirror.values())
+
+    return build_feed(await repository.list_public_issues())
+
+
+def private_json(request: Request, body: bytes, etag: str):
+    """사용자별 응답: 공유 캐시에는 남기지 않는다 (압축은 CompressionMiddleware 가 한다)"""
+    headers = {
+        "ETag": etag,
+        "Cache-Control": "private, no-cache",
+        "Vary": "Accept-Encoding, Authorization",
+    }
+
+    if etag_matches(request.headers.get("if-none-match"), etag):
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+
+    return Response(content=body, media_type="application/json", headers=headers)
+
+
+@app.get("/mobile/bootstrap")
+async def mobile_bootstrap(request: Request, uid: str = Depends(mobile_user)):
+    """
+    앱 첫 화면에 필요한 것을 한 번에 돌려준다.
+    issues / version(meta/version) / ballots(내 응답) / stats(결과 공개된 투표 집계)
+    """
+    issues = await load_public_issues()
+    vote_ids = vote_issue_ids(issues)
+    stats_ids = stats_issue_ids(issues)
+    # 마감된 안건은 확정된 최종 결과를, 진행 중인 안건은 실시간 집계를 읽는다
+    closed = {x["id"] for x in issues if x["status"] == "closed"}
+    final_ids = [x for x in stats_ids if x in closed]
+    live_ids = [x for x in stats_ids if x not in closed]
+
+    version, ballots, results, stats = await asyncio.gather(
+        repository.get_version_meta(),
+        repository.get_ballots(vote_ids, uid),
+        repository.get_documents(RESULTS_COLLECTION, final_ids),
+        repository.get_stats(live_ids),
+    )
+    results = dict(zip(final_ids, results))
+    stats = dict(zip(live_ids, stats))
+
+    # 마감 직후 아직 확정 전이면 실시간 집계로 대신한다
+    pending = [issue_id for issue_id, data in results.items() if data is None]
+    if pending:
+        stats.update(zip(pending, await repository.get_stats(pending)))
+        schedule_pending_results([x for x in issues if x["id"] in pending])
+
+    payload = build_bootstrap(
+        issues,
+        version,
+        dict(zip(vote_ids, ballots)),
+        stats,
+        {issue_id: data for issue_id, data in results.items() if data is not None},
+    )
+    return private_json(request, dump_json(payload), compute_etag(payload))
+
+
+def schedule_pending_results(issues: list) -> None:
+    # 리스너가 놓친 경우(미러를 안 쓰는 배포 등)에도 첫 읽기에서 확정되도록
+    for issue in issues:
+        results_freezer.schedule(issue["id"], issue["options"])
+
+
+async def load_public_issues_by_id(issue_ids: list) -> list:
+    """보이는 공개 안건만 (초안/비활성 안건은 피드(build_feed)와 마찬가지로 없는 것으로 본다)"""
+    mirror = issue_mirrors["issues_public"]
+    if mirror.ready:
+        rows = [mirror.get(x) for x in issue_ids]
+    else:
+        rows = await repository.get_public_issues(issue_ids)
+
+    issues = [
+        normalize_public_issue(issue_id, data)
+        for issue_id, data in zip(issue_ids, rows)
+        if data is not None
+    ]
+    return [x for x in issues if is_visible(x)]
+
+
+async def load_public_issue(issue_id: str) -> dict | None:
+    issues = await load_public_issues_by_id([issue_id])
+    return issues[0] if issues else None
+
+
+@app.get("/issues/{issue_id}/results")
+async def get_issue_results(request: Request, issue_id: str):
+    """
+    투표/설문 결과. 마감 후 확정된 결과는 문서 하나만 읽고, 클라이언트가 잠깐 캐시한다.
+    확정 전(진행 중)에는 실시간 집계를 final=false 로 돌려준다 (캐시하지 않음)
+    """
+    try:
+        issue = await load_public_issue(issue_id)
+        if not stats_readable(issue):
+            raise HTTPException(status_code=404, detail="결과를 볼 수 없는 안건입니다")
+
+        if issue["status"] == "closed":
+            (data,) = await repository.get_documents(RESULTS_COLLECTION, [issue_id])
+            if data is not None:
+                etag = f'"{data.get("checksum")}"'
+                headers = {"ETag": etag, "Cache-Control": FINAL_RESULTS_CACHE_CONTROL}
+                if etag_matches(request.headers.get("if-none-match"), etag):
+                    return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+                return Response(
+                    content=dump_json(serialize_results(data)),
+                    media_type="application/json",
+                    headers=headers,
+                )
+            schedule_pending_results([issue])
+
+        (data,) = await repository.get_stats([issue_id])
+    except RepositoryError as e:
+        raise HTTPException(status_code=502, detail=f"결과 조회 실패: {e}")
+
+    return Response(
+        content=dump_json({"final": False, **summarize_vote_stats(data)}),
+        media_type="application/json",
+        headers={"Cache-Control": "no-cache"},
     )
 
-    return {"result": "updated"}
+
+async def read_operation(op: ReadOperation, uid: str):
+    if op.op == "version":
+        return serialize_version_meta(await repository.get_version_meta())
+
+    if not op.id:
+        raise ValueError(f"{op.op} 연산에는 id 가 필요합니다")
+
+    if op.op == "issue":
+        return await load_public_issue(op.id)
+
+    if op.op == "ballot":
+        (data,) = await repository.get_ballots([op.id], uid)
+        return serialize_ballot(data)
+
+    # 결과 공개 정책은 /mobile/bootstrap, /issues/{id}/results 와 같다 (볼 수 없으면 None)
+    issue = await load_public_issue(op.id)
+    if not stats_readable(issue):
+        return None
+    if issue["status"] == "closed":
+        (data,) = await repository.get_documents(RESULTS_COLLECTION, [op.id])
+        if data is not None:
+            return serialize_results(data)
+
+    (data,) = await repository.get_stats([op.id])
+    return summarize_vote_stats(data)
+
+
+@app.post("/batch")
+async def read_batch(payload: ReadBatchRequest, uid: str = Depends(mobile_user)):
+    """
+    화면 하나에 필요한 읽기(issue / ballot / stats / version)를 한 요청으로 받아 동시에 실행한다.
+    결과는 요청 순서대로, 연산마다 ok / data 또는 error
+    """
+    operations = payload.operations
+    if len(operations) > READ_BATCH_MAX_OPS:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"한 번에 최대 {READ_BATCH_MAX_OPS}개 연산까지 가능합니다",
+        )
+
+    outcomes = await asyncio.gather(
+        *(read_operation(op, uid) for op in operations), return_exceptions=True
+    )
+
+    results = []
+    for op, outcome in zip(operations, outcomes):
+        result = {"op": op.op, "id": op.id}
+        if isinstance(outcome, (ValueError, RepositoryError)):
+            result.update(ok=False, error=str(outcome))
+        elif isinstance(outcome, BaseException):
+            raise outcome
+        else:
+            result.update(ok=True, data=outcome)
+        results.append(result)
+
+    return {"results": results}
@@ -0,0 +1,317 @@
+import asyncio
+import contextvars
+import logging
+import threading
+import time
+
+from starlette.routing import Match
+
+from .tracing import add_span
+
+logger = logging.getLogger(__name__)
+
+# 초 단위 지연 구간 (Prometheus 기본값에 가까운 값)
+DEFAULT_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+
+def _escape(value) -> str:
+    return str(value).replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _format_labels(names: tuple, values: tuple, extra: dict | None = None) -> str:
+    pairs = [f'{name}="{_escape(value)}"' for name, value in zip(names, values)]
+    pairs += [f'{name}="{_escape(value)}"' for name, value in (extra or {}).items()]
+    return "{" + ",".join(pairs) + "}" if pairs else ""
+
+
+def _format_value(value) -> str:
+    if value == float("inf"):
+        return "+Inf"
+    return repr(value) if isinstance(value, float) else str(value)
+
+
+class _Metric:
+    kind = ""
+
+    def __init__(self, name: str, help_text: str, labelnames: tuple = ()):
+        self.name = name
+        self.help = help_text
+        self.labelnames = tuple(labelnames)
+        self._values = {}
+        self._lock = threading.Lock()
+
+    def header(self) -> list:
+        return [f"# HELP {self.name} {self.help}", f"# TYPE {self.name} {self.kind}"]
+
+
+class Counter(_Metric):
+    kind = "counter"
+
+    def inc(self, labels: tuple = (), amount: float = 1) -> None:
+        with self._lock:
+            self._values[labels] = self._values.get(labels, 0) + amount
+
+    def render(self) -> list:
+        lines = self.header()
+        with self._lock:
+            for labels, value in sorted(self._values.items()):
+                lines.append(
+                    f"{self.name}{_format_labels(self.labelnames, labels)} {_format_value(value)}"
+                )
+        return lines
+
+
+class Gauge(Counter):
+    kind = "gauge"
+
+    def dec(self, labels: tuple = (), amount: float = 1) -> None:
+        self.inc(labels, -amount)
+
+    def set(self, labels: tuple = (), value: float = 0) -> None:
+        with self._lock:
+            self._values[labels] = value
+
+
+class Histogram(_Metric):
+    kind = "histogram"
+
+    def __init__(self, name, help_text, labelnames=(), buckets=DEFAULT_BUCKETS):
+        super().__init__(name, help_text, labelnames)
+        self.buckets = tuple(sorted(buckets)) + (float("inf"),)
+
+    def observe(self, labels: tuple, value: float) -> None:
+        with self._lock:
+            entry = self._values.get(labels)
+            if entry is None:
+                entry = self._values[labels] = [[0] * len(self.buckets), 0.0, 0]
+            for i, bound in enumerate(self.buckets):
+                if value <= bound:
+                    entry[0][i] += 1
+                    break
+            entry[1] += value
+            entry[2] += 1
+
+    def render(self) -> list:
+        lines = self.header()
+        with self._lock:
+            items = sorted((k, (list(v[0]), v[1], v[2])) for k, v in self._values.items())
+
+        for labels, (counts, total, count) in items:
+            cumulative = 0
+            for bound, bucket_count in zip(self.buckets, counts):
+                cumulative += bucket_count
+                label_text = _format_labels(
+                    self.labelnames, labels, {"le": _format_value(bound)}
+                )
+                lines.append(f"{self.name}_bucket{label_text} {cumulative}")
+            label_text = _format_labels(self.labelnames, labels)
+            lines.append(f"{self.name}_sum{label_text} {_format_value(total)}")
+            lines.append(f"{self.name}_count{label_text} {count}")
+        return lines
+
+
+class Registry:
+    def __init__(self):
+        self._metrics = []
+        self._collectors = []
+
+    def counter(self, *args, **kwargs) -> Counter:
+        return self._add(Counter(*args, **kwargs))
+
+    def gauge(self, *args, **kwargs) -> Gauge:
+        return self._add(Gauge(*args, **kwargs))
+
+    def histogram(self, *args, **kwargs) -> Histogram:
+        return self._add(Histogram(*args, **kwargs))
+
+    def _add(self, metric):
+        self._metrics.append(metric)
+        return metric
+
+    def add_collector(self, collect) -> None:
+        """collect() -> [Gauge/Counter ...]  /metrics 를 읽을 때마다 새로 만든 값"""
+        self._collectors.append(collect)
+
+    def render(self) -> str:
+        lines = []
+        for metric in self._metrics:
+            lines += metric.render()
+        for collect in self._collectors:
+            try:
+                for metric in collect():
+                    lines += metric.render()
+            except Exception:
+                logger.exception("metrics collector 오류")
+        return "\n".join(lines) + "\n"
+
+
+registry = Registry()
+
+http_requests = registry.counter(
+    "http_requests_total", "HTTP 요청 수", ("method", "route", "status")
+)
+http_duration = registry.histogram(
+    "http_request_duration_seconds", "HTTP 요청 처리 시간", ("method", "route", "status")
+)
+http_in_flight = registry.gauge(
+    "http_requests_in_flight", "처리 중인 HTTP 요청 수", ("method", "route")
+)
+firestore_rpcs = registry.counter(
+    "firestore_rpcs_total", "Firestore RPC 수", ("route",)
+)
+firestore_seconds = registry.counter(
+    "firestore_seconds_total", "Firestore RPC 에 쓴 시간 (슬롯 대기 제외)", ("route",)
+)
+firestore_wait_seconds = registry.counter(
+    "firestore_slot_wait_seconds_total", "Firestore 동시 호출 슬롯을 기다린 시간", ("route",)
+)
+firestore_reads = registry.counter(
+    "firestore_documents_read_total", "Firestore 에서 읽은 문서 수", ("route",)
+)
+firestore_writes = registry.counter(
+    "firestore_documents_written_total", "Firestore 에 쓴 문서 수", ("route",)
+)
+
+
+class RequestStats:
+    """요청 하나가 쓴 Firestore 자원 (gather 로 나뉜 task 들도 같은 객체에 더한다)"""
+
+    __slots__ = ("rpcs", "seconds", "wait_seconds", "reads", "writes")
+
+    def __init__(self):
+        self.rpcs = 0
+        self.seconds = 0.0
+        self.wait_seconds = 0.0
+        self.reads = 0
+        self.writes = 0
+
+
+_request_stats = contextvars.ContextVar("request_stats", default=None)
+
+
+def current_stats() -> RequestStats | None:
+    return _request_stats.get()
+
+
+def count_documents(read: int = 0, written: int = 0) -> None:
+    stats = _request_stats.get()
+    if stats is not None:
+        stats.reads += read
+        stats.writes += written
+
+
+class FirestoreSlots:
+    """
+    Firestore 동시 호출 수를 제한하는 세마포어.
+
+        async with firestore_slots("issues.update"):
+            await ref.update(...)
+
+    한 번 들어갈 때마다 RPC 1회로 세고, 대기/호출 시간을 현재 요청과 trace span 에 더한다.
+    """
+
+    def __init__(self, limit: int):
+        self._semaphore = asyncio.Semaphore(limit)
+
+    def __call__(self, name: str = "firestore"):
+        return _FirestoreCall(self._semaphore, name)
+
+
+class _FirestoreCall:
+    __slots__ = ("_semaphore", "name", "_started")
+
+    def __init__(self, semaphore: asyncio.Semaphore, name: str):
+        self._semaphore = semaphore
+        self.name = name
+        self._started = None
+
+    async def __aenter__(self):
+        requested = time.perf_counter()
+        await self._semaphore.acquire()
+        self._started = time.perf_counter()
+
+        stats = _request_stats.get()
+        if stats is not None:
+            stats.wait_seconds += self._started - requested
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb):
+        self._semaphore.release()
+        elapsed = time.perf_counter() - self._started
+
+        stats = _request_stats.get()
+        if stats is not None:
+            stats.rpcs += 1
+            stats.seconds += elapsed
+        add_span("fs", self._started, elapsed, self.name)
+        return False
+
+
+def _route_label(scope) -> str:
+    route = scope.get("route")
+    path = getattr(route, "path", None)
+    # 매칭되지 않은 경로는 그대로 쓰면 라벨이 끝없이 늘어나므로 하나로 묶는다
+    return path or "unmatched"
+
+
+def _match_route_label(scope) -> str:
+    """
+    라우팅 전에 route 템플릿을 찾는다 (처리 중 게이지는 들어올 때 라벨이 있어야 한다).
+    메서드만 다른 경로는 라우터처럼 그 route 로 센다 (405 응답).
+    """
+    router = getattr(scope.get("app"), "router", None)
+    partial = None
+    for route in getattr(router, "routes", ()):
+        match, _ = route.matches(scope)
+        if match == Match.FULL:
+            return getattr(route, "path", None) or "unmatched"
+        if match == Match.PARTIAL and partial is None:
+            partial = getattr(route, "path", None)
+    return partial or "unmatched"
+
+
+class MetricsMiddleware:
+    """요청 수/지연/동시 처리 수와 요청별 Firestore 사용량을 route 템플릿 단위로 모은다."""
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        method = scope.get("method", "")
+        stats = RequestStats()
+        token = _request_stats.set(stats)
+        status_code = 500
+
+        async def send_wrapper(message):
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+            await send(message)
+
+        in_flight = (method, _match_route_label(scope))
+        http_in_flight.inc(in_flight)
+        started = time.perf_counter()
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            elapsed = time.perf_counter() - started
+            http_in_flight.dec(in_flight)
+            _request_stats.reset(token)
+
+            route = _route_label(scope)
+            labels = (method, route, str(status_code))
+            http_requests.inc(labels)
+            http_duration.observe(labels, elapsed)
+
+            if stats.rpcs:
+                firestore_rpcs.inc((route,), stats.rpcs)
+                firestore_seconds.inc((route,), stats.seconds)
+                firestore_wait_seconds.inc((route,), stats.wait_seconds)
+            if stats.reads:
+                firestore_reads.inc((route,), stats.reads)
+            if stats.writes:
+                firestore_writes.inc((route,), stats.writes)
@@ -0,0 +1,193 @@
+import bisect
+import logging
+import sys
+import threading
+import time
+
+logger = logging.getLogger(__name__)
+
+# 짧은 문자열(status, type, scope 등)은 문서마다 같은 값이 반복되므로 intern 해서 공유한다
+_INTERN_MAX_LEN = 32
+
+
+def _compact(value):
+    if isinstance(value, str) and len(value) <= _INTERN_MAX_LEN:
+        return sys.intern(value)
+    if isinstance(value, list):
+        return tuple(_compact(x) for x in value)
+    return value
+
+
+def _order_key(value):
+    # Firestore 처럼 숫자가 문자열보다 앞에 온다 (타입이 섞여도 비교할 수 있게 순위를 붙인다)
+    if isinstance(value, bool):
+        return None
+    if isinstance(value, (int, float)):
+        return (0, value)
+    if isinstance(value, str):
+        return (1, value)
+    return None
+
+
+class CollectionMirror:
+    """
+    Firestore 컬렉션 하나를 on_snapshot 리스너로 메모리에 그대로 유지한다.
+
+    - 문서는 fields 순서의 튜플 하나로만 저장한다 (dict 보다 작다)
+    - 첫 스냅샷을 받기 전(ready=False)에는 호출 쪽이 Firestore 를 직접 읽어야 한다
+    - add_listener 로 등록한 콜백은 변경이 반영된 뒤 리스너 스레드에서 호출된다
+    """
+
+    def __init__(self, name: str, fields: tuple, order_field: str = "order"):
+        self.name = name
+        self.fields = tuple(fields)
+        self._index = {name: i for i, name in enumerate(self.fields)}
+        self._order_pos = self._index.get(order_field)
+        self._records = {}
+        self._sorted = None
+        self._lock = threading.Lock()
+        self._listeners = []
+        self._watch = None
+        self._start_lock = threading.Lock()
+
+        self.ready = False
+        self.changes_applied = 0
+        self.last_read_time = None
+        self.last_applied_at = None
+        self.lag_seconds = None
+
+    # ---------- 리스너 ----------
+
+    def add_listener(self, callback) -> None:
+        """callback(changes) - 첫 스냅샷(전체 적재)은 전달하지 않는다"""
+        self._listeners.append(callback)
+
+    def start(self, collection_ref) -> None:
+        with self._start_lock:
+            if self._watch is None:
+                self._watch = collection_ref.on_snapshot(self.apply_snapshot)
+
+    def stop(self) -> None:
+        with self._start_lock:
+            if self._watch is not None:
+                self._watch.unsubscribe()
+                self._watch = None
+            self.ready = False
+
+    @property
+    def started(self) -> bool:
+        return self._watch is not None
+
+    def apply_snapshot(self, docs, changes, read_time) -> None:
+        initial = not self.ready
+
+        with self._lock:
+            if initial:
+                self._records = {d.id: self._pack(d.to_dict() or {}) for d in docs}
+            else:
+                for change in changes:
+                    doc = change.document
+                    if change.type.name == "REMOVED":
+                        self._records.pop(doc.id, None)
+                    else:
+                        self._records[doc.id] = self._pack(doc.to_dict() or {})
+            self._sorted = None
+
+        self.ready = True
+        self.changes_applied += len(changes)
+        self.last_applied_at = time.time()
+        if read_time is not None:
+            self.last_read_time = read_time
+            self.lag_seconds = max(0.0, self.last_applied_at - read_time.timestamp())
+
+        if initial:
+            return
+
+        for callback in self._listeners:
+            try:
+                callback(changes)
+            except Exception:
+                logger.exception("mirror listener 오류", extra={"collection": self.name})
+
+    # ---------- 조회 ----------
+
+    def _pack(self, data: dict) -> tuple:
+        return tuple(_compact(data.get(name)) for name in self.fields)
+
+    def _unpack(self, record: tuple) -> dict:
+        result = {}
+        for name, value in zip(self.fields, record):
+            if value is None:
+                continue
+            result[name] = list(value) if isinstance(value, tuple) else value
+        return result
+
+    def get(self, doc_id: str) -> dict | None:
+        record = self._records.get(doc_id)
+        return None if record is None else self._unpack(record)
+
+    def _sorted_keys(self) -> list:
+        if self._sorted is None:
+            keys = []
+            for doc_id, record in self._records.items():
+                order = _order_key(record[self._order_pos])
+                # Firestore 와 마찬가지로 정렬 필드가 없는 문서는 정렬 결과에서 빠진다
+                if order is not None:
+                    keys.append((order, doc_id))
+            keys.sort()
+            self._sorted = keys
+        return self._sorted
+
+    def query(self, filters: dict | None = None, after=None, limit: int = 100):
+        """
+        정렬 필드, id 순으로 filters 에 맞는 문서를 limit 개까지 돌려준다.
+        반환값: ([(doc_id, data), ...], has_more)
+        """
+        conditions = [
+            (self._index[field], value)
+            for field, value in (filters or {}).items()
+            if value
+        ]
+
+        with self._lock:
+            keys = self._sorted_keys()
+            start = 0
+            if after:
+                order = _order_key(after[0])
+                if order is None:
+                    return [], False
+                start = bisect.bisect_right(keys, (order, after[1]))
+
+            rows = []
+            for order, doc_id in keys[start:]:
+                record = self._records[doc_id]
+                if any(record[pos] != value for pos, value in conditions):
+                    continue
+                if len(rows) == limit:
+                    return rows, True
+                rows.append((doc_id, self._unpack(record)))
+
+        return rows, False
+
+    def values(self) -> list:
+        with self._lock:
+            return [(doc_id, self._unpack(r)) for doc_id, r in self._records.items()]
+
+    def stats(self) -> dict:
+        with self._lock:
+            records = list(self._records.values())
+
+        approx_bytes = sum(
+            sys.getsizeof(r) + sum(sys.getsizeof(v) for v in r) for r in records
+        )
+        return {
+            "collection": self.name,
+            "ready": self.ready,
+            "documents": len(records),
+            "approx_bytes": approx_bytes,
+            "changes_applied": self.changes_applied,
+            "lag_seconds": self.lag_seconds,
+            "age_seconds": (
+                time.time() - self.last_applied_at if self.last_applied_at else None
+            ),
+        }
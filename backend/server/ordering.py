@@ -0,0 +1,319 @@
+import asyncio
+import logging
+
+logger = logging.getLogger(__name__)
+
+# 안건 정렬 키 필드 (issues 는 order_key, issues_public 은 orderKey). 예전 정수 order 는 그대로 둔다
+ORDER_KEY_FIELD = "order_key"
+
+# 문자열 비교 순서와 같은 순서의 62진 숫자
+DIGITS = "0123456789ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz"
+_SMALLEST_INTEGER = "A" + "0" * 26
+
+# 사이에 끼워 넣기를 반복하면 키가 길어진다. 이보다 길어지면 전체를 다시 고르게 나눈다
+REBALANCE_KEY_LENGTH = 16
+
+
+def _integer_length(head: str) -> int:
+    if "a" <= head <= "z":
+        return ord(head) - ord("a") + 2
+    if "A" <= head <= "Z":
+        return ord("Z") - ord(head) + 2
+    raise ValueError(f"잘못된 정렬 키: {head!r}")
+
+
+def _split(key: str) -> tuple:
+    """정렬 키 -> (정수부, 소수부). 정수부 첫 글자가 자릿수를 나타낸다"""
+    if not key:
+        raise ValueError("빈 정렬 키")
+    size = _integer_length(key[0])
+    if len(key) < size:
+        raise ValueError(f"잘못된 정렬 키: {key!r}")
+    integer, fraction = key[:size], key[size:]
+    if fraction.endswith("0") or key == _SMALLEST_INTEGER:
+        raise ValueError(f"잘못된 정렬 키: {key!r}")
+    return integer, fraction
+
+
+def is_order_key(value) -> bool:
+    if not isinstance(value, str):
+        return False
+    try:
+        _split(value)
+    except ValueError:
+        return False
+    return True
+
+
+def _midpoint(a: str, b: str | None) -> str:
+    """소수부 a < b 사이의 가장 짧은 소수부 (b 가 None 이면 1)"""
+    if b is not None:
+        # 공통 앞부분은 그대로 두고 그 뒤에서 중간을 찾는다
+        n = 0
+        while (a[n] if n < len(a) else "0") == b[n]:
+            n += 1
+        if n > 0:
+            return b[:n] + _midpoint(a[n:], b[n:])
+
+    digit_a = DIGITS.index(a[0]) if a else 0
+    digit_b = DIGITS.index(b[0]) if b is not None else len(DIGITS)
+    if digit_b - digit_a > 1:
+        return DIGITS[(digit_a + digit_b + 1) // 2]
+    if b is not None and len(b) > 1:
+        return b[:1]
+    return DIGITS[digit_a] + _midpoint(a[1:], None)
+
+
+def _increment(integer: str) -> str | None:
+    head, digits = integer[0], list(integer[1:])
+    for i in range(len(digits) - 1, -1, -1):
+        d = DIGITS.index(digits[i]) + 1
+        if d < len(DIGITS):
+            digits[i] = DIGITS[d]
+            return head + "".join(digits)
+        digits[i] = "0"
+
+    # 자리 올림: 정수부가 한 자리 길어진다
+    if head == "Z":
+        return "a0"
+    if head == "z":
+        return None
+    head = chr(ord(head) + 1)
+    if head > "a":
+        digits.append("0")
+    else:
+        digits.pop()
+    return head + "".join(digits)
+
+
+def _decrement(integer: str) -> str | None:
+    head, digits = integer[0], list(integer[1:])
+    for i in range(len(digits) - 1, -1, -1):
+        d = DIGITS.index(digits[i]) - 1
+        if d >= 0:
+            digits[i] = DIGITS[d]
+            return head + "".join(digits)
+        digits[i] = DIGITS[-1]
+
+    if head == "a":
+        return "Z" + DIGITS[-1]
+    if head == "A":
+        return None
+    head = chr(ord(head) - 1)
+    if head < "Z":
+        digits.append(DIGITS[-1])
+    else:
+        digits.pop()
+    return head + "".join(digits)
+
+
+def key_between(a: str | None, b: str | None) -> str:
+    """
+    a < 결과 < b 인 정렬 키 (None 은 맨 앞 / 맨 뒤).
+    끝에 붙이면 정수부만 하나씩 늘어나서 키가 거의 길어지지 않는다.
+    """
+    if a is not None and b is not None and a >= b:
+        raise ValueError(f"{a!r} < {b!r} 가 아닙니다")
+
+    if a is None:
+        if b is None:
+            return "a0"
+        integer, fraction = _split(b)
+        if integer == _SMALLEST_INTEGER:
+            return integer + _midpoint("", fraction)
+        if integer < b:
+            return integer
+        result = _decrement(integer)
+        if result is None:
+            raise ValueError("더 앞에 둘 수 없습니다")
+        return result
+
+    integer, fraction = _split(a)
+    if b is None:
+        result = _increment(integer)
+        return integer + _midpoint(fraction, None) if result is None else result
+
+    integer_b, fraction_b = _split(b)
+    if integer == integer_b:
+        return integer + _midpoint(fraction, fraction_b)
+    result = _increment(integer)
+    if result is not None and result < b:
+        return result
+    return integer + _midpoint(fraction, None)
+
+
+def spread_keys(count: int) -> list:
+    """처음부터 고르게 나눈 정렬 키 count 개 (재배치용)"""
+    keys = []
+    key = None
+    for _ in range(count):
+        key = key_between(key, None)
+        keys.append(key)
+    return keys
+
+
+def plan_rebalance(rows: list, max_key_length: int = REBALANCE_KEY_LENGTH) -> dict:
+    """
+    rows: [(doc_id, data), ...] -> {doc_id: 새 정렬 키} (바꿀 문서만)
+
+    - 정렬 키가 없는 문서(예전 문서, 관리자 웹이 바로 만든 문서)는 order, id 순으로 맨 뒤에 붙인다
+    - 키가 너무 길어졌거나 겹치면 현재 순서를 유지한 채 전체를 고르게 다시 나눈다
+    """
+    keyed = sorted(
+        (data[ORDER_KEY_FIELD], doc_id)
+        for doc_id, data in rows
+        if is_order_key(data.get(ORDER_KEY_FIELD))
+    )
+    missing = sorted(
+        (_legacy_order(data), doc_id)
+        for doc_id, data in rows
+        if not is_order_key(data.get(ORDER_KEY_FIELD))
+    )
+
+    keys = [key for key, _ in keyed]
+    crowded = any(len(key) > max_key_length for key in keys) or len(set(keys)) < len(keys)
+
+    if crowded:
+        ordered = [doc_id for _, doc_id in keyed] + [doc_id for _, doc_id in missing]
+        current = {doc_id: key for key, doc_id in keyed}
+        return {
+            doc_id: key
+            for doc_id, key in zip(ordered, spread_keys(len(ordered)))
+            if current.get(doc_id) != key
+        }
+
+    changes = {}
+    last = keys[-1] if keys else None
+    for _, doc_id in missing:
+        last = key_between(last, None)
+        changes[doc_id] = last
+    return changes
+
+
+def _legacy_order(data: dict):
+    order = data.get("order")
+    if isinstance(order, bool) or not isinstance(order, (int, float)):
+        return 999999
+    return order
+
+
+class OrderRebalancer:
+    """
+    issues 정렬 키를 채우고 고르게 유지한다.
+
+    - 키가 없는 문서에만 키를 붙인다 (대부분의 실행은 아무것도 쓰지 않는다)
+    - 키가 길어지거나 겹치면 전체를 다시 나누되, 키가 실제로 바뀌는 문서만 쓴다
+    - 읽을 때의 수정 시각을 조건으로 쓰므로, 그 사이 옮겨진 문서(:move)는 되돌리지 않고 건너뛴다
+    - schedule() 은 다른 스레드(미러 리스너)에서도 부를 수 있다
+    """
+
+    def __init__(
+        self, repository, batch_size: int = 500, interval: float = 300.0, on_written=None
+    ):
+        self.repository = repository
+        self.batch_size = batch_size
+        self.interval = interval
+        self.on_written = on_written
+        self._lock = asyncio.Lock()
+        self._wake = None
+        self._loop = None
+        self._task = None
+
+        self.runs = 0
+        self.last_written = 0
+        self.last_error = ""
+
+    async def run_once(self) -> int:
+        """한 번 검사하고 바꾼 문서 수를 돌려준다"""
+        # repository 가 이 모듈의 정렬 키 함수를 쓰므로 여기서 가져온다
+        from .repository import DocumentNotFound, PreconditionFailed
+
+        async with self._lock:
+            rows = []
+            versions = {}
+            after = None
+            while True:
+                # 정렬에 필요한 필드만 읽고, 수정 시각은 쓸 때 조건으로 건다
+                page = await self.repository.page_issue_versions(
+                    after, self.batch_size, ["order", ORDER_KEY_FIELD]
+                )
+                for doc_id, data, update_time in page:
+                    rows.append((doc_id, data))
+                    versions[doc_id] = update_time
+                if len(page) < self.batch_size:
+                    break
+                after = page[-1][0]
+
+            changes = list(plan_rebalance(rows).items())
+            written = 0
+            skipped = 0
+            for start in range(0, len(changes), self.batch_size):
+                chunk = changes[start : start + self.batch_size]
+                try:
+                    await self.repository.commit_issue_writes(
+                        [
+                            ("update", doc_id, {ORDER_KEY_FIELD: key}, versions[doc_id])
+                            for doc_id, key in chunk
+                        ]
+                    )
+                    written += len(chunk)
+                except (PreconditionFailed, DocumentNotFound):
+                    # 읽은 뒤 누가 옮기거나 지운 문서가 있다. 그 문서만 빼고 하나씩 쓴다
+                    for doc_id, key in chunk:
+                        try:
+                            await self.repository.update_issue(
+                                doc_id, {ORDER_KEY_FIELD: key}, versions[doc_id]
+                            )
+                            written += 1
+                        except (PreconditionFailed, DocumentNotFound):
+                            skipped += 1
+
+            self.runs += 1
+            self.last_written = written
+            if skipped:
+                # 바뀐 문서를 반영한 계획으로 곧 다시 돌린다
+                logger.info("정렬 키 재배치 중 바뀐 문서 건너뜀", extra={"skipped": skipped})
+                self.schedule()
+            if written:
+                logger.info("정렬 키 재배치", extra={"written": written, "issues": len(rows)})
+                if self.on_written is not None:
+                    await self.on_written()
+            return written
+
+    def start(self) -> None:
+        if self._task is None:
+            self._loop = asyncio.get_running_loop()
+            self._wake = asyncio.Event()
+            self._task = asyncio.create_task(self._run_forever())
+
+    def schedule(self, *_args) -> None:
+        """다음 주기를 기다리지 않고 곧 한 번 돌린다"""
+        if self._loop is not None:
+            self._loop.call_soon_threadsafe(self._wake.set)
+
+    def cancel(self) -> None:
+        if self._task is not None:
+            self._task.cancel()
+            self._task = None
+
+    def stats(self) -> dict:
+        return {
+            "runs": self.runs,
+            "last_written": self.last_written,
+            "last_error": self.last_error,
+        }
+
+    async def _run_forever(self) -> None:
+        while True:
+            try:
+                await asyncio.wait_for(self._wake.wait(), self.interval)
+            except asyncio.TimeoutError:
+                pass
+            self._wake.clear()
+
+            try:
+                await self.run_once()
+                self.last_error = ""
+            except Exception as e:
+                self.last_error = repr(e)
+                logger.warning("정렬 키 재배치 실패", extra={"error": repr(e)})
@@ -0,0 +1,23 @@
+import base64
+import json
+
+
+def encode_cursor(order, doc_id: str) -> str:
+    """마지막 문서의 (order, id) 를 클라이언트에게 줄 불투명 커서로 바꾼다."""
+    raw = json.dumps({"o": order, "id": doc_id}, separators=(",", ":"))
+    return base64.urlsafe_b64encode(raw.encode("utf-8")).decode("ascii").rstrip("=")
+
+
+def decode_cursor(cursor: str) -> tuple:
+    """encode_cursor 가 만든 커서 -> (정렬 키, id). 형식이나 값의 타입이 틀리면 ValueError"""
+    padded = cursor + "=" * (-len(cursor) % 4)
+    try:
+        data = json.loads(base64.urlsafe_b64decode(padded.encode("ascii")))
+        order, doc_id = data["o"], data["id"]
+    except Exception as e:
+        raise ValueError("잘못된 cursor 입니다") from e
+
+    # 정렬 키(order_key)와 문서 id 는 문자열이다 (다른 타입은 저장소 비교에서 터진다)
+    if not isinstance(order, str) or not isinstance(doc_id, str):
+        raise ValueError("잘못된 cursor 입니다")
+    return order, doc_id
@@ -0,0 +1,252 @@
+import logging
+import threading
+from datetime import datetime, timezone
+
+from google.cloud.firestore import SERVER_TIMESTAMP
+
+logger = logging.getLogger(__name__)
+
+PRIVATE_COLLECTION = "issues"
+PUBLIC_COLLECTION = "issues_public"
+
+# issues_public 문서 모양과 기본값 (관리자 웹 buildIssuePayload 와 같게 맞춘다)
+PUBLIC_DEFAULTS = {
+    "type": "notice",
+    "title": "",
+    "summary": "",
+    "content": "",
+    "category": "general",
+    "scope": "",
+    "status": "draft",
+    "startAt": None,
+    "endAt": None,
+    "resultVisibility": "after_close",
+    "isPinned": False,
+    "imageUrl": "",
+    "company": "",
+    "union": "",
+    "options": [],
+    "multiple": False,
+    "maxSelections": 1,
+    "order": 1,
+    # 백엔드가 만든 정렬 키 (issues.order_key). 클라이언트는 이것으로 정렬하고 없으면 order 를 쓴다
+    "orderKey": "",
+    "active": True,
+}
+
+# 투영에 필요한 issues 문서 필드 (issues 미러가 이 필드들을 들고 있어야 한다)
+PUBLISH_SOURCE_FIELDS = tuple(PUBLIC_DEFAULTS) + (
+    "union_opt",
+    "order_key",
+    "created_at",
+    "updated_at",
+)
+
+
+def project_public_issue(data: dict) -> dict:
+    """issues 문서 -> issues_public 모양 (createdAt/updatedAt 제외)"""
+    data = data or {}
+    projected = {}
+
+    for field, default in PUBLIC_DEFAULTS.items():
+        value = data.get(field)
+        projected[field] = default if value is None else value
+
+    # 백엔드는 union_opt 로 저장한다
+    projected["union"] = data.get("union_opt") or data.get("union") or ""
+    projected["orderKey"] = data.get("order_key") or data.get("orderKey") or ""
+    projected["options"] = [str(x) for x in projected["options"] or []]
+    return projected
+
+
+def diff_public_issue(projected: dict, current: dict | None) -> dict:
+    """current 와 값이 다른 필드만 돌려준다. current 가 None 이면 전체."""
+    if current is None:
+        return dict(projected)
+
+    return {
+        field: value
+        for field, value in projected.items()
+        if _normalize(current.get(field)) != _normalize(value)
+    }
+
+
+def _normalize(value):
+    if isinstance(value, tuple):
+        return list(value)
+    return value
+
+
+class PublicProjector:
+    """
+    issues 변경을 issues_public 으로 투영한다.
+
+    - 바뀐 문서 id 를 모았다가 debounce 초 뒤 한 번에 처리한다 (미러 리스너 스레드와 분리)
+    - 현재 공개본과 비교해서 실제로 달라진 필드만 merge 로 쓰고, 그때만 updatedAt 을 올린다
+    - 쓰기는 batch_size 개씩 WriteBatch 로 커밋한다
+    - issues 에 없는 공개 문서(관리자 웹에서 직접 만든 안건)는 건드리지 않는다
+    """
+
+    def __init__(
+        self,
+        client_factory,
+        source_mirror,
+        target_mirror,
+        debounce: float = 0.5,
+        batch_size: int = 500,
+    ):
+        self._client_factory = client_factory
+        self._source = source_mirror
+        self._target = target_mirror
+        self.debounce = debounce
+        self.batch_size = batch_size
+
+        self._dirty = {}
+        self._timer = None
+        self._lock = threading.Lock()
+        self._publish_lock = threading.Lock()
+        # 공개 미러가 우리 쓰기를 아직 반영하지 못했을 때 같은 내용을 다시 쓰지 않도록
+        self._written = {}
+
+        self.last_result = None
+        self.last_published_at = None
+        self.last_error = ""
+
+    # ---------- 스케줄 ----------
+
+    def schedule(self, changes) -> None:
+        """CollectionMirror 리스너 콜백"""
+        with self._lock:
+            for change in changes:
+                doc = change.document
+                if change.type.name == "REMOVED":
+                    self._dirty[doc.id] = None
+                else:
+                    self._dirty[doc.id] = doc.to_dict() or {}
+
+            if self._timer is not None:
+                self._timer.cancel()
+            self._timer = threading.Timer(self.debounce, self._run)
+            self._timer.daemon = True
+            self._timer.start()
+
+    def cancel(self) -> None:
+        with self._lock:
+            if self._timer is not None:
+                self._timer.cancel()
+                self._timer = None
+
+    def _run(self) -> None:
+        with self._lock:
+            dirty, self._dirty = self._dirty, {}
+            self._timer = None
+
+        try:
+            self.publish(dirty)
+        except Exception as e:
+            self.last_error = str(e)
+            logger.exception("issues_public 투영 실패")
+            # 다음 변경 때 다시 시도하도록 되돌려 둔다 (그 사이 들어온 값이 우선)
+            with self._lock:
+                for doc_id, data in dirty.items():
+                    self._dirty.setdefault(doc_id, data)
+
+    # ---------- 발행 ----------
+
+    def publish_all(self) -> dict:
+        """issues 전체를 다시 비교해서 공개본을 맞춘다 (관리자 수동 동기화)"""
+        if self._source.ready:
+            rows = self._source.values()
+        else:
+            db = self._client_factory()
+            rows = [
+                (doc.id, doc.to_dict() or {})
+                for doc in db.collection(PRIVATE_COLLECTION).stream()
+            ]
+
+        # 전체 동기화는 미러 상태와 무관하게 실제 공개본과 비교한다
+        with self._publish_lock:
+            self._written.clear()
+        return self.publish(dict(rows))
+
+    def _current_public(self, db, doc_ids: list) -> dict:
+        if self._target.ready:
+            return {doc_id: self._target.get(doc_id) for doc_id in doc_ids}
+
+        refs = [db.collection(PUBLIC_COLLECTION).document(x) for x in doc_ids]
+        current = {doc_id: None for doc_id in doc_ids}
+        for snap in db.get_all(refs):
+            if snap.exists:
+                current[snap.id] = snap.to_dict() or {}
+        return current
+
+    def publish(self, sources: dict) -> dict:
+        """sources: {doc_id: issues 문서 dict (삭제면 None)}"""
+        result = {"checked": len(sources), "written": 0, "deleted": 0, "unchanged": 0}
+        if not sources:
+            return result
+
+        with self._publish_lock:
+            db = self._client_factory()
+            collection = db.collection(PUBLIC_COLLECTION)
+            current = self._current_public(db, list(sources))
+
+            writes = []
+            for doc_id, data in sources.items():
+                if data is None:
+                    if current.get(doc_id) is not None or doc_id in self._written:
+                        writes.append((doc_id, None, None))
+                    continue
+
+                projected = project_public_issue(data)
+                if self._written.get(doc_id) == projected:
+                    result["unchanged"] += 1
+                    continue
+
+                changed = diff_public_issue(projected, current.get(doc_id))
+                if not changed:
+                    self._written[doc_id] = projected
+                    result["unchanged"] += 1
+                    continue
+
+                if current.get(doc_id) is None:
+                    changed["createdAt"] = (
+                        data.get("created_at") or data.get("updated_at") or SERVER_TIMESTAMP
+                    )
+                changed["updatedAt"] = SERVER_TIMESTAMP
+                writes.append((doc_id, changed, projected))
+
+            for start in range(0, len(writes), self.batch_size):
+                batch = db.batch()
+                chunk = writes[start : start + self.batch_size]
+
+                for doc_id, changed, _ in chunk:
+                    if changed is None:
+                        batch.delete(collection.document(doc_id))
+                    else:
+                        batch.set(collection.document(doc_id), changed, merge=True)
+
+                batch.commit()
+
+                for doc_id, changed, projected in chunk:
+                    if changed is None:
+                        self._written.pop(doc_id, None)
+                        result["deleted"] += 1
+                    else:
+                        self._written[doc_id] = projected
+                        result["written"] += 1
+
+        self.last_result = result
+        self.last_published_at = datetime.now(timezone.utc)
+        self.last_error = ""
+        return result
+
+    def stats(self) -> dict:
+        return {
+            "pending": len(self._dirty),
+            "last_result": self.last_result,
+            "last_published_at": (
+                self.last_published_at.isoformat() if self.last_published_at else None
+            ),
+            "last_error": self.last_error,
+        }
@@ -0,0 +1,84 @@
+import asyncio
+import logging
+import time
+
+logger = logging.getLogger(__name__)
+
+
+class Readiness:
+    """
+    워커가 요청을 빨리 처리할 수 있는 상태인지 (/readyz).
+
+    starting -> ready -> draining 순서로만 바뀐다. 준비 단계가 실패하면 starting 에 머물며
+    마지막 오류를 남긴다 (로드밸런서는 ready 인 워커에만 요청을 보낸다)
+    """
+
+    def __init__(self):
+        self.state = "starting"
+        self.error = None
+        self.attempts = 0
+        self.steps = {}
+        self._started = time.monotonic()
+        self._ready_after = None
+
+    @property
+    def ready(self) -> bool:
+        return self.state == "ready"
+
+    def mark_ready(self) -> None:
+        if self.state == "starting":
+            self.state = "ready"
+            self.error = None
+            self._ready_after = time.monotonic() - self._started
+
+    def mark_draining(self) -> None:
+        self.state = "draining"
+
+    def snapshot(self) -> dict:
+        return {
+            "status": self.state,
+            "error": self.error,
+            "attempts": self.attempts,
+            "steps_ms": dict(self.steps),
+            "ready_after_sec": (
+                None if self._ready_after is None else round(self._ready_after, 3)
+            ),
+        }
+
+
+async def warm_up(
+    readiness: Readiness,
+    steps: list,
+    retry_base: float = 1.0,
+    retry_max: float = 30.0,
+    timeout: float | None = None,
+) -> None:
+    """
+    steps: [(name, async fn), ...] 를 차례로 실행하고 모두 끝나면 ready 로 바꾼다.
+    실패하면 지수 백오프로 다시 시도하되, 이미 끝난 단계는 건너뛴다.
+    """
+    done = set()
+    delay = retry_base
+
+    while readiness.state == "starting":
+        readiness.attempts += 1
+        try:
+            for name, step in steps:
+                if name in done:
+                    continue
+                started = time.perf_counter()
+                await asyncio.wait_for(step(), timeout)
+                readiness.steps[name] = round((time.perf_counter() - started) * 1000, 2)
+                done.add(name)
+        except Exception as e:
+            readiness.error = f"{name}: {e!r}"
+            logger.warning(
+                "준비 단계 실패, %.0f초 뒤 다시 시도",
+                delay,
+                extra={"step": name, "error": repr(e), "attempt": readiness.attempts},
+            )
+            await asyncio.sleep(delay)
+            delay = min(retry_max, delay * 2)
+            continue
+
+        readiness.mark_ready()
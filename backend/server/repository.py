@@ -0,0 +1,829 @@
+import asyncio
+import json
+import re
+import sqlite3
+import threading
+import uuid
+from abc import ABC, abstractmethod
+from contextlib import contextmanager
+from datetime import datetime, timedelta, timezone
+
+import firebase_admin
+from firebase_admin import credentials, firestore, firestore_async
+from google.api_core.datetime_helpers import DatetimeWithNanoseconds
+from google.api_core.exceptions import (
+    AlreadyExists,
+    FailedPrecondition,
+    GoogleAPICallError,
+    NotFound,
+)
+from google.cloud.firestore_v1.base_query import FieldFilter
+
+from .metrics import count_documents
+from .ordering import ORDER_KEY_FIELD, is_order_key
+from .serialization import dumps
+from .tracing import span
+
+FIREBASE_CREDENTIALS = "server/firebase_key.json"
+
+_firebase_app = None
+_firebase_lock = threading.Lock()
+
+
+class RepositoryError(Exception):
+    """저장소 호출 실패 (백엔드 종류와 무관하게 이 예외로 올라온다)"""
+
+
+class DocumentNotFound(RepositoryError):
+    pass
+
+
+class DocumentExists(RepositoryError):
+    pass
+
+
+class PreconditionFailed(RepositoryError):
+    """last_update_time 이 현재 문서의 수정 시각과 다르다"""
+
+
+def ensure_firebase_app(credentials_path: str | None = None):
+    """firebase_admin 기본 앱은 처음 필요할 때 한 번만 초기화한다 (import 시점에는 만들지 않음)"""
+    global _firebase_app
+
+    with _firebase_lock:
+        if _firebase_app is None:
+            cred = credentials.Certificate(credentials_path or FIREBASE_CREDENTIALS)
+            _firebase_app = firebase_admin.initialize_app(cred)
+        return _firebase_app
+
+
+_RFC3339 = re.compile(
+    r"^(\d{4}-\d{2}-\d{2}T\d{2}:\d{2}:\d{2})(?:\.(\d{1,9}))?(Z|[+-]\d{2}:\d{2})$"
+)
+
+
+def parse_update_time(value: str) -> datetime:
+    """RFC3339 문자열 -> UTC datetime. 형식이 틀리면 ValueError (나노초는 마이크로초까지만 본다)"""
+    match = _RFC3339.match(value or "")
+    if not match:
+        raise ValueError(f"RFC3339 형식이 아닙니다: {value}")
+
+    base, fraction, offset = match.groups()
+    micros = (fraction or "").ljust(6, "0")[:6]
+    offset = "+00:00" if offset == "Z" else offset
+    return datetime.fromisoformat(f"{base}.{micros}{offset}").astimezone(timezone.utc)
+
+
+def format_update_time(value) -> str:
+    if hasattr(value, "rfc3339"):
+        return value.rfc3339()
+    if isinstance(value, datetime):
+        return value.astimezone(timezone.utc).strftime("%Y-%m-%dT%H:%M:%S.%fZ")
+    return value or ""
+
+
+def _slot_prefix(collection: str) -> str:
+    # Firestore 슬롯/메트릭 이름은 마지막 경로 조각만 쓴다 (votes/<id>/ballots -> ballots)
+    return collection.rsplit("/", 1)[-1]
+
+
+def ballots_collection(issue_id: str) -> str:
+    return f"votes/{issue_id}/ballots"
+
+
+class Repository(ABC):
+    """
+    안건(issues / issues_public), 투표 응답(votes/*/ballots), 집계(vote_stats) 저장소.
+    핸들러는 Firestore 클라이언트 대신 이 메서드들만 쓴다.
+
+    - 없는 문서는 None, 쓰기 실패는 RepositoryError 하위 예외
+    - last_update_time 이 RFC3339 가 아니면 ValueError
+    """
+
+    name = ""
+    # on_snapshot 이 필요한 미러 / SSE / 투표 WebSocket 은 Firestore 에서만 된다
+    supports_watch = False
+
+    def new_issue_id(self) -> str:
+        return uuid.uuid4().hex[:20]
+
+    def watch_client(self):
+        raise RuntimeError(f"{self.name} 저장소는 실시간 리스너를 지원하지 않습니다")
+
+    async def warm_up(self) -> None:
+        """첫 요청이 연결 비용을 치르지 않도록 미리 연결해 둔다"""
+
+    @abstractmethod
+    async def list_issues(self, filters, after, limit: int, fields=None):
+        """
+        정렬 키(order_key), id 순으로 filters 에 맞는 안건. 반환값: ([(doc_id, data), ...], has_more)
+        after: 마지막으로 받은 (order_key, id)
+        """
+
+    @abstractmethod
+    async def last_order_key(self) -> str | None:
+        """가장 뒤에 있는 안건의 정렬 키 (새 안건을 끝에 붙일 때)"""
+
+    @abstractmethod
+    async def create_issue(self, data: dict) -> str:
+        ...
+
+    @abstractmethod
+    async def commit_issue_writes(self, writes: list) -> None:
+        """
+        [(kind, issue_id, data)] 를 한꺼번에 쓴다. kind: create / update / delete (전부 아니면 전무)
+        update 는 (kind, issue_id, data, last_update_time) 로 수정 시각 조건을 걸 수 있다
+        """
+
+    @abstractmethod
+    async def page_issue_versions(self, after: str | None, limit: int, fields: list) -> list:
+        """문서 id 순 issues 한 페이지를 수정 시각과 함께. [(doc_id, {fields}, update_time)]"""
+
+    @abstractmethod
+    async def update_issue(self, issue_id: str, data: dict, last_update_time=None) -> str:
+        """바뀐 필드만 쓰고 새 수정 시각(RFC3339)을 돌려준다"""
+
+    @abstractmethod
+    async def delete_issue(self, issue_id: str, last_update_time=None) -> None:
+        ...
+
+    @abstractmethod
+    async def list_public_issues(self) -> list:
+        ...
+
+    @abstractmethod
+    async def get_public_issues(self, issue_ids: list) -> list:
+        ...
+
+    @abstractmethod
+    async def get_version_meta(self) -> dict | None:
+        ...
+
+    @abstractmethod
+    async def get_ballots(self, issue_ids: list, uid: str) -> list:
+        """issue_ids 순서대로 내 응답 dict 또는 None"""
+
+    @abstractmethod
+    async def get_stats(self, issue_ids: list) -> list:
+        ...
+
+    @abstractmethod
+    async def page_documents(
+        self, collection: str, after: str | None, limit: int, keys_only: bool = False
+    ) -> list:
+        """
+        문서 id 순으로 after 다음 문서부터 limit 개. 반환값: [(doc_id, data), ...]
+        keys_only 면 data 를 읽지 않아도 된다 (빈 dict 일 수 있음)
+        """
+
+    @abstractmethod
+    async def get_documents(self, collection: str, doc_ids: list) -> list:
+        """doc_ids 순서대로 dict 또는 None"""
+
+    @abstractmethod
+    async def set_document(self, collection: str, doc_id: str, data: dict) -> None:
+        """문서를 통째로 쓴다 (없으면 만든다)"""
+
+    @abstractmethod
+    async def create_document(self, collection: str, doc_id: str, data: dict) -> None:
+        """없을 때만 만든다. 이미 있으면 DocumentExists (한 번 쓰면 바뀌지 않는 문서용)"""
+
+    @abstractmethod
+    async def delete_documents(self, collection: str, doc_ids: list) -> None:
+        """한 번에 지운다 (Firestore WriteBatch 한도 500개). 없는 문서는 그냥 넘어간다"""
+
+    def close(self) -> None:
+        pass
+
+
+class FirestoreRepository(Repository):
+    """
+    firestore_async 클라이언트로 읽고 쓴다. 클라이언트와 firebase 앱은 처음 쓸 때 만든다.
+    호출마다 firestore_slots 로 동시 호출 수를 제한하고 문서 읽기/쓰기 수를 센다.
+    """
+
+    name = "firestore"
+    supports_watch = True
+
+    def __init__(self, slots, credentials_path: str | None = None):
+        self._slots = slots
+        self._credentials_path = credentials_path
+        self._db = None
+        self._watch_db = None
+
+    @property
+    def db(self):
+        if self._db is None:
+            ensure_firebase_app(self._credentials_path)
+            self._db = firestore_async.client()
+        return self._db
+
+    def watch_client(self):
+        # on_snapshot 은 동기 클라이언트에서만 지원된다
+        if self._watch_db is None:
+            ensure_firebase_app(self._credentials_path)
+            self._watch_db = firestore.client()
+        return self._watch_db
+
+    async def warm_up(self) -> None:
+        # 키 파일 읽기와 앱 초기화는 이벤트 루프 밖에서, 첫 RPC 로 gRPC 채널을 열어 둔다
+        await asyncio.to_thread(ensure_firebase_app, self._credentials_path)
+
+        with self._errors():
+            async with self._slots("warmup"):
+                await self.db.collection("meta").document("version").get()
+        count_documents(read=1)
+
+    def new_issue_id(self) -> str:
+        # 문서 id 는 클라이언트에서 만든다 (RPC 없음)
+        return self.db.collection("issues").document().id
+
+    @contextmanager
+    def _errors(self, conditional: bool = False):
+        """
+        conditional: 수정 시각 조건(last_update_time)을 건 쓰기. 그때의 FAILED_PRECONDITION 만
+        PreconditionFailed(412) 다. 그 밖의 FAILED_PRECONDITION(복합 색인 없음 등)은 서버 쪽 오류다
+        """
+        try:
+            yield
+        except NotFound as e:
+            raise DocumentNotFound(str(e)) from e
+        except AlreadyExists as e:
+            raise DocumentExists(str(e)) from e
+        except FailedPrecondition as e:
+            if conditional:
+                raise PreconditionFailed(str(e)) from e
+            raise RepositoryError(str(e)) from e
+        except GoogleAPICallError as e:
+            raise RepositoryError(str(e)) from e
+
+    def _write_option(self, last_update_time: str | None):
+        """
+        last_update_time 이 없으면 '문서가 존재해야 함' 조건만,
+        있으면 낙관적 동시성 제어를 위해 '마지막 수정 시각이 같아야 함' 조건을 건다.
+        """
+        if not last_update_time:
+            return self.db.write_option(exists=True)
+
+        try:
+            update_time = DatetimeWithNanoseconds.from_rfc3339(last_update_time)
+        except ValueError:
+            raise ValueError(f"RFC3339 형식이 아닙니다: {last_update_time}")
+        return self.db.write_option(last_update_time=update_time)
+
+    async def list_issues(self, filters, after, limit: int, fields=None):
+        query = self.db.collection("issues")
+
+        for field, value in (filters or {}).items():
+            if value:
+                query = query.where(filter=FieldFilter(field, "==", value))
+
+        if fields:
+            # 커서를 만들려면 정렬 키는 항상 읽어야 한다
+            query = query.select(sorted(set(fields) | {ORDER_KEY_FIELD}))
+        query = query.order_by(ORDER_KEY_FIELD).order_by("__name__")
+
+        if after:
+            query = query.start_after({ORDER_KEY_FIELD: after[0], "__name__": after[1]})
+
+        # 한 건 더 읽어서 다음 페이지 존재 여부를 판단
+        query = query.limit(limit + 1)
+
+        with self._errors():
+            async with self._slots("issues.query"):
+                docs = [d async for d in query.stream()]
+        # 결과가 없어도 쿼리 1회는 문서 1개 읽기로 과금된다
+        count_documents(read=max(1, len(docs)))
+
+        rows = [(d.id, d.to_dict() or {}) for d in docs]
+        return rows[:limit], len(rows) > limit
+
+    async def last_order_key(self) -> str | None:
+        query = (
+            self.db.collection("issues")
+            .select([ORDER_KEY_FIELD])
+            .order_by(ORDER_KEY_FIELD, direction=firestore.Query.DESCENDING)
+            .limit(1)
+        )
+
+        with self._errors():
+            async with self._slots("issues.query"):
+                docs = [d async for d in query.stream()]
+        count_documents(read=1)
+        return (docs[0].to_dict() or {}).get(ORDER_KEY_FIELD) if docs else None
+
+    async def create_issue(self, data: dict) -> str:
+        ref = self.db.collection("issues").document()
+
+        with self._errors():
+            async with self._slots("issues.create"):
+                await ref.set(data)
+        count_documents(written=1)
+        return ref.id
+
+    async def commit_issue_writes(self, writes: list) -> None:
+        collection = self.db.collection("issues")
+        batch = self.db.batch()
+
+        conditional = False
+        for kind, issue_id, data, *condition in writes:
+            ref = collection.document(issue_id)
+            if kind == "create":
+                batch.create(ref, data)
+            elif kind == "update" and condition and condition[0]:
+                batch.update(ref, data, option=self._write_option(condition[0]))
+                conditional = True
+            elif kind == "update":
+                batch.update(ref, data)
+            else:
+                batch.delete(ref)
+
+        with self._errors(conditional):
+            async with self._slots("issues.batch_commit"):
+                await batch.commit()
+        count_documents(written=len(writes))
+
+    async def page_issue_versions(self, after: str | None, limit: int, fields: list) -> list:
+        query = self.db.collection("issues").select(list(fields)).order_by("__name__")
+        if after:
+            query = query.start_after({"__name__": after})
+        query = query.limit(limit)
+
+        with self._errors():
+            async with self._slots("issues.page"):
+                rows = [
+                    (d.id, d.to_dict() or {}, format_update_time(d.update_time))
+                    async for d in query.stream()
+                ]
+        count_documents(read=max(1, len(rows)))
+        return rows
+
+    async def update_issue(self, issue_id: str, data: dict, last_update_time=None) -> str:
+        ref = self.db.collection("issues").document(issue_id)
+        option = self._write_option(last_update_time)
+
+        with self._errors(conditional=bool(last_update_time)):
+            async with self._slots("issues.update"):
+                result = await ref.update(data, option=option)
+        count_documents(written=1)
+        return format_update_time(result.update_time)
+
+    async def delete_issue(self, issue_id: str, last_update_time=None) -> None:
+        ref = self.db.collection("issues").document(issue_id)
+        option = self._write_option(last_update_time)
+
+        with self._errors(conditional=bool(last_update_time)):
+            async with self._slots("issues.delete"):
+                await ref.delete(option=option)
+        count_documents(written=1)
+
+    async def list_public_issues(self) -> list:
+        with self._errors():
+            async with self._slots("issues_public.stream"):
+                rows = [
+                    (doc.id, doc.to_dict() or {})
+                    async for doc in self.db.collection("issues_public").stream()
+                ]
+        count_documents(read=max(1, len(rows)))
+        return rows
+
+    async def _get_all(self, refs: list) -> list:
+        """여러 문서를 get_all 한 번으로 읽는다. refs 순서대로 dict 또는 None"""
+        if not refs:
+            return []
+
+        found = {}
+        with self._errors():
+            async with self._slots("get_all"):
+                async for snap in self.db.get_all(refs):
+                    if snap.exists:
+                        found[snap.reference.path] = snap.to_dict() or {}
+        # 없는 문서도 읽기 1회로 과금된다
+        count_documents(read=len(refs))
+        return [found.get(ref.path) for ref in refs]
+
+    async def get_public_issues(self, issue_ids: list) -> list:
+        collection = self.db.collection("issues_public")
+        return await self._get_all([collection.document(x) for x in issue_ids])
+
+    async def get_version_meta(self) -> dict | None:
+        (data,) = await self._get_all([self.db.collection("meta").document("version")])
+        return data
+
+    async def get_ballots(self, issue_ids: list, uid: str) -> list:
+        return await self._get_all(
+            [self.db.collection(ballots_collection(x)).document(uid) for x in issue_ids]
+        )
+
+    async def get_stats(self, issue_ids: list) -> list:
+        collection = self.db.collection("vote_stats")
+        return await self._get_all([collection.document(x) for x in issue_ids])
+
+    async def page_documents(
+        self, collection: str, after: str | None, limit: int, keys_only: bool = False
+    ) -> list:
+        query = self.db.collection(collection)
+        if keys_only:
+            query = query.select(["__name__"])
+        query = query.order_by("__name__")
+        if after:
+            query = query.start_after({"__name__": after})
+        query = query.limit(limit)
+
+        with self._errors():
+            async with self._slots(f"{_slot_prefix(collection)}.page"):
+                rows = [(d.id, d.to_dict() or {}) async for d in query.stream()]
+        count_documents(read=max(1, len(rows)))
+        return rows
+
+    async def get_documents(self, collection: str, doc_ids: list) -> list:
+        parent = self.db.collection(collection)
+        return await self._get_all([parent.document(x) for x in doc_ids])
+
+    async def set_document(self, collection: str, doc_id: str, data: dict) -> None:
+        ref = self.db.collection(collection).document(doc_id)
+
+        with self._errors():
+            async with self._slots(f"{_slot_prefix(collection)}.set"):
+                await ref.set(data)
+        count_documents(written=1)
+
+    async def create_document(self, collection: str, doc_id: str, data: dict) -> None:
+        ref = self.db.collection(collection).document(doc_id)
+
+        with self._errors():
+            async with self._slots(f"{_slot_prefix(collection)}.create"):
+                await ref.create(data)
+        count_documents(written=1)
+
+    async def delete_documents(self, collection: str, doc_ids: list) -> None:
+        if not doc_ids:
+            return
+
+        parent = self.db.collection(collection)
+        batch = self.db.batch()
+        for doc_id in doc_ids:
+            batch.delete(parent.document(doc_id))
+
+        with self._errors():
+            async with self._slots(f"{_slot_prefix(collection)}.delete"):
+                await batch.commit()
+        count_documents(written=len(doc_ids))
+
+
+class DocumentRepository(Repository):
+    """
+    메모리 / SQLite 공통 로직. 하위 클래스는 문서 단위 _get / _put / _remove / _scan 만 구현한다.
+    컬렉션 이름은 Firestore 경로 그대로 쓴다 (예: votes/<issueId>/ballots).
+    """
+
+    def __init__(self):
+        self._lock = threading.RLock()
+        self._last_time = None
+
+    @abstractmethod
+    def _get(self, collection: str, doc_id: str):
+        """(data, update_time) 또는 None"""
+
+    @abstractmethod
+    def _put(self, collection: str, doc_id: str, data: dict, update_time: str) -> None:
+        ...
+
+    @abstractmethod
+    def _remove(self, collection: str, doc_id: str) -> None:
+        ...
+
+    @abstractmethod
+    def _scan(self, collection: str) -> list:
+        """[(doc_id, data), ...]"""
+
+    def _page(self, collection: str, after: str | None, limit: int) -> list:
+        """id 순 한 페이지. 기본 구현은 컬렉션 전체를 훑는다"""
+        with self._lock:
+            docs = sorted(self._scan(collection), key=lambda row: row[0])
+        return [row for row in docs if after is None or row[0] > after][:limit]
+
+    @contextmanager
+    def _transaction(self):
+        with self._lock:
+            yield
+
+    async def _run(self, fn, *args):
+        return fn(*args)
+
+    def _now(self) -> str:
+        # 같은 마이크로초에 두 번 써도 수정 시각이 달라야 선행 조건이 의미가 있다
+        now = datetime.now(timezone.utc)
+        if self._last_time is not None and now <= self._last_time:
+            now = self._last_time + timedelta(microseconds=1)
+        self._last_time = now
+        return format_update_time(now)
+
+    def seed(self, collections: dict) -> None:
+        """{"issues": {id: data}, "votes/<issueId>/ballots": {uid: data}, ...} 를 그대로 넣는다"""
+        with self._transaction():
+            update_time = self._now()
+            for collection, docs in collections.items():
+                for doc_id, data in docs.items():
+                    self._put(collection, doc_id, dict(data), update_time)
+
+    def load_seed(self, path: str) -> None:
+        with open(path, "r", encoding="utf-8") as f:
+            self.seed(json.load(f))
+
+    def _read_many(self, collection_ids: list) -> list:
+        with self._lock:
+            found = [self._get(collection, doc_id) for collection, doc_id in collection_ids]
+        return [None if x is None else x[0] for x in found]
+
+    def _list_issues(self, filters, after, limit):
+        conditions = [(field, value) for field, value in (filters or {}).items() if value]
+
+        with self._lock:
+            docs = self._scan("issues")
+
+        keys = []
+        for doc_id, data in docs:
+            order = data.get(ORDER_KEY_FIELD)
+            # Firestore 와 마찬가지로 정렬 키가 없는 문서는 정렬 결과에서 빠진다
+            if not isinstance(order, str):
+                continue
+            if any(data.get(field) != value for field, value in conditions):
+                continue
+            keys.append((order, doc_id, data))
+
+        keys.sort(key=lambda x: (x[0], x[1]))
+        if after:
+            after = tuple(after)
+            keys = [x for x in keys if (x[0], x[1]) > after]
+
+        rows = [(doc_id, data) for _, doc_id, data in keys[: limit + 1]]
+        return rows[:limit], len(rows) > limit
+
+    def _commit(self, writes: list) -> str:
+        """
+        [(kind, collection, doc_id, data, last_update_time)] 를 모두 검사한 뒤에만 쓴다.
+        하나라도 실패하면 아무것도 쓰지 않는다 (Firestore WriteBatch 와 같음)
+        """
+        with self._transaction():
+            update_time = self._now()
+            staged = {}
+
+            for kind, collection, doc_id, data, last_update_time in writes:
+                key = (collection, doc_id)
+                current = staged[key] if key in staged else self._get(collection, doc_id)
+
+                if kind == "create":
+                    if current is not None:
+                        raise DocumentExists(f"{collection}/{doc_id} 이미 있습니다")
+                    staged[key] = (dict(data), update_time)
+                    continue
+
+                if current is None:
+                    raise DocumentNotFound(f"{collection}/{doc_id} 없습니다")
+                if last_update_time and parse_update_time(current[1]) != parse_update_time(
+                    last_update_time
+                ):
+                    raise PreconditionFailed(f"{collection}/{doc_id} 수정 시각이 다릅니다")
+
+                if kind == "delete":
+                    staged[key] = None
+                else:
+                    staged[key] = ({**current[0], **data}, update_time)
+
+            for (collection, doc_id), value in staged.items():
+                if value is None:
+                    self._remove(collection, doc_id)
+                else:
+                    self._put(collection, doc_id, value[0], value[1])
+
+        return update_time
+
+    async def list_issues(self, filters, after, limit: int, fields=None):
+        return await self._run(self._list_issues, filters, after, limit)
+
+    async def last_order_key(self) -> str | None:
+        docs = await self._run(self._locked_scan, "issues")
+        keys = [data.get(ORDER_KEY_FIELD) for _, data in docs]
+        return max((key for key in keys if is_order_key(key)), default=None)
+
+    async def create_issue(self, data: dict) -> str:
+        issue_id = self.new_issue_id()
+        await self._run(self._commit, [("create", "issues", issue_id, data, None)])
+        return issue_id
+
+    async def commit_issue_writes(self, writes: list) -> None:
+        await self._run(
+            self._commit,
+            [
+                (kind, "issues", issue_id, data, condition[0] if condition else None)
+                for kind, issue_id, data, *condition in writes
+            ],
+        )
+
+    async def page_issue_versions(self, after: str | None, limit: int, fields: list) -> list:
+        return await self._run(self._page_versions, after, limit, fields)
+
+    def _page_versions(self, after, limit, fields) -> list:
+        with self._lock:
+            rows = self._page("issues", after, limit)
+            versions = [self._get("issues", doc_id) for doc_id, _ in rows]
+        return [
+            (doc_id, {field: data.get(field) for field in fields}, version[1])
+            for (doc_id, data), version in zip(rows, versions)
+            if version is not None
+        ]
+
+    async def update_issue(self, issue_id: str, data: dict, last_update_time=None) -> str:
+        if last_update_time:
+            parse_update_time(last_update_time)
+        return await self._run(
+            self._commit, [("update", "issues", issue_id, data, last_update_time)]
+        )
+
+    async def delete_issue(self, issue_id: str, last_update_time=None) -> None:
+        if last_update_time:
+            parse_update_time(last_update_time)
+        await self._run(
+            self._commit, [("delete", "issues", issue_id, None, last_update_time)]
+        )
+
+    async def list_public_issues(self) -> list:
+        return await self._run(self._locked_scan, "issues_public")
+
+    def _locked_scan(self, collection: str) -> list:
+        with self._lock:
+            return self._scan(collection)
+
+    async def get_public_issues(self, issue_ids: list) -> list:
+        return await self._run(self._read_many, [("issues_public", x) for x in issue_ids])
+
+    async def get_version_meta(self) -> dict | None:
+        (data,) = await self._run(self._read_many, [("meta", "version")])
+        return data
+
+    async def get_ballots(self, issue_ids: list, uid: str) -> list:
+        return await self._run(
+            self._read_many, [(ballots_collection(x), uid) for x in issue_ids]
+        )
+
+    async def get_stats(self, issue_ids: list) -> list:
+        return await self._run(self._read_many, [("vote_stats", x) for x in issue_ids])
+
+    async def page_documents(
+        self, collection: str, after: str | None, limit: int, keys_only: bool = False
+    ) -> list:
+        return await self._run(self._page, collection, after, limit)
+
+    async def get_documents(self, collection: str, doc_ids: list) -> list:
+        return await self._run(self._read_many, [(collection, x) for x in doc_ids])
+
+    async def set_document(self, collection: str, doc_id: str, data: dict) -> None:
+        await self._run(self._set, collection, doc_id, data)
+
+    async def create_document(self, collection: str, doc_id: str, data: dict) -> None:
+        await self._run(self._create, collection, doc_id, data)
+
+    async def delete_documents(self, collection: str, doc_ids: list) -> None:
+        if doc_ids:
+            await self._run(self._delete_many, collection, list(doc_ids))
+
+    def _create(self, collection: str, doc_id: str, data: dict) -> None:
+        with self._transaction():
+            if self._get(collection, doc_id) is not None:
+                raise DocumentExists(f"{collection}/{doc_id} 이미 있습니다")
+            self._put(collection, doc_id, dict(data), self._now())
+
+    def _set(self, collection: str, doc_id: str, data: dict) -> None:
+        with self._transaction():
+            self._put(collection, doc_id, dict(data), self._now())
+
+    def _delete_many(self, collection: str, doc_ids: list) -> None:
+        with self._transaction():
+            for doc_id in doc_ids:
+                self._remove(collection, doc_id)
+
+
+class MemoryRepository(DocumentRepository):
+    """프로세스 메모리에만 두는 저장소 (부하 테스트 / 단위 테스트용, 재시작하면 사라진다)"""
+
+    name = "memory"
+
+    def __init__(self):
+        super().__init__()
+        self._collections = {}
+
+    def _get(self, collection, doc_id):
+        found = self._collections.get(collection, {}).get(doc_id)
+        # 호출 쪽이 고쳐도 저장된 값은 그대로 두도록 복사해서 준다
+        return None if found is None else (dict(found[0]), found[1])
+
+    def _put(self, collection, doc_id, data, update_time):
+        self._collections.setdefault(collection, {})[doc_id] = (data, update_time)
+
+    def _remove(self, collection, doc_id):
+        self._collections.get(collection, {}).pop(doc_id, None)
+
+    def _scan(self, collection):
+        docs = self._collections.get(collection, {})
+        return [(doc_id, dict(data)) for doc_id, (data, _) in docs.items()]
+
+
+class SQLiteRepository(DocumentRepository):
+    """
+    문서를 JSON 으로 SQLite 한 테이블에 둔다 (데모용 로컬 복제본).
+    sqlite3 호출은 이벤트 루프를 막지 않도록 스레드에서, 연결 하나를 락으로 나눠 쓴다.
+    """
+
+    name = "sqlite"
+
+    def __init__(self, path: str):
+        super().__init__()
+        self.path = path
+        self._conn = sqlite3.connect(path, check_same_thread=False, isolation_level=None)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS documents (
+                collection TEXT NOT NULL,
+                id TEXT NOT NULL,
+                data TEXT NOT NULL,
+                update_time TEXT NOT NULL,
+                PRIMARY KEY (collection, id)
+            )
+            """
+        )
+
+    @contextmanager
+    def _transaction(self):
+        with self._lock:
+            self._conn.execute("BEGIN IMMEDIATE")
+            try:
+                yield
+            except BaseException:
+                self._conn.execute("ROLLBACK")
+                raise
+            self._conn.execute("COMMIT")
+
+    async def _run(self, fn, *args):
+        with span("sqlite", fn.__name__.lstrip("_")):
+            return await asyncio.to_thread(fn, *args)
+
+    def _get(self, collection, doc_id):
+        row = self._conn.execute(
+            "SELECT data, update_time FROM documents WHERE collection = ? AND id = ?",
+            (collection, doc_id),
+        ).fetchone()
+        return None if row is None else (json.loads(row[0]), row[1])
+
+    def _put(self, collection, doc_id, data, update_time):
+        # datetime 등은 serialization.dumps 와 같은 규칙으로 문자열이 된다
+        self._conn.execute(
+            "INSERT OR REPLACE INTO documents (collection, id, data, update_time)"
+            " VALUES (?, ?, ?, ?)",
+            (collection, doc_id, dumps(data).decode("utf-8"), update_time),
+        )
+
+    def _remove(self, collection, doc_id):
+        self._conn.execute(
+            "DELETE FROM documents WHERE collection = ? AND id = ?", (collection, doc_id)
+        )
+
+    def _scan(self, collection):
+        rows = self._conn.execute(
+            "SELECT id, data FROM documents WHERE collection = ?", (collection,)
+        ).fetchall()
+        return [(doc_id, json.loads(data)) for doc_id, data in rows]
+
+    def _page(self, collection, after, limit):
+        # 기본 키 (collection, id) 인덱스로 한 페이지만 읽는다
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT id, data FROM documents WHERE collection = ? AND id > ?"
+                " ORDER BY id LIMIT ?",
+                (collection, after or "", limit),
+            ).fetchall()
+        return [(doc_id, json.loads(data)) for doc_id, data in rows]
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
+
+
+def make_repository(kind: str, slots=None, **options) -> Repository:
+    """STORAGE_BACKEND 환경변수 값(firestore / memory / sqlite)으로 저장소를 만든다."""
+    kind = (kind or "firestore").strip().lower()
+
+    if kind == "firestore":
+        return FirestoreRepository(slots, credentials_path=options.get("credentials_path"))
+
+    if kind == "memory":
+        repository = MemoryRepository()
+    elif kind == "sqlite":
+        repository = SQLiteRepository(options.get("path") or "dojun.sqlite3")
+    else:
+        raise ValueError(f"알 수 없는 STORAGE_BACKEND: {kind}")
+
+    if options.get("seed_file"):
+        repository.load_seed(options["seed_file"])
+    return repository
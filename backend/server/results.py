@@ -0,0 +1,254 @@
+import asyncio
+import hashlib
+import json
+import logging
+from datetime import datetime, timezone
+
+from .repository import DocumentExists, ballots_collection
+from .vote_hub import LEGACY_CHOICE_LABELS
+
+logger = logging.getLogger(__name__)
+
+# 마감된 투표의 최종 결과 (문서 id = 안건 id). 한 번 만들면 고치지 않는다
+RESULTS_COLLECTION = "vote_results"
+RESULTS_VERSION = 1
+
+
+def results_checksum(data: dict) -> str:
+    """결과 내용(안건, 선택지, 득표, 참여 수)의 sha256. 저장 시각은 넣지 않는다"""
+    content = {
+        "issueId": data.get("issueId"),
+        "labels": list(data.get("labels") or []),
+        "counts": list(data.get("counts") or []),
+        "total": data.get("total"),
+        "eligible": data.get("eligible"),
+    }
+    raw = json.dumps(content, ensure_ascii=False, sort_keys=True, separators=(",", ":"))
+    return hashlib.sha256(raw.encode("utf-8")).hexdigest()
+
+
+def ballot_selections(data: dict) -> list:
+    """
+    응답 문서 하나의 선택지 목록. 예전 앱이 쓰는 {"choice": "yes"|"no"|"hold"} 는
+    summarize_vote_stats 와 같은 찬성/반대/보류 라벨로 바꾼다.
+    """
+    selected = data.get("selectedOptions")
+    if selected:
+        return list(selected)
+    label = dict(LEGACY_CHOICE_LABELS).get(data.get("choice"))
+    return [label] if label else []
+
+
+def tally(options: list, ballots) -> tuple:
+    """
+    ballots: selectedOptions 목록들 -> (labels, counts, 응답 수)
+    안건 선택지 순서를 따르고, 목록에 없는 선택은 처음 나온 순서대로 뒤에 붙인다.
+    """
+    labels = [str(x) for x in options or []]
+    index = {label: i for i, label in enumerate(labels)}
+    counts = [0] * len(labels)
+    total = 0
+
+    for selected in ballots:
+        total += 1
+        # 한 응답 안에서 같은 선택지를 두 번 세지 않는다
+        for label in dict.fromkeys(str(x) for x in selected or []):
+            if label not in index:
+                index[label] = len(labels)
+                labels.append(label)
+                counts.append(0)
+            counts[index[label]] += 1
+
+    return labels, counts, total
+
+
+def build_results(issue_id: str, labels: list, counts: list, total: int, eligible=None) -> dict:
+    """저장할 모양 (비율/참여율은 읽을 때 계산할 수 있어서 저장하지 않는다)"""
+    data = {
+        "v": RESULTS_VERSION,
+        "issueId": issue_id,
+        "labels": labels,
+        "counts": counts,
+        "total": total,
+        "eligible": eligible or None,
+        "frozenAt": datetime.now(timezone.utc).isoformat(),
+    }
+    data["checksum"] = results_checksum(data)
+    return data
+
+
+def _percent(part: int, whole) -> float | None:
+    if not whole:
+        return None
+    return round(part * 100 / whole, 1)
+
+
+def serialize_results(data: dict) -> dict:
+    """vote_results 문서 -> summarize_vote_stats 모양 + 비율/참여율/체크섬"""
+    total = int(data.get("total") or 0)
+    eligible = data.get("eligible")
+    return {
+        "final": True,
+        "total": total,
+        "options": [
+            {"label": label, "count": count, "percent": _percent(count, total) or 0.0}
+            for label, count in zip(data.get("labels") or [], data.get("counts") or [])
+        ],
+        "eligible": eligible,
+        "turnout": _percent(total, eligible),
+        "frozenAt": data.get("frozenAt"),
+        "checksum": data.get("checksum"),
+    }
+
+
+class ResultsFreezer:
+    """
+    투표/설문이 closed 가 되면 ballots 를 처음부터 다시 세어 최종 결과를 vote_results 에 한 번만 쓴다.
+
+    - 이후 결과 읽기는 이 문서 하나만 읽는다 (늦게 들어온 쓰기나 vote_stats 재계산에 흔들리지 않는다)
+    - 여러 워커가 동시에 만들어도 create 라서 먼저 쓴 하나만 남는다
+    - 다시 열린(closed 가 아닌) 안건의 결과는 지운다. 다시 마감하면 그때 새로 만든다
+    - schedule() 은 다른 스레드(미러 리스너)에서도 부를 수 있다
+    """
+
+    def __init__(self, repository, eligible: int = 0, page_size: int = 500):
+        self.repository = repository
+        self.eligible = eligible
+        self.page_size = page_size
+        self._running = {}
+        self._known = set()
+        self._loop = None
+        self._sweep_task = None
+
+        self.frozen = 0
+        self.last_error = ""
+
+    def bind(self, loop) -> None:
+        self._loop = loop
+
+    def schedule(self, issue_id: str, options: list) -> None:
+        if self._loop is not None:
+            self._loop.call_soon_threadsafe(self._start, issue_id, options)
+
+    def schedule_discard(self, issue_id: str) -> None:
+        if self._loop is not None:
+            self._loop.call_soon_threadsafe(self._start_discard, issue_id)
+
+    def _start_discard(self, issue_id: str) -> None:
+        # 이 워커가 확정했거나 확인한 결과만 본다 (나머지는 sweep() 이 정리)
+        if issue_id in self._known:
+            self._known.discard(issue_id)
+            asyncio.create_task(self._discard_logged([issue_id]))
+
+    async def _discard_logged(self, issue_ids: list) -> None:
+        try:
+            await self.discard(issue_ids)
+        except Exception as e:
+            self.last_error = repr(e)
+            logger.warning("최종 결과 삭제 실패", extra={"issue_ids": issue_ids, "error": repr(e)})
+
+    async def discard(self, issue_ids: list) -> None:
+        """다시 열린 안건의 최종 결과를 지운다"""
+        self._known.difference_update(issue_ids)
+        await self.repository.delete_documents(RESULTS_COLLECTION, issue_ids)
+        logger.info("다시 열린 안건의 최종 결과 삭제", extra={"issue_ids": issue_ids})
+
+    def _start(self, issue_id: str, options: list) -> None:
+        # 마감된 안건은 이후 수정될 때마다 알림이 오므로, 이미 확정한 것은 다시 읽지 않는다
+        if issue_id not in self._running and issue_id not in self._known:
+            task = asyncio.create_task(self._freeze_logged(issue_id, options))
+            self._running[issue_id] = task
+            task.add_done_callback(lambda _task: self._running.pop(issue_id, None))
+
+    async def _freeze_logged(self, issue_id: str, options: list) -> None:
+        try:
+            await self.freeze(issue_id, options)
+        except Exception as e:
+            # 다음 시작 때 sweep() 이 다시 만든다
+            self.last_error = repr(e)
+            logger.warning("최종 결과 확정 실패", extra={"issue_id": issue_id, "error": repr(e)})
+
+    async def freeze(self, issue_id: str, options: list) -> dict:
+        """최종 결과를 만들어 돌려준다. 이미 있으면 있는 것을 그대로 돌려준다"""
+        (existing,) = await self.repository.get_documents(RESULTS_COLLECTION, [issue_id])
+        if existing is not None:
+            self._known.add(issue_id)
+            return existing
+
+        selections = []
+        after = None
+        while True:
+            page = await self.repository.page_documents(
+                ballots_collection(issue_id), after, self.page_size
+            )
+            selections.extend(ballot_selections(data) for _, data in page)
+            if len(page) < self.page_size:
+                break
+            after = page[-1][0]
+
+        labels, counts, total = tally(options, selections)
+        data = build_results(issue_id, labels, counts, total, self.eligible)
+        try:
+            await self.repository.create_document(RESULTS_COLLECTION, issue_id, data)
+        except DocumentExists:
+            (data,) = await self.repository.get_documents(RESULTS_COLLECTION, [issue_id])
+            self._known.add(issue_id)
+            return data
+
+        self._known.add(issue_id)
+        self.frozen += 1
+        logger.info("최종 결과 확정", extra={"issue_id": issue_id, "total": total})
+        return data
+
+    async def sweep(self, issues: list) -> int:
+        """
+        issues: 정규화된 투표/설문 목록. 리스너가 보지 못한 동안(리더가 없거나 서버가 꺼져 있는 동안)의
+        변화를 맞춘다: 마감됐는데 결과가 없으면 확정하고, 다시 열렸는데 결과가 남아 있으면 지운다.
+        새로 확정한 수를 돌려준다
+        """
+        if not issues:
+            return 0
+
+        existing = await self.repository.get_documents(
+            RESULTS_COLLECTION, [x["id"] for x in issues]
+        )
+        closed = [(x, data) for x, data in zip(issues, existing) if x.get("status") == "closed"]
+        reopened = [
+            x["id"]
+            for x, data in zip(issues, existing)
+            if x.get("status") != "closed" and data is not None
+        ]
+
+        self._known.update(x["id"] for x, data in closed if data is not None)
+        if reopened:
+            await self.discard(reopened)
+
+        missing = [x for x, data in closed if data is None]
+        for issue in missing:
+            await self.freeze(issue["id"], issue.get("options") or [])
+        return len(missing)
+
+    def start_sweep(self, load_issues) -> None:
+        """load_issues: 정규화된 투표/설문 목록을 돌려주는 async 함수. sweep 을 뒤에서 돌린다"""
+        if self._sweep_task is None or self._sweep_task.done():
+            self._sweep_task = asyncio.create_task(self._sweep_logged(load_issues))
+
+    async def _sweep_logged(self, load_issues) -> None:
+        try:
+            await self.sweep(await load_issues())
+        except Exception as e:
+            self.last_error = repr(e)
+            logger.warning("마감 안건 최종 결과 확인 실패", extra={"error": repr(e)})
+
+    def cancel(self) -> None:
+        if self._sweep_task is not None:
+            self._sweep_task.cancel()
+        for task in list(self._running.values()):
+            task.cancel()
+
+    def stats(self) -> dict:
+        return {
+            "frozen": self.frozen,
+            "running": len(self._running),
+            "last_error": self.last_error,
+        }
@@ -0,0 +1,36 @@
+import json
+
+from fastapi.responses import Response
+
+from .tracing import span
+
+try:
+    import orjson
+except ImportError:  # orjson 이 없으면 표준 json 으로 동작
+    orjson = None
+
+
+def _default(value):
+    # Firestore 타임스탬프(DatetimeWithNanoseconds) 등은 문자열로 내보낸다
+    if hasattr(value, "isoformat"):
+        return value.isoformat()
+    return str(value)
+
+
+def dumps(payload) -> bytes:
+    """한글은 그대로(UTF-8), 공백 없이 직렬화한다."""
+    if orjson is not None:
+        return orjson.dumps(payload, default=_default, option=orjson.OPT_NON_STR_KEYS)
+    return json.dumps(
+        payload, ensure_ascii=False, separators=(",", ":"), default=_default
+    ).encode("utf-8")
+
+
+class FastJSONResponse(Response):
+    """orjson 으로 직렬화하는 JSONResponse"""
+
+    media_type = "application/json"
+
+    def render(self, content) -> bytes:
+        with span("serialize"):
+            return dumps(content)
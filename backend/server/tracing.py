@@ -0,0 +1,163 @@
+import contextvars
+import heapq
+import itertools
+import threading
+import time
+from contextlib import contextmanager
+from datetime import datetime, timezone
+
+# Server-Timing 헤더가 너무 길어지지 않도록 (배치 요청 등)
+MAX_HEADER_SPANS = 20
+
+
+class Trace:
+    """요청 하나의 구간(span) 기록. 시각은 요청 시작 기준 초 단위"""
+
+    __slots__ = ("method", "path", "started", "spans")
+
+    def __init__(self, method: str, path: str):
+        self.method = method
+        self.path = path
+        self.started = time.perf_counter()
+        self.spans = []
+
+    def add(self, name: str, started: float, duration: float, desc: str = "") -> None:
+        self.spans.append((name, started - self.started, duration, desc))
+
+
+_current_trace = contextvars.ContextVar("current_trace", default=None)
+
+
+def add_span(name: str, started: float, duration: float, desc: str = "") -> None:
+    trace = _current_trace.get()
+    if trace is not None:
+        trace.add(name, started, duration, desc)
+
+
+@contextmanager
+def span(name: str, desc: str = ""):
+    """with span("auth"): ... - async 함수 안에서 await 를 감싸도 된다"""
+    started = time.perf_counter()
+    try:
+        yield
+    finally:
+        add_span(name, started, time.perf_counter() - started, desc)
+
+
+def server_timing(trace: Trace, total: float) -> str:
+    entries = [f"total;dur={total * 1000:.2f}"]
+
+    for name, _offset, duration, desc in trace.spans[:MAX_HEADER_SPANS]:
+        entry = f"{name};dur={duration * 1000:.2f}"
+        if desc:
+            entry += f';desc="{desc}"'
+        entries.append(entry)
+
+    if len(trace.spans) > MAX_HEADER_SPANS:
+        entries.append(f'more;desc="{len(trace.spans) - MAX_HEADER_SPANS} spans"')
+    return ", ".join(entries)
+
+
+class SlowTraceStore:
+    """가장 느린 N 개 요청 기록만 남긴다 (최소 힙이라 더 빠른 기록부터 밀려난다)"""
+
+    def __init__(self, capacity: int = 50):
+        self.capacity = capacity
+        self._heap = []
+        self._counter = itertools.count()
+        self._lock = threading.Lock()
+
+    def accepts(self, duration: float) -> bool:
+        with self._lock:
+            if self.capacity <= 0:
+                return False
+            return len(self._heap) < self.capacity or duration > self._heap[0][0]
+
+    def add(self, duration: float, record: dict) -> None:
+        if self.capacity <= 0:
+            return
+
+        item = (duration, next(self._counter), record)
+        with self._lock:
+            if len(self._heap) < self.capacity:
+                heapq.heappush(self._heap, item)
+            elif duration > self._heap[0][0]:
+                heapq.heapreplace(self._heap, item)
+
+    def slowest(self) -> list:
+        with self._lock:
+            items = sorted(self._heap, key=lambda x: x[0], reverse=True)
+        return [record for _, _, record in items]
+
+    def clear(self) -> None:
+        with self._lock:
+            self._heap.clear()
+
+
+class TracingMiddleware:
+    """
+    요청마다 Trace 를 열고, 응답 헤더에 Server-Timing 을 붙인 뒤
+    느린 요청은 SlowTraceStore 에 남긴다.
+    """
+
+    def __init__(self, app, store: SlowTraceStore):
+        self.app = app
+        self.store = store
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        trace = Trace(scope.get("method", ""), scope.get("path", ""))
+        token = _current_trace.set(trace)
+        status_code = 500
+        event_stream = False
+
+        async def send_wrapper(message):
+            nonlocal status_code, event_stream
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+                content_type = dict(message.get("headers") or []).get(b"content-type", b"")
+                event_stream = content_type.startswith(b"text/event-stream")
+                header = server_timing(trace, time.perf_counter() - trace.started)
+                message = {
+                    **message,
+                    "headers": list(message.get("headers") or [])
+                    + [(b"server-timing", header.encode("latin-1"))],
+                }
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            _current_trace.reset(token)
+            duration = time.perf_counter() - trace.started
+
+            # SSE 는 연결이 길게 유지될 뿐 느린 요청이 아니다
+            if not event_stream and self.store.accepts(duration):
+                self._keep(scope, trace, status_code, duration)
+
+    def _keep(self, scope, trace: Trace, status_code: int, duration: float) -> None:
+        route = getattr(scope.get("route"), "path", None)
+
+        self.store.add(
+            duration,
+            {
+                "method": trace.method,
+                "path": trace.path,
+                "route": route,
+                "status": status_code,
+                "duration_ms": round(duration * 1000, 2),
+                "at": datetime.now(timezone.utc).isoformat(),
+                "spans": [
+                    {
+                        "name": name,
+                        "desc": desc,
+                        "start_ms": round(offset * 1000, 2),
+                        "duration_ms": round(length * 1000, 2),
+                    }
+                    for name, offset, length, desc in trace.spans
+                ],
+            },
+        )
@@ -0,0 +1,164 @@
+import asyncio
+import threading
+from collections import defaultdict
+
+LEGACY_CHOICE_LABELS = (("yes", "찬성"), ("no", "반대"), ("hold", "보류"))
+
+
+def summarize_vote_stats(data: dict) -> dict:
+    """vote_stats 문서를 모바일 fetch_vote_stats 와 같은 {"total", "options"} 모양으로 바꾼다."""
+    data = data or {}
+    option_counts = data.get("optionCounts") or {}
+
+    if option_counts:
+        options = []
+        for label, count in option_counts.items():
+            try:
+                count = int(count or 0)
+            except (TypeError, ValueError):
+                count = 0
+            options.append({"label": label, "count": count})
+        return {"total": sum(x["count"] for x in options), "options": options}
+
+    counts = {}
+    for key, _ in LEGACY_CHOICE_LABELS:
+        try:
+            counts[key] = int(data.get(key, 0) or 0)
+        except (TypeError, ValueError):
+            counts[key] = 0
+
+    try:
+        total = int(data.get("total", sum(counts.values())) or 0)
+    except (TypeError, ValueError):
+        total = sum(counts.values())
+
+    return {
+        "total": total,
+        "options": [
+            {"label": label, "count": counts[key]} for key, label in LEGACY_CHOICE_LABELS
+        ],
+    }
+
+
+def revoked_frame(issue_id: str) -> dict:
+    return {"type": "revoked", "issueId": issue_id}
+
+
+class VoteSubscriber:
+    """
+    WebSocket 연결 하나.
+    보내지 못한 프레임은 안건별로 최신 것만 남겨서, 느린 클라이언트는 중간 값을 건너뛴다.
+    """
+
+    def __init__(self):
+        self.issue_ids = set()
+        self._pending = {}
+        self._ready = asyncio.Event()
+
+    def offer(self, issue_id: str, frame: dict) -> None:
+        self._pending[issue_id] = frame
+        self._ready.set()
+
+    async def next_frames(self) -> list:
+        await self._ready.wait()
+        self._ready.clear()
+        frames, self._pending = self._pending, {}
+        return list(frames.values())
+
+
+class VoteResultsHub:
+    """
+    vote_stats 컬렉션 on_snapshot 리스너 하나로 모든 구독자에게 집계를 보낸다.
+    같은 안건의 변경은 interval 초에 한 번만 방송한다 (첫 변경은 바로 보냄).
+    """
+
+    def __init__(self, interval: float = 0.25):
+        self.interval = interval
+        self._latest = {}
+        self._subscribers = defaultdict(set)
+        self._last_sent = {}
+        self._scheduled = set()
+        self._loop = None
+        self._watch = None
+        self._start_lock = threading.Lock()
+
+    def start(self, collection_ref) -> None:
+        """collection_ref 는 동기 Firestore 클라이언트의 vote_stats 컬렉션 참조"""
+        with self._start_lock:
+            if self._watch is not None:
+                return
+
+            self._loop = asyncio.get_running_loop()
+
+            def on_snapshot(_docs, changes, _read_time):
+                for change in changes:
+                    doc = change.document
+                    if change.type.name == "REMOVED":
+                        summary = {"total": 0, "options": []}
+                    else:
+                        summary = summarize_vote_stats(doc.to_dict() or {})
+                    self._loop.call_soon_threadsafe(self._on_change, doc.id, summary)
+
+            self._watch = collection_ref.on_snapshot(on_snapshot)
+
+    def stop(self) -> None:
+        with self._start_lock:
+            if self._watch is not None:
+                self._watch.unsubscribe()
+                self._watch = None
+
+    def _frame(self, issue_id: str) -> dict:
+        return {"type": "stats", "issueId": issue_id, "stats": self._latest[issue_id]}
+
+    def _on_change(self, issue_id: str, summary: dict) -> None:
+        if self._latest.get(issue_id) == summary:
+            return
+
+        self._latest[issue_id] = summary
+        if not self._subscribers.get(issue_id) or issue_id in self._scheduled:
+            return
+
+        now = self._loop.time()
+        delay = max(0.0, self._last_sent.get(issue_id, 0.0) + self.interval - now)
+        self._scheduled.add(issue_id)
+        self._loop.call_later(delay, self._flush, issue_id)
+
+    def _flush(self, issue_id: str) -> None:
+        self._scheduled.discard(issue_id)
+        self._last_sent[issue_id] = self._loop.time()
+
+        frame = self._frame(issue_id)
+        for subscriber in self._subscribers.get(issue_id, ()):
+            subscriber.offer(issue_id, frame)
+
+    def subscribe(self, subscriber: VoteSubscriber, issue_ids) -> None:
+        for issue_id in issue_ids:
+            self._subscribers[issue_id].add(subscriber)
+            subscriber.issue_ids.add(issue_id)
+
+            # 이미 알고 있는 값은 바로 보내준다
+            if issue_id in self._latest:
+                subscriber.offer(issue_id, self._frame(issue_id))
+
+    def revoke(self, issue_ids) -> None:
+        """결과를 더 볼 수 없게 된 안건의 구독을 모두 끊는다 (보내지 않은 집계 대신 revoked 를 보냄)"""
+        for issue_id in issue_ids:
+            for subscriber in self._subscribers.pop(issue_id, ()):
+                subscriber.issue_ids.discard(issue_id)
+                subscriber.offer(issue_id, revoked_frame(issue_id))
+
+    def schedule_revoke(self, issue_ids) -> None:
+        """다른 스레드(미러 리스너)에서 부른다"""
+        if self._loop is not None:
+            self._loop.call_soon_threadsafe(self.revoke, list(issue_ids))
+
+    def unsubscribe(self, subscriber: VoteSubscriber, issue_ids=None) -> None:
+        targets = set(subscriber.issue_ids if issue_ids is None else issue_ids)
+
+        for issue_id in targets:
+            subscribers = self._subscribers.get(issue_id)
+            if subscribers is not None:
+                subscribers.discard(subscriber)
+                if not subscribers:
+                    del self._subscribers[issue_id]
+            subscriber.issue_ids.discard(issue_id)
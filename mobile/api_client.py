@@ -1,8 +1,58 @@
+import json
+
 import requests
 
+try:
+    import websocket  # websocket-client (실시간 결과 모드에서만 사용)
+except ImportError:
+    websocket = None
+
+try:
+    from applog import get_logger
+except ModuleNotFoundError:
+    from mobile.applog import get_logger
+
+logger = get_logger("api_client")
+
 PROJECT_ID = "unionapp-27bbd"
 ISSUES_COLLECTION = "issues_public"
 
+# 백엔드가 issues_public 을 한 문서로 묶어 둔 공개 피드 (payload 는 JSON 문자열)
+FEED_COLLECTION = "public_feed"
+FEED_DOCUMENT = "current"
+
+# url -> {"etag": str, "payload": dict|list}
+_CONDITIONAL_CACHE = {}
+
+
+def _conditional_get(url: str, headers: dict | None = None, timeout: int = 15):
+    """
+    이전 응답의 ETag 를 If-None-Match 로 보내고,
+    304 면 저장해 둔 본문을 그대로 돌려준다.
+    반환값: (response, payload)  - 실패 응답이면 payload 는 None
+    """
+    request_headers = dict(headers or {})
+    cached = _CONDITIONAL_CACHE.get(url)
+    if cached:
+        request_headers["If-None-Match"] = cached["etag"]
+
+    r = requests.get(url, headers=request_headers, timeout=timeout)
+
+    if r.status_code == 304 and cached:
+        return r, cached["payload"]
+
+    if r.status_code != 200:
+        return r, None
+
+    payload = r.json()
+    etag = r.headers.get("ETag")
+    if etag:
+        _CONDITIONAL_CACHE[url] = {"etag": etag, "payload": payload}
+    else:
+        _CONDITIONAL_CACHE.pop(url, None)
+
+    return r, payload
+
 
 def _get_string(fields: dict, key: str, default: str = "") -> str:
     field = fields.get(key) or {}
@@ -52,29 +102,78 @@ def _get_string_array(fields: dict, key: str) -> list[str]:
     return result
 
 
-def fetch_public_issues(id_token: str):
+def fetch_public_feed(id_token: str):
+    """
+    public_feed/current 한 문서로 공개 안건 목록을 읽는다.
+    피드가 아직 없거나 읽을 수 없으면 None (호출 쪽이 컬렉션 조회로 돌아간다)
+    """
+    base = (
+        "https://firestore.googleapis.com/v1/"
+        f"projects/{PROJECT_ID}/databases/(default)/documents/{FEED_COLLECTION}"
+    )
+    headers = {"Authorization": f"Bearer {id_token}"}
+
+    r, payload = _conditional_get(f"{base}/{FEED_DOCUMENT}", headers=headers, timeout=15)
+    logger.debug("fetch_public_feed status: %s", r.status_code)
+
+    if r.status_code == 401:
+        raise PermissionError("401 인증 만료: 다시 로그인 필요")
+    if payload is None:
+        return None
+
+    fields = payload.get("fields", {}) or {}
+    version = _get_integer(fields, "version", 0)
+    chunks = max(1, _get_integer(fields, "chunks", 1))
+    parts = [_get_string(fields, "payload")]
+
+    # 1MiB 를 넘는 피드는 current_v{version}_{n} 문서에 이어서 담겨 있다
+    for index in range(1, chunks):
+        r = requests.get(
+            f"{base}/{FEED_DOCUMENT}_v{version}_{index}", headers=headers, timeout=15
+        )
+        if r.status_code != 200:
+            # 읽는 사이 새 버전으로 바뀌었을 수 있다
+            return None
+        chunk_fields = r.json().get("fields", {}) or {}
+        parts.append((chunk_fields.get("payload") or {}).get("stringValue", ""))
+
+    try:
+        issues = json.loads("".join(parts) or "[]")
+    except ValueError:
+        return None
+
+    return issues if isinstance(issues, list) else None
+
+
+def fetch_public_issues(id_token: str, source: str = "collection"):
     if not id_token:
         raise PermissionError("로그인 토큰이 없습니다.")
 
+    if source == "feed":
+        issues = fetch_public_feed(id_token)
+        if issues is not None:
+            return issues
+
     url = (
         "https://firestore.googleapis.com/v1/"
         f"projects/{PROJECT_ID}/databases/(default)/documents/{ISSUES_COLLECTION}"
     )
     headers = {"Authorization": f"Bearer {id_token}"}
 
-    r = requests.get(url, headers=headers, timeout=15)
+    r, payload = _conditional_get(url, headers=headers, timeout=15)
 
-    print("fetch_public_issues status:", r.status_code)
-    print("fetch_public_issues url:", r.url)
+    logger.debug("fetch_public_issues status: %s", r.status_code)
+    logger.debug("fetch_public_issues url: %s", r.url)
 
     if r.status_code == 401:
         raise PermissionError("401 인증 만료: 다시 로그인 필요")
     if r.status_code == 403:
         raise PermissionError("403 권한 거부: issues_public 읽기 권한 확인 필요")
 
-    r.raise_for_status()
+    if payload is None:
+        r.raise_for_status()
+        payload = {}
 
-    payload = r.json()
     docs = payload.get("documents", []) or []
 
     def s(fields, key, default=""):
@@ -132,7 +231,191 @@ def fetch_public_issues(id_token: str):
                 "active": b(fields, "active", True),
                 "isPinned": b(fields, "isPinned", False),
                 "order": i(fields, "order", 999999),
+                "orderKey": s(fields, "orderKey"),
             }
         )
 
-    return results
\ No newline at end of file
+    return results
+
+
+def fetch_backend_issues(base_url: str, timeout: int = 15) -> list:
+    """백엔드 GET /issues 를 조건부 요청으로 읽는다 (변경 없으면 304)."""
+    url = f"{base_url.rstrip('/')}/issues"
+    r, payload = _conditional_get(url, timeout=timeout)
+
+    if payload is None:
+        r.raise_for_status()
+        return []
+
+    return list(payload or [])
+
+
+def fetch_bootstrap(base_url: str, id_token: str, timeout: int = 15):
+    """
+    백엔드 GET /mobile/bootstrap - 안건/버전/내 응답/집계를 한 번에 받는다.
+    실패하면 None (호출 쪽이 기존 개별 조회로 돌아간다)
+    """
+    url = f"{base_url.rstrip('/')}/mobile/bootstrap"
+    headers = {"Authorization": f"Bearer {id_token}"}
+    r, payload = _conditional_get(url, headers=headers, timeout=timeout)
+
+    logger.debug("fetch_bootstrap status: %s", r.status_code)
+
+    if r.status_code == 401:
+        raise PermissionError("401 인증 만료: 다시 로그인 필요")
+    if not isinstance(payload, dict):
+        return None
+
+    return payload
+
+
+def fetch_batch(base_url: str, id_token: str, operations, timeout: int = 15) -> dict:
+    """
+    백엔드 POST /batch - 여러 읽기를 한 요청으로 보낸다.
+    operations: [(op, issue_id), ...]  op 는 "issue" / "ballot" / "stats" / "version"
+    반환값: {(op, issue_id): data}  - 성공한 연산만 담긴다
+    """
+    url = f"{base_url.rstrip('/')}/batch"
+    headers = {"Authorization": f"Bearer {id_token}"}
+    body = {"operations": [{"op": op, "id": issue_id} for op, issue_id in operations]}
+
+    r = requests.post(url, headers=headers, json=body, timeout=timeout)
+    logger.debug("fetch_batch status: %s", r.status_code)
+
+    if r.status_code == 401:
+        raise PermissionError("401 인증 만료: 다시 로그인 필요")
+    r.raise_for_status()
+
+    results = {}
+    for item in r.json().get("results", []) or []:
+        if item.get("ok"):
+            results[(item.get("op"), item.get("id"))] = item.get("data")
+        else:
+            logger.warning(
+                "fetch_batch 연산 실패: %s %s %s",
+                item.get("op"),
+                item.get("id"),
+                item.get("error"),
+            )
+    return results
+
+
+def listen_issue_events(
+    base_url: str,
+    on_event,
+    stop_event,
+    source: str = ISSUES_COLLECTION,
+    read_timeout: int = 60,
+):
+    """
+    백엔드 GET /issues/stream (SSE) 을 읽으면서 이벤트마다 on_event(event, data) 를 호출한다.
+    연결이 끊기면 Last-Event-ID 로 이어받으며 재접속하고, stop_event 가 set 되면 끝낸다.
+    (별도 스레드에서 실행할 것)
+    """
+    url = f"{base_url.rstrip('/')}/issues/stream"
+    last_event_id = None
+
+    while not stop_event.is_set():
+        headers = {"Accept": "text/event-stream"}
+        if last_event_id:
+            headers["Last-Event-ID"] = last_event_id
+
+        try:
+            with requests.get(
+                url,
+                params={"source": source},
+                headers=headers,
+                stream=True,
+                timeout=(10, read_timeout),
+            ) as r:
+                r.raise_for_status()
+
+                event, data_lines = "message", []
+                for line in r.iter_lines(decode_unicode=True):
+                    if stop_event.is_set():
+                        return
+
+                    if not line:
+                        if data_lines:
+                            try:
+                                data = json.loads("\n".join(data_lines))
+                            except ValueError:
+                                data = {}
+                            on_event(event, data)
+                        event, data_lines = "message", []
+                        continue
+
+                    if line.startswith(":"):
+                        continue
+
+                    name, _, value = line.partition(":")
+                    if value.startswith(" "):
+                        value = value[1:]
+
+                    if name == "id":
+                        last_event_id = value
+                    elif name == "event":
+                        event = value
+                    elif name == "data":
+                        data_lines.append(value)
+
+        except Exception as e:
+            logger.error("listen_issue_events error: %s", repr(e))
+
+        stop_event.wait(5)
+
+
+def live_results_available() -> bool:
+    return websocket is not None
+
+
+def listen_vote_results(base_url: str, id_token: str, issue_ids, on_stats, stop_event):
+    """
+    백엔드 /ws/votes 에 접속해 issue_ids 의 집계를 구독하고
+    프레임마다 on_stats(issue_id, stats) 를 호출한다. (별도 스레드에서 실행할 것)
+    결과를 볼 수 없는 안건은 서버가 revoked 를 보내고, 모두 revoked 되면 끝낸다.
+    """
+    if websocket is None or not id_token:
+        return
+
+    issue_ids = set(issue_ids)
+    ws_url = (
+        base_url.rstrip("/")
+        .replace("https://", "wss://", 1)
+        .replace("http://", "ws://", 1)
+        + "/ws/votes"
+    )
+
+    while not stop_event.is_set():
+        ws = None
+        try:
+            ws = websocket.create_connection(
+                ws_url, timeout=10, header=[f"Authorization: Bearer {id_token}"]
+            )
+            ws.settimeout(1)
+            ws.send(json.dumps({"subscribe": sorted(issue_ids)}))
+
+            while not stop_event.is_set():
+                try:
+                    raw = ws.recv()
+                except websocket.WebSocketTimeoutException:
+                    continue
+
+                frame = json.loads(raw or "{}")
+                if frame.get("type") == "stats":
+                    on_stats(frame.get("issueId"), frame.get("stats") or {})
+                elif frame.get("type") == "revoked":
+                    issue_ids.discard(frame.get("issueId"))
+                    if not issue_ids:
+                        return
+
+        except Exception as e:
+            logger.error("listen_vote_results error: %s", repr(e))
+        finally:
+            if ws is not None:
+                try:
+                    ws.close()
+                except Exception:
+                    pass
+
+        stop_event.wait(3)
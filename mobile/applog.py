@@ -0,0 +1,80 @@
+import atexit
+import copy
+import logging
+import logging.handlers
+import queue
+import sys
+
+# Kivy 가 루트 로거에 핸들러를 달기 때문에 앱 로그는 이 이름 아래에서 따로 내보낸다
+ROOT_LOGGER = "dojun"
+
+# LogRecord 기본 속성 (이 밖의 속성은 extra= 로 넘긴 구조화 필드)
+_RECORD_ATTRS = set(vars(logging.makeLogRecord({}))) | {"message", "asctime", "taskName"}
+
+_listener = None
+_exc_formatter = logging.Formatter()
+
+
+class KeyValueFormatter(logging.Formatter):
+    """`LEVEL logger: 메시지 key=value ...` 한 줄 (logcat 에서 그대로 읽힌다)"""
+
+    def format(self, record):
+        line = f"{record.levelname} {record.name}: {record.getMessage()}"
+
+        fields = [
+            f"{key}={value!r}"
+            for key, value in vars(record).items()
+            if key not in _RECORD_ATTRS and not key.startswith("_")
+        ]
+        if fields:
+            line += " " + " ".join(fields)
+        if record.exc_info and not record.exc_text:
+            record.exc_text = self.formatException(record.exc_info)
+        if record.exc_text:
+            line += "\n" + record.exc_text
+        return line
+
+
+class DeferredQueueHandler(logging.handlers.QueueHandler):
+    """
+    메시지(msg % args)와 예외 traceback 만 넣는 쪽에서 문자열로 굳히고,
+    key=value 포맷과 출력은 리스너 스레드에서 한다.
+    """
+
+    def prepare(self, record):
+        record = copy.copy(record)
+        record.msg = record.getMessage()
+        record.args = None
+        if record.exc_info:
+            if not record.exc_text:
+                record.exc_text = _exc_formatter.formatException(record.exc_info)
+            record.exc_info = None
+        return record
+
+
+def get_logger(name: str) -> logging.Logger:
+    return logging.getLogger(f"{ROOT_LOGGER}.{name}")
+
+
+def setup_logging(level: str = "INFO", stream=None) -> None:
+    """
+    앱 로거에 큐 핸들러를 단다. 호출한 스레드는 큐에 넣기만 하고
+    포맷과 stdout(안드로이드에서는 logcat) 쓰기는 리스너 스레드가 한다.
+    """
+    global _listener
+
+    logger = logging.getLogger(ROOT_LOGGER)
+    logger.setLevel(str(level or "INFO").upper())
+    logger.propagate = False
+    if _listener is not None:
+        return
+
+    output = logging.StreamHandler(stream or sys.stdout)
+    output.setFormatter(KeyValueFormatter())
+
+    records = queue.SimpleQueue()
+    logger.addHandler(DeferredQueueHandler(records))
+    _listener = logging.handlers.QueueListener(records, output)
+    _listener.start()
+    # 종료 시 큐에 남은 로그를 마저 쓴다
+    atexit.register(_listener.stop)
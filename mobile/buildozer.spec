@@ -37,7 +37,7 @@ version = 1.0
 
 # (list) Application requirements
 # comma separated e.g. requirements = sqlite3,kivy
-requirements = python3,kivy==2.3.1,kivymd,requests,filetype
+requirements = python3,kivy==2.3.1,kivymd,requests,filetype,websocket-client
 
 
 # (str) Custom source folders for requirements
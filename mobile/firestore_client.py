@@ -2,6 +2,13 @@ import os
 from kivy.utils import platform
 import requests
 
+try:
+    from applog import get_logger
+except ModuleNotFoundError:
+    from mobile.applog import get_logger
+
+logger = get_logger("firestore_client")
+
 BASE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
 KEY_PATH = os.path.join(BASE_DIR, "firebase", "firebase_key.json")
 FIRESTORE_PROJECT_ID = "unionapp-27bbd"
@@ -65,7 +72,7 @@ if platform == "android":
             return {"yes": yes, "no": no, "hold": hold, "total": total}
 
         except Exception as e:
-            print("fetch_vote_summary(android) error:", repr(e))
+            logger.error("fetch_vote_summary(android) error: %s", repr(e))
             return {"yes": 0, "no": 0, "hold": 0, "total": 0}
 
 else:
@@ -1,5 +1,6 @@
 import os
 import json
+import logging
 import requests
 import time
 import threading
@@ -31,19 +32,37 @@ from kivy.uix.scrollview import ScrollView
 from kivy.clock import Clock
 
 try:
-    from api_client import fetch_public_issues
+    from api_client import (
+        fetch_batch,
+        fetch_bootstrap,
+        fetch_public_issues,
+        listen_issue_events,
+        listen_vote_results,
+        live_results_available,
+    )
     from firestore_client import (
         fetch_remote_version,
         fetch_version_meta,
         fetch_vote_summary,
     )
+    from applog import get_logger, setup_logging
 except ModuleNotFoundError:
-    from mobile.api_client import fetch_public_issues
+    from mobile.api_client import (
+        fetch_batch,
+        fetch_bootstrap,
+        fetch_public_issues,
+        listen_issue_events,
+        listen_vote_results,
+        live_results_available,
+    )
     from mobile.firestore_client import (
         fetch_remote_version,
         fetch_version_meta,
         fetch_vote_summary,
     )
+    from mobile.applog import get_logger, setup_logging
+
+logger = get_logger("main")
 
 
 def load_app_config():
@@ -53,11 +72,13 @@ def load_app_config():
             data = json.load(f)
             return data if isinstance(data, dict) else {}
     except Exception as e:
-        print("CONFIG LOAD ERROR:", e)
+        logger.error("CONFIG LOAD ERROR: %s", e)
         return {}
 
 
 APP_CONFIG = load_app_config()
+# app_config.json 의 logLevel 로 조절 (기본 INFO, 안건별 필터 로그는 DEBUG)
+setup_logging(APP_CONFIG.get("logLevel", "INFO"))
 
 APP_VERSION = "1.0.0"
 UPDATE_URL = "https://example.com/update"  # fallback 용도
@@ -68,6 +89,15 @@ ISSUES_COLLECTION = "issues_public"
 
 API_KEY = str(APP_CONFIG.get("apiKey", "") or "").strip()
 
+# 백엔드 주소가 있으면 SSE 로 변경 알림을 받고, 없으면 기존처럼 폴링만 한다
+API_BASE_URL = str(APP_CONFIG.get("apiBaseUrl", "") or "").strip()
+
+# 진행 중인 투표 상세 화면에서 결과를 WebSocket 으로 실시간 갱신 (apiBaseUrl 필요)
+LIVE_RESULTS = bool(APP_CONFIG.get("liveResults", True))
+
+# "feed" 면 public_feed/current 한 문서로 안건 목록을 읽는다 (없으면 컬렉션 조회)
+ISSUES_SOURCE = str(APP_CONFIG.get("issuesSource", "collection") or "collection").strip()
+
 LOCAL_ISSUES = []
 
 # =============================
@@ -173,24 +203,28 @@ def check_update_available():
 def get_filtered_issues(tab="전체"):
     rows = LOCAL_ISSUES or []
 
+    # 목록을 그릴 때마다 불리므로 debug 가 꺼져 있으면 안건별 로그는 만들지도 않는다
+    verbose = logger.isEnabledFor(logging.DEBUG)
+
     normalized = []
     for row in rows:
         issue = normalize_issue(row)
-        print(
-            "FILTER CHECK |",
-            "id:", issue.get("id"),
-            "| type:", issue.get("type"),
-            "| status:", issue.get("status"),
-            "| active:", issue.get("active"),
-            "| tab:", tab,
-        )
+        if verbose:
+            logger.debug(
+                "FILTER CHECK | id: %s | type: %s | status: %s | active: %s | tab: %s",
+                issue.get("id"),
+                issue.get("type"),
+                issue.get("status"),
+                issue.get("active"),
+                tab,
+            )
 
         if should_display_issue(issue, tab):
             normalized.append(issue)
 
     normalized.sort(key=sort_issue_key)
 
-    print("FILTERED COUNT:", len(normalized), "| TAB:", tab)
+    logger.debug("FILTERED COUNT: %s | TAB: %s", len(normalized), tab)
     return normalized
 
 
@@ -267,6 +301,7 @@ def normalize_issue(row: dict) -> dict:
         "active": active_value,
         "isPinned": pinned_value,
         "order": order_value,
+        "orderKey": str(row.get("orderKey") or "").strip(),
         "startAt": row.get("startAt") or "",
         "endAt": row.get("endAt") or "",
         "createdAt": created_at,
@@ -312,18 +347,24 @@ def should_display_issue(issue: dict, tab: str = "전체") -> bool:
     return True
 
 
-def sort_issue_key(issue: dict):
-    is_pinned = 1 if issue.get("isPinned") else 0
+def order_sort_value(issue: dict):
+    # 백엔드가 만든 정렬 키(orderKey)가 있으면 그것으로, 없는 예전 안건은 그 뒤에 order 순으로
+    order_key = str(issue.get("orderKey") or "").strip()
+    if order_key:
+        return (0, order_key)
 
     try:
-        order_value = int(issue.get("order", 999999) or 999999)
+        return (1, int(issue.get("order", 999999) or 999999))
     except Exception:
-        order_value = 999999
+        return (1, 999999)
+
 
+def sort_issue_key(issue: dict):
+    is_pinned = 1 if issue.get("isPinned") else 0
     created_at = issue.get("createdAt") or issue.get("updatedAt") or ""
 
     # ISO 문자열이면 문자열 정렬로도 시간순 정렬이 가능
-    return (-is_pinned, order_value, created_at)
+    return (-is_pinned, order_sort_value(issue), created_at)
 
 
 # =============================
@@ -829,7 +870,7 @@ class ExpandableIssueCard(MDCard):
             self.participant_label.text = f"👥 참여 {total}명"
 
         except Exception as e:
-            print("BADGE SET ERROR:", e)
+            logger.error("BADGE SET ERROR: %s", e)
             if self.issue_type != "notice":
                 self.badge.text = "결과 정보 없음"
                 self.participant_label.text = "👥 참여 0명"
@@ -2084,7 +2125,7 @@ class IssueDetailScreen(MDScreen):
     def show_issue(self, issue):
         issue_id = (issue or {}).get("id")
         if not issue_id:
-            print("ERROR show_issue: issue_id is None. issue =", issue)
+            logger.warning("ERROR show_issue: issue_id is None. issue = %s", issue)
             return
 
         self.current_issue = issue
@@ -2176,14 +2217,14 @@ class IssueDetailScreen(MDScreen):
                 ballot = app.fetch_my_ballot(issue.get("id"))
                 self.apply_my_ballot(ballot or {})
             except Exception as e:
-                print("FETCH_MY_BALLOT ERROR:", e)
+                logger.error("FETCH_MY_BALLOT ERROR: %s", e)
                 self.set_submit_button_state(False, "응답 제출")
 
             try:
                 if app.should_show_results(issue):
                     app.update_vote_summary(issue)
             except Exception as e:
-                print("UPDATE_RESULT ERROR:", e)
+                logger.error("UPDATE_RESULT ERROR: %s", e)
 
 # =============================
 # 업데이트 전용 화면
@@ -2229,6 +2270,9 @@ class MainApp(MDApp):
     _refreshing = False
     _last_issue_signature = None
     _auto_refresh_event = None
+    _issue_stream_stop = None
+    _stream_refresh_event = None
+    _live_results_stop = None
 
     _last_refresh_at = ""
     _last_refresh_ok = False
@@ -2269,7 +2313,7 @@ class MainApp(MDApp):
             with open(path, "w", encoding="utf-8") as f:
                 json.dump(list(issues or []), f, ensure_ascii=False)
         except Exception as e:
-            print("SAVE ISSUE CACHE ERROR:", e)
+            logger.error("SAVE ISSUE CACHE ERROR: %s", e)
 
     def load_issue_cache(self) -> list:
         try:
@@ -2281,7 +2325,7 @@ class MainApp(MDApp):
         except FileNotFoundError:
             return []
         except Exception as e:
-            print("LOAD ISSUE CACHE ERROR:", e)
+            logger.error("LOAD ISSUE CACHE ERROR: %s", e)
         return []
 
     def on_start(self):
@@ -2300,21 +2344,22 @@ class MainApp(MDApp):
             if cached:
                 LOCAL_ISSUES = cached
                 self._last_issue_signature = self.build_issue_signature(cached)
-                print("ISSUE CACHE LOADED:", len(cached))
+                logger.info("ISSUE CACHE LOADED: %s", len(cached))
         except Exception as e:
-            print("INITIAL ISSUE CACHE LOAD ERROR:", e)
+            logger.error("INITIAL ISSUE CACHE LOAD ERROR: %s", e)
 
         try:
             id_token, uid = firebase_anonymous_login()
             self.user_id_token = id_token
             self.user_uid = uid
-            print("LOGIN OK:", uid)
+            logger.info("LOGIN OK: %s", uid)
         except Exception as e:
-            print("LOGIN ERROR:", e)
+            logger.error("LOGIN ERROR: %s", e)
             self.user_id_token = None
             self.user_uid = None
 
-        self.refresh_issues(silent=True)
+        if not self.load_bootstrap():
+            self.refresh_issues(silent=True)
         self.update_dot_state()
         self.start_auto_refresh()
 
@@ -2336,7 +2381,47 @@ class MainApp(MDApp):
                     duration=1.5,
                 ).open()
         except Exception as e:
-            print("UPDATE STATE ERROR:", e)
+            logger.error("UPDATE STATE ERROR: %s", e)
+
+    def load_bootstrap(self) -> bool:
+        """
+        apiBaseUrl 이 있으면 첫 화면 데이터를 /mobile/bootstrap 한 번으로 받는다.
+        받은 버전/내 응답/집계는 이후 개별 조회 대신 한 번씩 쓰인다.
+        """
+        global LOCAL_ISSUES
+
+        self._bootstrap_version = None
+
+        if not API_BASE_URL or not getattr(self, "user_id_token", None):
+            return False
+
+        try:
+            data = fetch_bootstrap(API_BASE_URL, self.user_id_token)
+        except Exception as e:
+            logger.error("BOOTSTRAP ERROR: %s", e)
+            return False
+
+        if not data:
+            return False
+
+        issues = list(data.get("issues") or [])
+        LOCAL_ISSUES = issues
+        self._last_issue_signature = self.build_issue_signature(issues)
+        self._last_refresh_at = time.strftime("%Y-%m-%d %H:%M:%S")
+        self._last_refresh_ok = True
+        self.save_issue_cache(issues)
+
+        self._bootstrap_version = data.get("version") or None
+        for issue_id, ballot in (data.get("ballots") or {}).items():
+            self.put_prefetched("ballot", issue_id, ballot)
+
+        if not hasattr(self, "vote_cache"):
+            self.vote_cache = {}
+        self.vote_cache.update(data.get("stats") or {})
+
+        logger.info("BOOTSTRAP OK: %s", len(issues))
+        self.refresh_list_only()
+        return True
 
     def stop_update_dot_animation(self):
         try:
@@ -2349,12 +2434,17 @@ class MainApp(MDApp):
             dot.opacity = 0
 
         except Exception as e:
-            print("STOP UPDATE DOT ERROR:", e)
+            logger.error("STOP UPDATE DOT ERROR: %s", e)
 
 
     def update_dot_state(self):
+        bootstrap_version = getattr(self, "_bootstrap_version", None)
+
         try:
-            remote_v = fetch_remote_version()
+            if bootstrap_version is not None:
+                remote_v = int(bootstrap_version.get("version", 0) or 0)
+            else:
+                remote_v = fetch_remote_version()
         except Exception:
             remote_v = 0
 
@@ -2366,7 +2456,7 @@ class MainApp(MDApp):
             if not dot:
                 return
         except Exception as e:
-            print("UPDATE DOT STATE ERROR:", e)
+            logger.error("UPDATE DOT STATE ERROR: %s", e)
             return
 
         if remote_v > local_v:
@@ -2381,13 +2471,13 @@ class MainApp(MDApp):
         id_token, uid = firebase_anonymous_login()
         self.user_id_token = id_token
         self.user_uid = uid
-        print("RELOGIN OK:", uid)
+        logger.info("RELOGIN OK: %s", uid)
 
     def refresh_issues(self, *args, silent=False):
         global LOCAL_ISSUES
 
         if self._refreshing:
-            print("INFO: refresh ignored (already refreshing)")
+            logger.info("refresh ignored (already refreshing)")
             return
 
         self._refreshing = True
@@ -2407,20 +2497,20 @@ class MainApp(MDApp):
                     self.force_relogin()
 
                 try:
-                    fetched = fetch_public_issues(self.user_id_token)
+                    fetched = fetch_public_issues(self.user_id_token, ISSUES_SOURCE)
                 except Exception as first_error:
                     error_text = str(first_error)
-                    print("FIRST FETCH ERROR:", error_text)
+                    logger.error("FIRST FETCH ERROR: %s", error_text)
 
                     # 인증/권한 관련이면 토큰 재발급 후 1회 재시도
                     if any(x in error_text for x in ["401", "403", "Forbidden", "인증", "권한"]):
-                        print("AUTH ERROR -> TRY RELOGIN")
+                        logger.warning("AUTH ERROR -> TRY RELOGIN")
                         self.force_relogin()
-                        fetched = fetch_public_issues(self.user_id_token)
+                        fetched = fetch_public_issues(self.user_id_token, ISSUES_SOURCE)
                     else:
                         raise
 
-                print("DEBUG fetched count:", len(fetched))
+                logger.debug("DEBUG fetched count: %s", len(fetched))
 
                 if fetched:
                     old_sig = self._last_issue_signature or self.build_issue_signature(LOCAL_ISSUES)
@@ -2432,14 +2522,14 @@ class MainApp(MDApp):
                     self._last_refresh_ok = True
 
                     if changed:
-                        print("INFO: LOCAL_ISSUES updated from Firestore")
+                        logger.info("LOCAL_ISSUES updated from Firestore")
                         snackbar_text = "업데이트 완료"
                     else:
-                        print("INFO: no issue changes detected")
+                        logger.info("no issue changes detected")
                         snackbar_text = "변경된 안건이 없습니다"
 
                 else:
-                    print("WARN: fetched empty list")
+                    logger.warning("fetched empty list")
                     self._last_refresh_ok = True
 
                     if LOCAL_ISSUES:
@@ -2448,7 +2538,7 @@ class MainApp(MDApp):
                         snackbar_text = "표시할 안건이 없습니다"
 
             except Exception as e:
-                print("ERROR refresh_issues:", e)
+                logger.error("ERROR refresh_issues: %s", e)
                 self._last_refresh_ok = False
                 self._last_refresh_error = str(e)
 
@@ -2469,7 +2559,7 @@ class MainApp(MDApp):
                     main._last_loaded_tab = None
                     main.populate_main_list()
             except Exception as e:
-                print("ERROR UI update after refresh:", e)
+                logger.error("ERROR UI update after refresh: %s", e)
 
             if not silent and snackbar_text:
                 MDSnackbar(
@@ -2502,13 +2592,14 @@ class MainApp(MDApp):
         self.root.current = "history"
 
     def go_main(self):
+        self.stop_live_results()
         self.root.current = "main"
         self.update_dot_state()
 
     def open_detail(self, issue: dict):
         issue_id = (issue or {}).get("id")
         if not issue_id:
-            print("ERROR open_detail: issue_id is None. issue =", issue)
+            logger.warning("ERROR open_detail: issue_id is None. issue = %s", issue)
             MDSnackbar(
                 MDLabel(text="오류: 안건 ID가 없습니다", max_lines=1),
                 y="10dp",
@@ -2518,22 +2609,76 @@ class MainApp(MDApp):
             ).open()
             return
 
+        # 빠르게 다른 안건을 누르면 늦게 끝난 이전 조회 결과는 버린다
+        self._opening_issue_id = issue_id
+
+        def worker():
+            merged = issue
+            self.prefetch_issue_detail(issue_id)
+            try:
+                remote_issue = self.fetch_public_issue_detail(issue_id)
+                if remote_issue:
+                    merged = {**issue, **remote_issue}
+            except Exception as e:
+                logger.error("FETCH_PUBLIC_ISSUE_DETAIL ERROR: %s", e)
+
+            Clock.schedule_once(lambda dt: show(merged), 0)
+
+        def show(merged):
+            if getattr(self, "_opening_issue_id", None) != issue_id:
+                return
+            detail = self.root.get_screen("detail")
+            detail.show_issue(merged)
+            self.root.current = "detail"
+            self.start_live_results(merged)
+
+        # 네트워크 조회는 UI 스레드 밖에서
+        threading.Thread(target=worker, daemon=True).start()
+
+    def put_prefetched(self, kind: str, issue_id: str, value):
+        if not hasattr(self, "_prefetched"):
+            self._prefetched = {}
+        self._prefetched[(kind, issue_id)] = value
+
+    def take_prefetched(self, kind: str, issue_id: str):
+        """
+        bootstrap / batch 로 미리 받아 둔 값은 한 번만 쓴다 (이후 제출 뒤 등은 다시 읽음)
+        반환값: (found, value)
+        """
+        prefetched = getattr(self, "_prefetched", None) or {}
+        key = (kind, issue_id)
+        if key in prefetched:
+            return True, prefetched.pop(key)
+        return False, None
+
+    def prefetch_issue_detail(self, issue_id: str):
+        """상세 화면에 필요한 안건/내 응답/집계를 POST /batch 한 번으로 미리 받는다."""
+        id_token = getattr(self, "user_id_token", None)
+        if not API_BASE_URL or not id_token or not issue_id:
+            return
+
         try:
-            remote_issue = self.fetch_public_issue_detail(issue_id)
-            if remote_issue:
-                issue = {**issue, **remote_issue}
+            results = fetch_batch(
+                API_BASE_URL,
+                id_token,
+                [("issue", issue_id), ("ballot", issue_id), ("stats", issue_id)],
+            )
         except Exception as e:
-            print("FETCH_PUBLIC_ISSUE_DETAIL ERROR:", e)
+            logger.error("PREFETCH ISSUE DETAIL ERROR: %s", e)
+            return
 
-        detail = self.root.get_screen("detail")
-        detail.show_issue(issue)
-        self.root.current = "detail"
+        for (kind, key), value in results.items():
+            self.put_prefetched(kind, key, value)
 
     def fetch_public_issue_detail(self, issue_id: str) -> dict:
         id_token = getattr(self, "user_id_token", None)
         if not id_token or not issue_id:
             return {}
 
+        found, issue = self.take_prefetched("issue", issue_id)
+        if found:
+            return issue or {}
+
         url = (
             "https://firestore.googleapis.com/v1/"
             f"projects/{PROJECT_ID}/databases/(default)/documents/"
@@ -2543,7 +2688,7 @@ class MainApp(MDApp):
         r = requests.get(url, headers=headers)
 
         if r.status_code != 200:
-            print("PUBLIC ISSUE DETAIL ERROR:", r.status_code, r.text)
+            logger.error("PUBLIC ISSUE DETAIL ERROR: %s %s", r.status_code, r.text)
             return {}
 
         data = r.json()
@@ -2596,6 +2741,7 @@ class MainApp(MDApp):
             "active": b("active", False),
             "isPinned": b("isPinned", False),
             "order": i("order", 999999),
+            "orderKey": s("orderKey"),
         }
 
     def can_submit_issue(self, issue: dict):
@@ -2633,6 +2779,10 @@ class MainApp(MDApp):
         if not id_token or not user_uid or not issue_id:
             return None
 
+        found, ballot = self.take_prefetched("ballot", issue_id)
+        if found:
+            return ballot
+
         url = (
             "https://firestore.googleapis.com/v1/"
             f"projects/{PROJECT_ID}/databases/(default)/documents/"
@@ -2782,7 +2932,7 @@ class MainApp(MDApp):
             }
 
             r = requests.patch(url, headers=headers, json=data)
-            print("BALLOT SAVE:", r.status_code, r.text)
+            logger.debug("BALLOT SAVE: %s %s", r.status_code, r.text)
 
             if r.status_code in (200, 201):
                 MDSnackbar(
@@ -2801,7 +2951,7 @@ class MainApp(MDApp):
                     ballot = self.fetch_my_ballot(issue_id)
                     detail.apply_my_ballot(ballot or {})
                 except Exception as e:
-                    print("APPLY MY BALLOT ERROR:", e)
+                    logger.error("APPLY MY BALLOT ERROR: %s", e)
                     detail.set_submit_button_state(False, "응답 수정")
 
                 if self.should_show_results(issue):
@@ -2824,7 +2974,7 @@ class MainApp(MDApp):
                 ).open()
 
         except Exception as e:
-            print("SUBMIT BALLOT ERROR:", e)
+            logger.error("SUBMIT BALLOT ERROR: %s", e)
             detail.set_submit_button_state(False, "응답 제출")
             MDSnackbar(
                 MDLabel(
@@ -2844,7 +2994,7 @@ class MainApp(MDApp):
         title = issue.get("title", "")
 
         if not issue_id:
-            print("ERROR: issue_id is None. issue =", issue)
+            logger.warning("ERROR: issue_id is None. issue = %s", issue)
             MDSnackbar(
                 MDLabel(text="오류: 쟁점 ID가 없습니다(저장 불가)", max_lines=1),
                 y="10dp",
@@ -2854,7 +3004,7 @@ class MainApp(MDApp):
             ).open()
             return
 
-        print("VOTE:", issue_id, title, "->", choice)
+        logger.info("VOTE: %s %s -> %s", issue_id, title, choice)
 
         try:
             id_token = getattr(self, "user_id_token", None)
@@ -2894,7 +3044,7 @@ class MainApp(MDApp):
             }
 
             r = requests.patch(url, headers=headers, json=data)
-            print("VOTE SAVE:", r.status_code, r.text)
+            logger.debug("VOTE SAVE: %s %s", r.status_code, r.text)
 
             if r.status_code in (200, 201):
                 MDSnackbar(
@@ -2915,7 +3065,7 @@ class MainApp(MDApp):
                         self.vote_cache = {}
                     self.vote_cache[issue_id] = latest
                 except Exception as e:
-                    print("FETCH LATEST VOTE_STATS ERROR:", e)
+                    logger.error("FETCH LATEST VOTE_STATS ERROR: %s", e)
 
                 # 3) 화면 갱신
                 Clock.schedule_once(lambda dt: self.update_badge_only(issue_id), 0)
@@ -2926,7 +3076,7 @@ class MainApp(MDApp):
                     detail = self.root.get_screen("detail")
                     detail.highlight_my_choice(choice)
                 except Exception as e:
-                    print("HIGHLIGHT ERROR:", e)
+                    logger.error("HIGHLIGHT ERROR: %s", e)
 
             else:
                 MDSnackbar(
@@ -2942,7 +3092,7 @@ class MainApp(MDApp):
                 ).open()
 
         except Exception as e:
-            print("VOTE ERROR:", e)
+            logger.error("VOTE ERROR: %s", e)
             MDSnackbar(
                 MDLabel(text="투표 저장 중 오류", max_lines=1, shorten=True),
                 y="10dp",
@@ -2969,7 +3119,7 @@ class MainApp(MDApp):
 
         r = requests.get(url, headers=headers)
         if r.status_code != 200:
-            print("VOTE SUMMARY ERROR:", r.status_code, r.text)
+            logger.error("VOTE SUMMARY ERROR: %s %s", r.status_code, r.text)
             return {"yes": 0, "no": 0, "hold": 0, "total": 0}
 
         data = r.json()
@@ -3009,10 +3159,10 @@ class MainApp(MDApp):
             if hasattr(detail, "vote_graph") and detail.vote_graph:
                 detail.vote_graph.set_summary(summary)
             else:
-                print("DEBUG: vote_graph not found on detail")
+                logger.debug("DEBUG: vote_graph not found on detail")
 
         except Exception as e:
-            print("ERROR update_vote_summary_ui:", e)
+            logger.error("ERROR update_vote_summary_ui: %s", e)
 
     def get_vote_summary_cached(self, issue_id: str):
         # 캐시 딕셔너리 없으면 생성
@@ -3041,7 +3191,7 @@ class MainApp(MDApp):
                 # ✅ ballots 전부 읽는 방식 X  -> stats 문서 1개 읽는 방식 O
                 summary = self.fetch_vote_stats(issue_id)
             except Exception as e:
-                print("ERROR request_vote_summary:", e)
+                logger.error("ERROR request_vote_summary: %s", e)
                 summary = {"yes": 0, "no": 0, "hold": 0, "total": 0}
 
             if not hasattr(self, "vote_cache"):
@@ -3056,6 +3206,7 @@ class MainApp(MDApp):
         """투표 직후 해당 이슈 캐시만 날려서 새로 읽게 함"""
         if hasattr(self, "vote_cache") and issue_id in self.vote_cache:
             del self.vote_cache[issue_id]
+        self.take_prefetched("stats", issue_id)
 
     def refresh_list_only(self):
         try:
@@ -3063,7 +3214,7 @@ class MainApp(MDApp):
             main._last_loaded_tab = None
             main.populate_main_list()
         except Exception as e:
-            print("ERROR refresh_list_only:", e)
+            logger.error("ERROR refresh_list_only: %s", e)
 
     def fetch_my_vote(self, issue_id: str):
         id_token = getattr(self, "user_id_token", None)
@@ -3109,7 +3260,7 @@ class MainApp(MDApp):
             detail.my_vote_label.markup = True
 
         except Exception as e:
-            print("ERROR update_my_vote_label:", e)
+            logger.error("ERROR update_my_vote_label: %s", e)
 
     def update_vote_summary(self, issue: dict):
         try:
@@ -3140,27 +3291,78 @@ class MainApp(MDApp):
                 return
 
             summary = self.fetch_vote_stats(issue_id)
-            total = int(summary.get("total", 0) or 0)
-            options = summary.get("options") or []
+            self.render_vote_summary(detail, summary)
 
-            if options:
-                line_text = " / ".join(
-                    [
-                        f"{item.get('label', '항목')}: {item.get('count', 0)}"
-                        for item in options
-                    ]
-                )
-                detail.vote_summary_label.text = (
-                    "결과 현황\n" f"{line_text}\n" f"총 참여: {total}"
-                )
-            else:
-                detail.vote_summary_label.text = "아직 집계된 결과가 없습니다."
+        except Exception as e:
+            logger.error("VOTE SUMMARY ERROR: %s", e)
+
+    def render_vote_summary(self, detail, summary: dict):
+        total = int(summary.get("total", 0) or 0)
+        options = summary.get("options") or []
+
+        if options:
+            line_text = " / ".join(
+                [
+                    f"{item.get('label', '항목')}: {item.get('count', 0)}"
+                    for item in options
+                ]
+            )
+            detail.vote_summary_label.text = (
+                "결과 현황\n" f"{line_text}\n" f"총 참여: {total}"
+            )
+        else:
+            detail.vote_summary_label.text = "아직 집계된 결과가 없습니다."
+
+        if hasattr(detail, "result_box") and detail.result_box:
+            detail.result_box.set_summary(summary)
+
+    def start_live_results(self, issue: dict):
+        self.stop_live_results()
+
+        id_token = getattr(self, "user_id_token", None)
+        if not (API_BASE_URL and LIVE_RESULTS and id_token and live_results_available()):
+            return
+
+        issue_id = (issue or {}).get("id")
+        status = str((issue or {}).get("status") or "").strip().lower()
+        if not issue_id or status != "open" or not self.should_show_results(issue):
+            return
+
+        stop_event = threading.Event()
+        self._live_results_stop = stop_event
+
+        def on_stats(stats_issue_id, stats):
+            Clock.schedule_once(
+                lambda dt: self.apply_live_vote_summary(stats_issue_id, stats), 0
+            )
+
+        threading.Thread(
+            target=listen_vote_results,
+            args=(API_BASE_URL, id_token, [issue_id], on_stats, stop_event),
+            daemon=True,
+        ).start()
 
-            if hasattr(detail, "result_box") and detail.result_box:
-                detail.result_box.set_summary(summary)
+    def stop_live_results(self):
+        if self._live_results_stop is not None:
+            self._live_results_stop.set()
+            self._live_results_stop = None
+
+    def apply_live_vote_summary(self, issue_id: str, summary: dict):
+        try:
+            if not hasattr(self, "vote_cache"):
+                self.vote_cache = {}
+            self.vote_cache[issue_id] = summary
+
+            detail = self.root.get_screen("detail")
+            current = getattr(detail, "current_issue", None) or {}
+            if current.get("id") != issue_id or self.root.current != "detail":
+                return
+            if not getattr(detail, "vote_summary_label", None):
+                return
 
+            self.render_vote_summary(detail, summary)
         except Exception as e:
-            print("VOTE SUMMARY ERROR:", e)
+            logger.error("LIVE VOTE SUMMARY ERROR: %s", e)
 
     def fetch_vote_stats(self, issue_id: str) -> dict:
         if not issue_id:
@@ -3170,6 +3372,10 @@ class MainApp(MDApp):
         if not id_token:
             return {"total": 0, "options": []}
 
+        found, summary = self.take_prefetched("stats", issue_id)
+        if found and summary is not None:
+            return summary
+
         url = (
             "https://firestore.googleapis.com/v1/"
             f"projects/{PROJECT_ID}/databases/(default)/documents/"
@@ -3182,7 +3388,7 @@ class MainApp(MDApp):
             return {"total": 0, "options": []}
 
         if r.status_code != 200:
-            print("VOTE_STATS GET ERROR:", r.status_code, r.text)
+            logger.error("VOTE_STATS GET ERROR: %s %s", r.status_code, r.text)
             return {"total": 0, "options": []}
 
         data = r.json()
@@ -3314,7 +3520,7 @@ class MainApp(MDApp):
 
         rc = requests.post(commit_url, headers=headers, json=body)
         if rc.status_code != 200:
-            print("VOTE_STATS COMMIT ERROR:", rc.status_code, rc.text)
+            logger.error("VOTE_STATS COMMIT ERROR: %s %s", rc.status_code, rc.text)
 
     def update_badge_only(self, issue_id: str):
         """목록 전체 리빌드 없이, 해당 카드 배지만 즉시 갱신"""
@@ -3336,9 +3542,14 @@ class MainApp(MDApp):
             self.request_vote_summary(issue_id, _apply)
 
         except Exception as e:
-            print("update_badge_only ERROR:", e)
+            logger.error("update_badge_only ERROR: %s", e)
 
     def fetch_version_meta(self) -> dict:
+        # 시작 직후에는 bootstrap 으로 받은 값을 한 번만 쓴다
+        bootstrap_version = getattr(self, "_bootstrap_version", None)
+        if bootstrap_version is not None:
+            self._bootstrap_version = None
+            return bootstrap_version
         return fetch_version_meta()
 
     def get_update_state(self) -> dict:
@@ -3380,11 +3591,11 @@ class MainApp(MDApp):
                 ).open()
                 return
 
-            print("OPEN UPDATE URL:", target_url)
+            logger.info("OPEN UPDATE URL: %s", target_url)
             webbrowser.open(target_url)
 
         except Exception as e:
-            print("OPEN UPDATE URL ERROR:", e)
+            logger.error("OPEN UPDATE URL ERROR: %s", e)
             MDSnackbar(
                 MDLabel(
                     text="업데이트 페이지를 열 수 없습니다",
@@ -3411,9 +3622,15 @@ class MainApp(MDApp):
         if self._auto_refresh_event is not None:
             return
 
+        interval = 60
+        if API_BASE_URL:
+            self.start_issue_stream()
+            # 변경은 스트림이 알려주므로 폴링은 안전망으로만 남긴다
+            interval = 600
+
         self._auto_refresh_event = Clock.schedule_interval(
             lambda dt: self.refresh_issues(silent=True),
-            60
+            interval
         )
 
     def stop_auto_refresh(self):
@@ -3421,8 +3638,42 @@ class MainApp(MDApp):
             self._auto_refresh_event.cancel()
             self._auto_refresh_event = None
 
+        self.stop_issue_stream()
+
+    def start_issue_stream(self):
+        if self._issue_stream_stop is not None:
+            return
+
+        stop_event = threading.Event()
+        self._issue_stream_stop = stop_event
+
+        def on_event(event, data):
+            # 백그라운드 스레드 -> UI 스레드로 넘긴다
+            Clock.schedule_once(lambda dt: self.on_issue_stream_event(event), 0)
+
+        threading.Thread(
+            target=listen_issue_events,
+            args=(API_BASE_URL, on_event, stop_event),
+            daemon=True,
+        ).start()
+
+    def stop_issue_stream(self):
+        if self._issue_stream_stop is not None:
+            self._issue_stream_stop.set()
+            self._issue_stream_stop = None
+
+    def on_issue_stream_event(self, event: str):
+        # 변경이 몰려 오면 마지막 이벤트 뒤 한 번만 새로고침
+        if self._stream_refresh_event is not None:
+            self._stream_refresh_event.cancel()
+
+        self._stream_refresh_event = Clock.schedule_once(
+            lambda dt: self.refresh_issues(silent=True), 0.5
+        )
+
     def on_stop(self):
          self.stop_auto_refresh()
+         self.stop_live_results()
 
     def build_issue_signature(self, issues: list) -> list:
         result = []
@@ -3502,7 +3753,7 @@ class MainApp(MDApp):
 
         def sort_debug_key(item):
             is_pinned = 1 if item.get("isPinned") else 0
-            order_val = item.get("order", 999999)
+            order_val = order_sort_value(item)
             created_at = (
                 item.get("createdAt")
                 or item.get("updatedAt")
@@ -3535,7 +3786,7 @@ class MainApp(MDApp):
         try:
             version_info = self.get_update_state()
         except Exception as e:
-            print("DEBUG VERSION INFO ERROR:", e)
+            logger.error("DEBUG VERSION INFO ERROR: %s", e)
             version_info = {}
 
         return {
@@ -3748,24 +3999,24 @@ class MainApp(MDApp):
             main.opened_card = None
             main.card_map = {}
         except Exception as e:
-            print("RESET MAIN STATE ERROR:", e)
+            logger.error("RESET MAIN STATE ERROR: %s", e)
 
         try:
             self.stop_update_dot_animation()
         except Exception as e:
-            print("RESET DOT ERROR:", e)
+            logger.error("RESET DOT ERROR: %s", e)
 
 
     def reset_local_version_state(self):
         try:
             save_local_version(0)
         except Exception as e:
-            print("RESET LOCAL VERSION ERROR:", e)
+            logger.error("RESET LOCAL VERSION ERROR: %s", e)
 
 
     def recover_app_state(self):
         try:
-            print("RECOVER APP STATE START")
+            logger.info("RECOVER APP STATE START")
 
             # 복구 핵심: 기존 토큰/UID 버리고 강제 재로그인
             self._refreshing = False
@@ -3778,7 +4029,7 @@ class MainApp(MDApp):
                 main._last_loaded_tab = None
                 main.opened_card = None
             except Exception as e:
-                print("RECOVER MAIN RESET ERROR:", e)
+                logger.error("RECOVER MAIN RESET ERROR: %s", e)
 
             MDSnackbar(
                 MDLabel(
@@ -3795,7 +4046,7 @@ class MainApp(MDApp):
             Clock.schedule_once(lambda dt: self.refresh_issues(silent=False), 0.1)
 
         except Exception as e:
-            print("RECOVER APP STATE ERROR:", e)
+            logger.error("RECOVER APP STATE ERROR: %s", e)
             MDSnackbar(
                 MDLabel(
                     text="복구 중 오류가 발생했습니다",
@@ -0,0 +1,106 @@
+import asyncio
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from backend.server.admission import (
+    AdmissionMiddleware,
+    ConcurrencyLimiter,
+    RateLimiter,
+    Rejected,
+)
+
+
+def test_token_bucket_refills_per_client():
+    limiter = RateLimiter(rate=2, burst=2)
+
+    assert limiter.take("a", now=0) == 0
+    assert limiter.take("a", now=0) == 0
+    assert limiter.take("a", now=0) == pytest.approx(0.5)
+    assert limiter.take("b", now=0) == 0
+    assert limiter.take("a", now=0.5) == 0
+
+
+def test_limiter_queues_then_sheds():
+    async def scenario():
+        limiter = ConcurrencyLimiter("write", limit=1, queue_size=1, queue_timeout=0.05)
+        await limiter.acquire()
+
+        waiting = asyncio.create_task(limiter.acquire())
+        await asyncio.sleep(0)
+        assert limiter.queued == 1
+
+        with pytest.raises(Rejected) as full:
+            await limiter.acquire()
+        assert (full.value.status, full.value.reason) == (503, "queue_full")
+
+        limiter.release()
+        await waiting
+        assert (limiter.active, limiter.queued) == (1, 0)
+
+        with pytest.raises(Rejected) as timeout:
+            await limiter.acquire()
+        assert timeout.value.reason == "queue_timeout"
+
+        limiter.release()
+        assert limiter.active == 0
+
+    asyncio.run(scenario())
+
+
+def test_middleware_answers_429_with_retry_after():
+    write = ConcurrencyLimiter("write", 4, 4, 1.0)
+    app = FastAPI()
+    app.add_middleware(
+        AdmissionMiddleware,
+        classify=lambda scope: "write" if scope["method"] == "POST" else None,
+        limiters={"write": write},
+        rate_limiters={"write": RateLimiter(rate=0.1, burst=1)},
+    )
+
+    @app.post("/items")
+    async def create():
+        return {"ok": True}
+
+    @app.get("/items")
+    async def read():
+        return []
+
+    client = TestClient(app)
+    assert client.post("/items").status_code == 200
+
+    response = client.post("/items")
+    assert response.status_code == 429
+    assert response.headers["retry-after"] == "10"
+    assert response.json()["reason"] == "rate_limited"
+    # 속도 제한으로 돌려보낸 요청은 잡았던 자리를 돌려준다
+    assert write.active == 0
+
+    assert client.get("/items").status_code == 200
+
+
+def test_unverified_authorization_is_limited_by_ip():
+    async def identify(scope):
+        authorization = dict(scope["headers"]).get(b"authorization")
+        return "alice" if authorization == b"Bearer good" else None
+
+    app = FastAPI()
+    app.add_middleware(
+        AdmissionMiddleware,
+        classify=lambda scope: "write",
+        limiters={"write": ConcurrencyLimiter("write", 4, 4, 1.0)},
+        rate_limiters={"write": RateLimiter(rate=0.1, burst=1)},
+        identify=identify,
+    )
+
+    @app.post("/items")
+    async def create():
+        return {"ok": True}
+
+    client = TestClient(app)
+    # 헤더를 바꿔 보내도 검증되지 않으면 같은 IP 버킷을 쓴다
+    assert client.post("/items", headers={"Authorization": "Bearer x1"}).status_code == 200
+    assert client.post("/items", headers={"Authorization": "Bearer x2"}).status_code == 429
+    # 검증된 사용자는 자기 버킷을 쓴다
+    assert client.post("/items", headers={"Authorization": "Bearer good"}).status_code == 200
@@ -0,0 +1,49 @@
+import asyncio
+import base64
+import os
+
+os.environ["STORAGE_BACKEND"] = "memory"
+
+from starlette.requests import Request  # noqa: E402
+
+from backend.server import main  # noqa: E402
+
+
+def make_scope(authorization: str) -> dict:
+    return {
+        "type": "http",
+        "method": "POST",
+        "path": "/batch",
+        "headers": [(b"authorization", authorization.encode("latin-1"))],
+    }
+
+
+def test_mobile_token_is_verified_once(monkeypatch):
+    calls = []
+
+    async def verify(token):
+        calls.append(token)
+        return "uid-" + token
+
+    monkeypatch.setattr(main, "verify_mobile_token", verify)
+
+    async def scenario():
+        scope = make_scope("Bearer t1")
+        assert await main.admission_identity(scope) == "mobile:uid-t1"
+        # 라우트는 입장 제어가 남긴 결과를 그대로 쓴다
+        assert await main.mobile_user(Request(scope), "Bearer t1") == "uid-t1"
+        assert calls == ["t1"]
+
+        # 다른 토큰이면 다시 검증한다
+        assert await main.mobile_user(Request(scope), "Bearer t2") == "uid-t2"
+        assert calls == ["t1", "t2"]
+
+    asyncio.run(scenario())
+
+
+def test_basic_auth_without_admin_env_falls_back_to_ip(monkeypatch):
+    monkeypatch.delenv("ADMIN_USERNAME", raising=False)
+    monkeypatch.delenv("ADMIN_PASSWORD", raising=False)
+    value = base64.b64encode(b"admin:secret").decode("ascii")
+
+    assert asyncio.run(main.admission_identity(make_scope("Basic " + value))) is None
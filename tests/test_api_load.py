@@ -0,0 +1,65 @@
+import json
+import os
+import subprocess
+import sys
+
+import pytest
+
+BENCH_DIR = os.path.join(os.path.dirname(os.path.dirname(__file__)), "backend", "bench")
+sys.path.insert(0, BENCH_DIR)
+
+from api_load import find_regressions, parse_mix  # noqa: E402
+
+
+def test_parse_mix_rejects_unknown_operations():
+    assert parse_mix("get=80,delete=20") == {"get": 80.0, "delete": 20.0}
+    with pytest.raises(ValueError):
+        parse_mix("get=80,upsert=20")
+    with pytest.raises(ValueError):
+        parse_mix("get=0")
+
+
+def test_regressions_cover_total_and_operations():
+    baseline = {
+        "rps": 100,
+        "p95_ms": 10,
+        "p99_ms": 20,
+        "operations": {"get": {"rps": 80, "p95_ms": 5, "p99_ms": 8}},
+    }
+    result = {
+        "rps": 95,
+        "p95_ms": 10.5,
+        "p99_ms": 25,
+        "operations": {"get": {"rps": 60, "p95_ms": 5, "p99_ms": 8}},
+    }
+
+    regressions = find_regressions(result, baseline, max_regression=10)
+    assert [line.split(":")[0] for line in regressions] == ["total.p99_ms", "get.rps"]
+
+
+def test_in_process_run_writes_json_and_fails_on_regression(tmp_path):
+    out = tmp_path / "result.json"
+    command = [
+        sys.executable,
+        os.path.join(BENCH_DIR, "api_load.py"),
+        "--concurrency", "4",
+        "--requests", "40",
+        "--warmup", "0",
+        "--seed-issues", "10",
+    ]
+    env = {**os.environ, "STORAGE_BACKEND": "memory"}
+
+    subprocess.run(command + ["--out", str(out)], env=env, check=True, capture_output=True)
+    result = json.loads(out.read_text(encoding="utf-8"))
+    assert result["target"] == "in-process"
+    assert result["requests"] == 40
+    assert set(result["operations"]) <= {"get", "create", "update", "delete"}
+
+    # 처리량을 부풀린 기준선과 비교하면 종료 코드 1
+    baseline = tmp_path / "baseline.json"
+    baseline.write_text(json.dumps({**result, "rps": result["rps"] * 100}), encoding="utf-8")
+    failed = subprocess.run(
+        command + ["--baseline", str(baseline)], env=env, capture_output=True
+    )
+    assert failed.returncode == 1
+    assert "total.rps" in failed.stderr.decode("utf-8")
@@ -0,0 +1,54 @@
+import asyncio
+import os
+
+os.environ["STORAGE_BACKEND"] = "memory"
+
+import httpx  # noqa: E402
+
+from backend.server import main  # noqa: E402
+from backend.server.metrics import FirestoreSlots  # noqa: E402
+
+
+def test_firestore_slots_bound_concurrent_calls():
+    slots = FirestoreSlots(2)
+    active = []
+    peak = []
+
+    async def call():
+        async with slots("issues.get"):
+            active.append(1)
+            peak.append(len(active))
+            await asyncio.sleep(0.01)
+            active.pop()
+
+    async def scenario():
+        await asyncio.gather(*(call() for _ in range(6)))
+
+    asyncio.run(scenario())
+    assert max(peak) == 2
+
+
+def test_concurrent_cache_misses_load_once(monkeypatch):
+    main.repository.seed({"issues": {"a": {"title": "a", "order_key": "a0"}}})
+    main.issues_cache.invalidate()
+
+    loads = []
+    load_issues = main.load_issues
+
+    async def slow_load(*args):
+        loads.append(args)
+        # 읽는 동안 다른 요청이 들어오게 한다
+        await asyncio.sleep(0.05)
+        return await load_issues(*args)
+
+    monkeypatch.setattr(main, "load_issues", slow_load)
+
+    async def scenario():
+        transport = httpx.ASGITransport(app=main.app)
+        async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+            return await asyncio.gather(*(client.get("/issues") for _ in range(10)))
+
+    responses = asyncio.run(scenario())
+    assert {r.status_code for r in responses} == {200}
+    assert {r.headers["etag"] for r in responses} == {responses[0].headers["etag"]}
+    assert len(loads) == 1
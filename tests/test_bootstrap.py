@@ -0,0 +1,44 @@
+from backend.server.bootstrap import (
+    build_bootstrap,
+    stats_issue_ids,
+    stats_readable,
+    vote_issue_ids,
+)
+
+
+def test_bootstrap_payload_shapes():
+    issues = [
+        {"id": "v1", "type": "vote", "status": "open", "resultVisibility": "public"},
+        {"id": "v2", "type": "survey", "status": "open", "resultVisibility": "after_close"},
+        {"id": "n1", "type": "notice", "status": "open"},
+    ]
+    assert vote_issue_ids(issues) == ["v1", "v2"]
+    assert stats_issue_ids(issues) == ["v1"]
+
+    payload = build_bootstrap(
+        issues,
+        {"version": "3", "latestVersion": "1.0.1"},
+        {"v1": {"uid": "u", "selectedOptions": ["찬성"]}, "v2": None},
+        {"v1": {"yes": 2, "no": 1}},
+    )
+
+    assert payload["version"]["version"] == 3
+    assert payload["ballots"]["v1"]["selectedOptions"] == ["찬성"]
+    assert payload["ballots"]["v2"] is None
+    assert payload["stats"]["v1"]["total"] == 3
+
+
+def test_hidden_issues_and_results_are_not_readable():
+    assert stats_readable({"id": "v1", "type": "vote", "status": "closed"})
+    assert not stats_readable(None)
+    # 초안/비활성 안건은 결과도 없다
+    assert not stats_readable({"id": "v1", "type": "vote", "status": "draft"})
+    assert not stats_readable({"id": "v1", "type": "vote", "status": "open", "active": False})
+    # 결과 공개 정책
+    assert not stats_readable(
+        {"id": "v1", "type": "vote", "status": "open", "resultVisibility": "after_close"}
+    )
+    assert not stats_readable(
+        {"id": "v1", "type": "vote", "status": "closed", "resultVisibility": "admin_only"}
+    )
+    assert not stats_readable({"id": "n1", "type": "notice", "status": "open"})
@@ -0,0 +1,25 @@
+from backend.server.cache import TTLCache, compute_etag, etag_matches
+
+
+def test_etag_is_stable_for_same_payload():
+    a = [{"id": "1", "title": "임금교섭"}]
+    b = [{"title": "임금교섭", "id": "1"}]
+    assert compute_etag(a) == compute_etag(b)
+    assert compute_etag(a) != compute_etag([{"id": "2", "title": "임금교섭"}])
+
+
+def test_etag_matches_list_and_weak():
+    etag = compute_etag([])
+    assert etag_matches(etag, etag)
+    assert etag_matches(f'"other", W/{etag}', etag)
+    assert etag_matches("*", etag)
+    assert not etag_matches('"other"', etag)
+    assert not etag_matches(None, etag)
+
+
+def test_ttl_cache_invalidate():
+    cache = TTLCache(ttl=60)
+    cache.set("issues", 1)
+    assert cache.get("issues") == 1
+    cache.invalidate()
+    assert cache.get("issues") is None
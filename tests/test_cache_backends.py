@@ -0,0 +1,188 @@
+import socketserver
+import threading
+import time
+
+import pytest
+
+from backend.server.cache import (
+    RedisCache,
+    SharedMemoryCache,
+    decode_entry,
+    encode_entry,
+)
+
+
+class _RespStandIn(socketserver.ThreadingTCPServer):
+    """테스트용 Redis 프로토콜 서버 (GET/SET/DEL/INCR/EVAL/PUBLISH/SUBSCRIBE 만 지원)"""
+
+    daemon_threads = True
+    allow_reuse_address = True
+
+    def __init__(self):
+        super().__init__(("127.0.0.1", 0), _RespHandler)
+        self.data = {}
+        self.subscribers = []
+        self.evals = []
+        self.lock = threading.Lock()
+
+
+class _RespHandler(socketserver.StreamRequestHandler):
+    def _read_command(self):
+        line = self.rfile.readline()
+        if not line:
+            return None
+        args = []
+        for _ in range(int(line[1:])):
+            size = int(self.rfile.readline()[1:])
+            args.append(self.rfile.read(size + 2)[:-2])
+        return args
+
+    def _bulk(self, value):
+        if value is None:
+            return b"$-1\r\n"
+        return b"$%d\r\n%s\r\n" % (len(value), value)
+
+    def handle(self):
+        server = self.server
+        while True:
+            args = self._read_command()
+            if args is None:
+                return
+
+            command = args[0].upper()
+            with server.lock:
+                if command == b"GET":
+                    reply = self._bulk(server.data.get(args[1]))
+                elif command == b"SET":
+                    options = [a.upper() for a in args[3:]]
+                    if b"NX" in options and args[1] in server.data:
+                        reply = b"$-1\r\n"
+                    else:
+                        server.data[args[1]] = args[2]
+                        reply = b"+OK\r\n"
+                elif command == b"DEL":
+                    reply = b":%d\r\n" % int(server.data.pop(args[1], None) is not None)
+                elif command == b"INCR":
+                    value = int(server.data.get(args[1], b"0")) + 1
+                    server.data[args[1]] = str(value).encode()
+                    reply = b":%d\r\n" % value
+                elif command == b"EVAL":
+                    # 리더 연장/반납 스크립트만 흉내 낸다 (키가 토큰과 같을 때만 PEXPIRE 또는 DEL)
+                    key, token = args[3], args[4]
+                    owned = server.data.get(key) == token
+                    if owned and b"DEL" in args[1]:
+                        del server.data[key]
+                    server.evals.append(args[1])
+                    reply = b":%d\r\n" % int(owned)
+                elif command == b"PUBLISH":
+                    message = (
+                        b"*3\r\n" + self._bulk(b"message") + self._bulk(args[1]) + self._bulk(args[2])
+                    )
+                    for channel, wfile in server.subscribers:
+                        if channel == args[1]:
+                            wfile.write(message)
+                    reply = b":%d\r\n" % len(server.subscribers)
+                elif command == b"SUBSCRIBE":
+                    server.subscribers.append((args[1], self.wfile))
+                    reply = b"*3\r\n" + self._bulk(b"subscribe") + self._bulk(args[1]) + b":1\r\n"
+                else:
+                    reply = b"-ERR unknown command\r\n"
+            self.wfile.write(reply)
+
+
+@pytest.fixture
+def resp_server():
+    server = _RespStandIn()
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield server
+    server.shutdown()
+    server.server_close()
+
+
+def _wait_for(predicate, timeout=2.0):
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        if predicate():
+            return True
+        time.sleep(0.01)
+    return False
+
+
+def test_entry_round_trip():
+    meta, body = decode_entry(encode_entry({"etag": '"x"'}, "[1]".encode()))
+    assert meta == {"etag": '"x"'}
+    assert bytes(body) == b"[1]"
+
+
+def test_shared_memory_cache_is_shared_between_workers(tmp_path):
+    worker_a = SharedMemoryCache(directory=str(tmp_path), ttl=60)
+    worker_b = SharedMemoryCache(directory=str(tmp_path), ttl=60)
+
+    assert worker_a.claim("issues")
+    assert not worker_b.claim("issues")
+    worker_a.set("issues", b"payload")
+    worker_a.release("issues")
+    assert bytes(worker_b.get("issues")) == b"payload"
+
+    worker_b.invalidate()
+    assert worker_a.get("issues") is None
+
+    assert worker_a.try_lead("mirror")
+    assert not worker_b.try_lead("mirror")
+
+    # 자리를 내려놓으면 다른 워커가 바로 가져간다
+    worker_a.resign("mirror")
+    assert worker_b.try_lead("mirror")
+    assert not worker_a.try_lead("mirror")
+
+    # 잠금 파일이 지워지면 예전 리더도 새 파일로 다시 잡아야 리더다
+    (tmp_path / "mirror.leader").unlink()
+    assert worker_a.try_lead("mirror")
+    assert not worker_b.try_lead("mirror")
+
+
+def test_shared_memory_cache_skips_stale_generation(tmp_path):
+    cache = SharedMemoryCache(directory=str(tmp_path), ttl=60)
+    generation = cache.generation()
+    cache.invalidate()
+    cache.set("issues", b"old", generation)
+    assert cache.get("issues") is None
+
+
+def test_redis_cache_invalidation_crosses_workers(resp_server):
+    url = "redis://127.0.0.1:%d/0" % resp_server.server_address[1]
+    worker_a = RedisCache(url=url, ttl=60)
+    worker_b = RedisCache(url=url, ttl=60)
+    try:
+        assert _wait_for(lambda: len(resp_server.subscribers) == 2)
+
+        assert worker_a.claim("issues")
+        assert not worker_b.claim("issues")
+        worker_a.set("issues", b"payload")
+        assert worker_b.get("issues") == b"payload"
+
+        worker_a.invalidate()
+        assert _wait_for(lambda: worker_b.generation() == worker_a.generation())
+        assert worker_b.get("issues") is None
+
+        assert worker_a.try_lead("mirror")
+        assert not worker_b.try_lead("mirror")
+        # 리더는 다시 불러도 리더 (만료 연장)
+        assert worker_a.try_lead("mirror")
+
+        # 리더 키가 만료되면 다른 워커가 가져가고, 예전 리더는 리더가 아니다
+        resp_server.data.pop(b"dojun:issues:leader:mirror")
+        assert worker_b.try_lead("mirror")
+        assert not worker_a.try_lead("mirror")
+        # 연장은 GET 과 PEXPIRE 를 따로 보내지 않고 스크립트 하나로 한다
+        assert all(b"PEXPIRE" in script or b"DEL" in script for script in resp_server.evals)
+
+        # 남의 키는 지우지 않고, 내 키는 지워서 다른 워커가 바로 가져가게 한다
+        worker_a.resign("mirror")
+        assert not worker_a.try_lead("mirror")
+        worker_b.resign("mirror")
+        assert worker_a.try_lead("mirror")
+    finally:
+        worker_a.close()
+        worker_b.close()
@@ -0,0 +1,88 @@
+import asyncio
+import time
+
+from backend.server.cleanup import JOBS_COLLECTION, CascadeDeleter
+from backend.server.repository import MemoryRepository
+
+
+def seeded(ballots: int, **collections) -> MemoryRepository:
+    repository = MemoryRepository()
+    repository.seed(
+        {
+            "votes/v1/ballots": {f"u{n:04d}": {"selectedOptions": ["찬성"]} for n in range(ballots)},
+            "votes/v2/ballots": {"u0000": {"selectedOptions": ["반대"]}},
+            "vote_stats": {"v1": {"total": ballots}, "v2": {"total": 1}},
+            "vote_results": {"v1": {"total": ballots}},
+            **collections,
+        }
+    )
+    return repository
+
+
+async def drain(deleter: CascadeDeleter) -> None:
+    while deleter._tasks:
+        await asyncio.gather(*deleter._tasks.values())
+
+
+def test_deletes_ballots_in_batches_then_stats_and_job():
+    repository = seeded(1203)
+    deleter = CascadeDeleter(repository, batch_size=500, parallelism=2)
+
+    async def scenario():
+        await deleter.enqueue("v1")
+        await drain(deleter)
+
+    asyncio.run(scenario())
+
+    assert repository._scan("votes/v1/ballots") == []
+    assert repository._scan(JOBS_COLLECTION) == []
+    assert [doc_id for doc_id, _ in repository._scan("vote_stats")] == ["v2"]
+    assert repository._scan("vote_results") == []
+    # 다른 안건은 그대로
+    assert len(repository._scan("votes/v2/ballots")) == 1
+
+    job = deleter.stats()["jobs"][0]
+    assert (job["status"], job["ballots"], job["cursor"]) == ("done", 1203, "u1202")
+
+
+def test_resume_continues_from_saved_cursor():
+    # u0000..u0004 는 지운 뒤 중단된 상태
+    repository = seeded(10)
+    for n in range(5):
+        repository._remove("votes/v1/ballots", f"u{n:04d}")
+    repository.seed({JOBS_COLLECTION: {"v1": {"issueId": "v1", "cursor": "u0004", "ballots": 5}}})
+    deleter = CascadeDeleter(repository, batch_size=2, parallelism=2)
+
+    async def scenario():
+        await deleter.resume()
+        await drain(deleter)
+
+    asyncio.run(scenario())
+
+    assert repository._scan("votes/v1/ballots") == []
+    assert repository._scan(JOBS_COLLECTION) == []
+    assert deleter.jobs["v1"]["ballots"] == 10
+
+
+def test_resume_skips_jobs_leased_by_another_worker():
+    repository = seeded(3)
+    repository.seed(
+        {
+            JOBS_COLLECTION: {
+                "v1": {"issueId": "v1", "owner": "other", "leaseUntil": time.time() + 60},
+                "v2": {"issueId": "v2", "owner": "other", "leaseUntil": time.time() - 1},
+            }
+        }
+    )
+    deleter = CascadeDeleter(repository)
+
+    async def scenario():
+        await deleter.resume()
+        await drain(deleter)
+
+    asyncio.run(scenario())
+
+    # v1 은 다른 워커가 진행 중, v2 는 lease 가 끝나서 이어받는다
+    assert len(repository._scan("votes/v1/ballots")) == 3
+    assert repository._scan("votes/v2/ballots") == []
+    assert [doc_id for doc_id, _ in repository._scan(JOBS_COLLECTION)] == ["v1"]
@@ -0,0 +1,76 @@
+from fastapi import FastAPI
+from fastapi.responses import PlainTextResponse, StreamingResponse
+from fastapi.testclient import TestClient
+
+from backend.server import compression
+from backend.server.cache import etag_matches
+from backend.server.compression import CompressionMiddleware, choose_encoding
+from backend.server.serialization import FastJSONResponse
+
+
+def _client():
+    app = FastAPI(default_response_class=FastJSONResponse)
+    app.add_middleware(CompressionMiddleware, minimum_size=100)
+
+    @app.get("/big")
+    def big():
+        return {"items": ["안건 본문입니다"] * 200}
+
+    @app.get("/tagged")
+    def tagged():
+        return PlainTextResponse("안건 " * 200, headers={"ETag": '"abc"'})
+
+    @app.get("/small")
+    def small():
+        return PlainTextResponse("ok")
+
+    @app.get("/stream")
+    def stream():
+        return StreamingResponse(
+            (f"{i}\n" for i in range(100)), media_type="application/x-ndjson"
+        )
+
+    return TestClient(app)
+
+
+def test_choose_encoding_honours_q_values():
+    assert choose_encoding("gzip, deflate") == "gzip"
+    assert choose_encoding("gzip;q=0, identity") is None
+    assert choose_encoding("") is None
+    if compression.brotli is not None:
+        assert choose_encoding("gzip, br") == "br"
+
+
+def test_large_responses_are_compressed_and_small_ones_are_not():
+    client = _client()
+
+    r = client.get("/big", headers={"Accept-Encoding": "gzip"})
+    assert r.headers["content-encoding"] == "gzip"
+    assert "Accept-Encoding" in r.headers["vary"]
+    assert int(r.headers["content-length"]) < len(r.content)
+    assert r.json()["items"][0] == "안건 본문입니다"
+
+    r = client.get("/small", headers={"Accept-Encoding": "gzip"})
+    assert "content-encoding" not in r.headers
+    assert r.text == "ok"
+
+
+def test_streaming_responses_are_compressed_incrementally():
+    client = _client()
+    r = client.get("/stream", headers={"Accept-Encoding": "gzip"})
+    assert r.headers["content-encoding"] == "gzip"
+    assert r.text.splitlines()[-1] == "99"
+
+
+def test_compressed_variants_get_their_own_etag():
+    client = _client()
+
+    plain = client.get("/tagged", headers={"Accept-Encoding": "identity"})
+    assert plain.headers["etag"] == '"abc"'
+    # 압축하지 않을 때도 캐시가 표현을 섞지 않도록 Vary 를 붙인다
+    assert "Accept-Encoding" in plain.headers["vary"]
+
+    gzipped = client.get("/tagged", headers={"Accept-Encoding": "gzip"})
+    assert gzipped.headers["etag"] == '"abc-gzip"'
+    assert etag_matches(gzipped.headers["etag"], '"abc"')
+    assert not etag_matches('"abd-gzip"', '"abc"')
@@ -0,0 +1,98 @@
+import asyncio
+import os
+
+os.environ["STORAGE_BACKEND"] = "memory"
+
+from fastapi.testclient import TestClient  # noqa: E402
+from starlette.requests import Request  # noqa: E402
+
+from backend.server import main  # noqa: E402
+from backend.server.events import IssueEventHub  # noqa: E402
+
+
+def test_resume_returns_backlog_after_last_event_id():
+    async def scenario():
+        hub = IssueEventHub(history=10, epoch="boot1")
+        for n in range(3):
+            hub.publish("modified", {"id": f"i{n}"})
+
+        _, backlog = hub.subscribe("boot1-1")
+        assert [m.split("\n")[0] for m in backlog] == ["id: boot1-2", "id: boot1-3"]
+
+        _, backlog = hub.subscribe(hub.last_event_id)
+        assert backlog == []
+
+    asyncio.run(scenario())
+
+
+def test_resume_from_other_process_or_unknown_id_needs_reset():
+    async def scenario():
+        hub = IssueEventHub(history=2, epoch="boot2")
+        for n in range(4):
+            hub.publish("modified", {"id": f"i{n}"})
+
+        # 재시작 전 / 다른 워커의 id, 아직 없는 번호, history 밖, 알 수 없는 형식
+        for last_event_id in ("boot1-1", "boot1-9", "boot2-9", "boot2-1", "7", "x"):
+            _, backlog = hub.subscribe(last_event_id)
+            assert backlog is None, last_event_id
+
+    asyncio.run(scenario())
+
+
+class FakeWatchDB:
+    def collection(self, name):
+        return self
+
+    def on_snapshot(self, callback):
+        return self
+
+    def unsubscribe(self):
+        pass
+
+
+def test_stream_sends_backlog_or_reset(monkeypatch):
+    hub = IssueEventHub(epoch="boot3")
+    monkeypatch.setitem(main.issue_event_hubs, "issues", hub)
+    monkeypatch.setattr(main, "require_watch", lambda: None)
+    monkeypatch.setattr(main, "get_watch_db", FakeWatchDB)
+
+    def request(last_event_id):
+        query = f"last_event_id={last_event_id}".encode()
+        return Request({"type": "http", "headers": [], "query_string": query})
+
+    async def first_messages(last_event_id, count):
+        hub.publish("modified", {"id": "a"})
+        hub.publish("removed", {"id": "b"})
+        response = await main.stream_issues(request(last_event_id), "issues", None)
+        body = response.body_iterator
+        try:
+            return [await body.__anext__() for _ in range(count)]
+        finally:
+            await body.aclose()
+
+    try:
+        messages = asyncio.run(first_messages("boot3-1", 2))
+        assert messages[1].startswith("id: boot3-2\nevent: removed")
+        assert hub.subscriber_count == 0
+
+        messages = asyncio.run(first_messages("old-5", 2))
+        assert messages[1] == f"id: {hub.last_event_id}\nevent: reset\ndata: {{}}\n\n"
+    finally:
+        main.issue_mirrors["issues"].stop()
+
+
+def test_stream_is_unavailable_without_watch():
+    client = TestClient(main.app)
+    assert client.get("/issues/stream").status_code == 503
+
+
+def test_leader_only_listeners_skip_non_leaders(monkeypatch):
+    calls = []
+    listener = main.leader_only(calls.append)
+
+    monkeypatch.setattr(main.leader_watchdog, "leader", False)
+    listener(["change"])
+    monkeypatch.setattr(main.leader_watchdog, "leader", True)
+    listener(["change"])
+
+    assert calls == [["change"]]
@@ -0,0 +1,94 @@
+import asyncio
+import json
+import os
+
+os.environ["STORAGE_BACKEND"] = "memory"
+
+from fastapi.testclient import TestClient  # noqa: E402
+
+from backend.server import main  # noqa: E402
+from backend.server.export import content_disposition, csv_value, stream_export  # noqa: E402
+from backend.server.repository import MemoryRepository  # noqa: E402
+
+
+def collect(repository, collection, fmt, columns=(), **options):
+    async def fetch_page(after, size):
+        return await repository.page_documents(collection, after, size)
+
+    async def run():
+        return [
+            chunk
+            async for chunk in stream_export(
+                fetch_page,
+                lambda doc_id, data: [{"id": doc_id, **data}],
+                fmt,
+                columns,
+                **options,
+            )
+        ]
+
+    return asyncio.run(run())
+
+
+def test_ndjson_pages_in_id_order_and_resumes_after_cursor():
+    repository = MemoryRepository()
+    repository.seed({"issues": {f"i{n}": {"title": f"안건 {n}"} for n in range(5)}})
+
+    chunks = collect(repository, "issues", "ndjson", page_size=2)
+    # 한 페이지가 한 덩어리 (2 + 2 + 1)
+    assert [chunk.count(b"\n") for chunk in chunks] == [2, 2, 1]
+
+    lines = b"".join(chunks).decode("utf-8").splitlines()
+    assert [json.loads(line)["id"] for line in lines] == ["i0", "i1", "i2", "i3", "i4"]
+
+    resumed = b"".join(collect(repository, "issues", "ndjson", after="i2", limit=1))
+    assert [json.loads(line)["id"] for line in resumed.splitlines()] == ["i3"]
+
+
+def test_csv_writes_bom_and_header_only_from_start():
+    repository = MemoryRepository()
+    repository.seed({"issues": {"a": {"title": "임금, 단협", "tags": ["x", "y"]}}})
+
+    body = b"".join(collect(repository, "issues", "csv", ("id", "title", "tags")))
+    assert body.decode("utf-8-sig").splitlines() == ["id,title,tags", 'a,"임금, 단협",x|y']
+
+    resumed = b"".join(collect(repository, "issues", "csv", ("id",), after="a"))
+    assert resumed == b""
+
+    assert csv_value(None) == ""
+    assert csv_value(True) == "true"
+
+
+def test_content_disposition_keeps_non_ascii_names_in_filename_star():
+    header = content_disposition("ballots-임금.csv")
+    header.encode("latin-1")
+    assert header == (
+        'attachment; filename="ballots-__.csv"; '
+        "filename*=UTF-8''ballots-%EC%9E%84%EA%B8%88.csv"
+    )
+
+
+def test_ballot_export_with_korean_issue_id_and_legacy_choice(monkeypatch):
+    monkeypatch.setenv("ADMIN_USERNAME", "admin")
+    monkeypatch.setenv("ADMIN_PASSWORD", "pw")
+    main.repository.seed(
+        {
+            "votes/임금/ballots": {
+                "me": {"choice": "yes"},
+                "you": {"selectedOptions": ["반대"], "type": "vote"},
+            }
+        }
+    )
+    client = TestClient(main.app)
+
+    response = client.get(
+        "/admin/export/issues/임금/ballots", params={"format": "csv"}, auth=("admin", "pw")
+    )
+
+    assert response.status_code == 200
+    assert "filename*=UTF-8''ballots-%EC%9E%84%EA%B8%88.csv" in response.headers[
+        "content-disposition"
+    ]
+    rows = response.content.decode("utf-8-sig").splitlines()
+    assert rows[0] == "uid,issueId,type,selectedOptions,choice,submittedAt,updatedAt"
+    assert rows[1:] == ["me,임금,,찬성,yes,,", "you,임금,vote,반대,,,"]
@@ -0,0 +1,82 @@
+import json
+import types
+
+from backend.server.feed import FeedPublisher, build_feed, chunk_payload
+
+
+class _FakeDB:
+    def __init__(self):
+        self.docs = {}
+
+    def collection(self, name):
+        db = self
+
+        class _Col:
+            def document(self, doc_id):
+                path = f"{name}/{doc_id}"
+                return types.SimpleNamespace(
+                    path=path,
+                    get=lambda: types.SimpleNamespace(
+                        exists=path in db.docs, to_dict=lambda: db.docs.get(path)
+                    ),
+                )
+
+        return _Col()
+
+    def batch(self):
+        db = self
+        ops = []
+
+        class _Batch:
+            def set(self, ref, data):
+                ops.append(("set", ref.path, data))
+
+            def delete(self, ref):
+                ops.append(("delete", ref.path, None))
+
+            def commit(self):
+                for kind, path, data in ops:
+                    if kind == "set":
+                        db.docs[path] = data
+                    else:
+                        db.docs.pop(path, None)
+
+        return _Batch()
+
+
+def test_build_feed_filters_and_sorts():
+    issues = build_feed(
+        [
+            ("a", {"type": "vote", "status": "open", "order": 2}),
+            ("b", {"type": "notice", "status": "draft", "order": 1}),
+            ("c", {"type": "notice", "status": "closed", "order": 3, "isPinned": True}),
+            ("d", {"type": "survey", "status": "open", "order": 1, "active": False}),
+        ]
+    )
+    assert [x["id"] for x in issues] == ["c", "a"]
+
+
+def test_chunk_payload_keeps_utf8_boundaries():
+    payload = "가나다abc" * 50
+    chunks = chunk_payload(payload, 10)
+    assert "".join(chunks) == payload
+    assert all(len(x.encode("utf-8")) <= 10 for x in chunks)
+
+
+def test_publisher_writes_chunks_and_skips_unchanged():
+    db = _FakeDB()
+    publisher = FeedPublisher(lambda: db, lambda: [], chunk_bytes=1000)
+    issues = build_feed(
+        [(str(i), {"type": "notice", "status": "open", "title": "공지" * 50}) for i in range(20)]
+    )
+
+    assert publisher.publish(issues)
+    assert not publisher.publish(issues)
+
+    head = db.docs["public_feed/current"]
+    parts = [head["payload"]] + [
+        db.docs[f"public_feed/current_v{head['version']}_{i}"]["payload"]
+        for i in range(1, head["chunks"])
+    ]
+    assert head["chunks"] > 1
+    assert json.loads("".join(parts)) == issues
@@ -0,0 +1,95 @@
+import os
+
+os.environ["STORAGE_BACKEND"] = "memory"
+
+from fastapi.testclient import TestClient  # noqa: E402
+
+from backend.server import main  # noqa: E402
+
+
+def issue_ids(client) -> list:
+    return [x["id"] for x in client.get("/issues?fields=title").json()]
+
+
+def test_batch_reorder_moves_issues_by_order_key():
+    main.repository.seed(
+        {"issues": {x: {"title": x, "order_key": f"a{n}"} for n, x in enumerate("abcd")}}
+    )
+    main.issues_cache.invalidate()
+    client = TestClient(main.app)
+
+    response = client.post(
+        "/issues:batch",
+        json={
+            "operations": [
+                # 앞 연산이 옮긴 자리를 뒤 연산이 본다: d, a, c, b
+                {"op": "reorder", "id": "d", "after": None},
+                {"op": "reorder", "id": "c", "after": "a"},
+                {"op": "reorder", "id": "b", "after": "c"},
+                {"op": "reorder", "id": "a", "order": 0},
+            ]
+        },
+    ).json()
+
+    assert [r["status"] for r in response["results"]] == ["ok", "ok", "ok", "error"]
+    assert "after" in response["results"][3]["error"]
+    assert issue_ids(client) == ["d", "a", "c", "b"]
+
+
+def test_batch_reports_only_the_failing_operations():
+    main.repository.seed({"issues": {"a": {"title": "a", "order_key": "a0"}}})
+    main.issues_cache.invalidate()
+    client = TestClient(main.app)
+
+    response = client.post(
+        "/issues:batch",
+        json={
+            "operations": [
+                {"op": "update", "id": "a", "data": {"title": "A"}},
+                {"op": "update", "id": "missing", "data": {"title": "x"}},
+                {"op": "create", "id": "n", "data": {"title": "n", "summary": "s"}},
+                {"op": "create", "id": "n", "data": {"title": "n2", "summary": "s"}},
+                {"op": "create", "id": "a", "data": {"title": "dup", "summary": "s"}},
+            ]
+        },
+    ).json()
+
+    assert [r["status"] for r in response["results"]] == ["ok", "error", "ok", "error", "error"]
+    assert "missing" in response["results"][1]["error"]
+    titles = {x["id"]: x["title"] for x in client.get("/issues?fields=title").json()}
+    assert (titles["a"], titles["n"], "missing" in titles) == ("A", "n", False)
+
+
+def test_batch_commits_in_chunks_and_invalidates_once(monkeypatch):
+    main.repository.seed({"issues": {"a": {"title": "a", "order_key": "a0"}}})
+    main.issues_cache.invalidate()
+    client = TestClient(main.app)
+
+    commits = []
+    invalidations = []
+    commit = main.repository.commit_issue_writes
+
+    async def counting_commit(writes):
+        commits.append(len(writes))
+        return await commit(writes)
+
+    async def counting_invalidate():
+        invalidations.append(1)
+
+    monkeypatch.setattr(main, "FIRESTORE_BATCH_SIZE", 2)
+    monkeypatch.setattr(main, "ISSUES_BATCH_MAX_OPS", 5)
+    monkeypatch.setattr(main.repository, "commit_issue_writes", counting_commit)
+    monkeypatch.setattr(main, "invalidate_issues_cache", counting_invalidate)
+
+    operations = [
+        {"op": "create", "id": f"c{n}", "data": {"title": f"c{n}", "summary": "s"}} for n in range(4)
+    ] + [{"op": "delete", "id": "a"}]
+    response = client.post("/issues:batch", json={"operations": operations}).json()
+
+    assert (response["ok"], response["failed"]) == (5, 0)
+    assert commits == [2, 2, 1]
+    assert invalidations == [1]
+
+    too_many = client.post("/issues:batch", json={"operations": operations + operations[:1]})
+    assert too_many.status_code == 400
+    assert commits == [2, 2, 1]
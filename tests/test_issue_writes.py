@@ -0,0 +1,37 @@
+import os
+
+os.environ["STORAGE_BACKEND"] = "memory"
+
+from fastapi.testclient import TestClient  # noqa: E402
+
+from backend.server import main  # noqa: E402
+
+FULL = {"title": "임금", "summary": "본문", "company": "", "union_opt": "", "order": 0}
+
+
+def test_patch_and_put_use_last_update_time():
+    main.repository.seed({"issues": {"w1": {"title": "처음", "order_key": "w1"}}})
+    client = TestClient(main.app)
+
+    patched = client.patch("/issues/w1", json={"title": "고침"})
+    assert patched.status_code == 200
+    update_time = patched.json()["update_time"]
+    (stored,) = main.repository._read_many([("issues", "w1")])
+    assert (stored["title"], stored["order_key"]) == ("고침", "w1")
+
+    # 그 사이 다른 곳에서 고쳤으면 412
+    client.patch("/issues/w1", json={"summary": "다른 곳"})
+    stale = client.put("/issues/w1", params={"last_update_time": update_time}, json=FULL)
+    assert stale.status_code == 412
+
+    bad = client.put("/issues/w1", params={"last_update_time": "어제"}, json=FULL)
+    assert bad.status_code == 400
+
+    assert client.patch("/issues/w1", json={}).status_code == 400
+
+
+def test_missing_issue_is_404():
+    client = TestClient(main.app)
+    assert client.put("/issues/nope", json=FULL).status_code == 404
+    assert client.patch("/issues/nope", json={"title": "x"}).status_code == 404
+    assert client.delete("/issues/nope").status_code == 404
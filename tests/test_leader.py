@@ -0,0 +1,53 @@
+import asyncio
+
+from backend.server.leader import LeaderWatchdog
+
+
+def test_watchdog_takes_over_and_steps_down():
+    replies = iter([False, True, True, ConnectionError("down"), False])
+    events = []
+
+    async def try_lead(name):
+        reply = next(replies)
+        if isinstance(reply, Exception):
+            raise reply
+        return reply
+
+    async def elected():
+        events.append("elected")
+
+    async def demoted():
+        events.append("demoted")
+
+    watchdog = LeaderWatchdog("mirror", try_lead, elected, demoted, lease=30)
+
+    async def scenario():
+        return [await watchdog.check() for _ in range(5)]
+
+    # 캐시에 잠깐 닿지 않아도 lease 안에서는 리더를 유지한다
+    assert asyncio.run(scenario()) == [False, True, True, True, False]
+    assert events == ["elected", "demoted"]
+    assert watchdog.stats()["elections"] == 1
+
+
+def test_watchdog_resigns_on_stop():
+    resigned = []
+
+    async def try_lead(name):
+        return True
+
+    async def resign(name):
+        resigned.append(name)
+
+    async def noop():
+        pass
+
+    watchdog = LeaderWatchdog("mirror", try_lead, noop, noop, resign=resign)
+
+    async def scenario():
+        await watchdog.check()
+        await watchdog.stop()
+
+    asyncio.run(scenario())
+    assert resigned == ["mirror"]
+    assert watchdog.leader is False
@@ -0,0 +1,41 @@
+import json
+import logging
+import queue
+
+from backend.server.logs import DeferredQueueHandler, JsonFormatter
+
+
+def test_queue_handler_resolves_message_and_defers_formatting():
+    records = queue.SimpleQueue()
+    logger = logging.getLogger("test_logs.deferred")
+    handler = DeferredQueueHandler(records)
+    propagate = logger.propagate
+    logger.propagate = False
+    logger.addHandler(handler)
+
+    try:
+        payload = ["quota"]
+        logger.warning("batch commit 실패: %s", payload, extra={"operations": 3})
+        # 넣은 뒤에 인자가 바뀌어도 로그에는 넣은 시점의 값이 남는다
+        payload.append("late")
+
+        try:
+            raise ValueError("boom")
+        except ValueError:
+            logger.exception("변환 실패")
+    finally:
+        logger.removeHandler(handler)
+        logger.propagate = propagate
+
+    record = records.get_nowait()
+    assert record.msg == "batch commit 실패: ['quota']"
+    assert record.args is None
+
+    entry = json.loads(JsonFormatter().format(record))
+    assert entry["level"] == "WARNING"
+    assert entry["msg"] == "batch commit 실패: ['quota']"
+    assert entry["operations"] == 3
+
+    record = records.get_nowait()
+    assert record.exc_info is None
+    assert "ValueError: boom" in json.loads(JsonFormatter().format(record))["exc"]
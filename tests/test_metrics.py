@@ -0,0 +1,43 @@
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from backend.server import metrics
+from backend.server.metrics import FirestoreSlots, Histogram, MetricsMiddleware
+
+
+def test_histogram_renders_cumulative_buckets():
+    histogram = Histogram("x_seconds", "x", ("route",), buckets=(0.1, 1.0))
+    histogram.observe(("/a",), 0.05)
+    histogram.observe(("/a",), 0.5)
+    histogram.observe(("/a",), 5.0)
+
+    lines = histogram.render()
+    assert 'x_seconds_bucket{route="/a",le="0.1"} 1' in lines
+    assert 'x_seconds_bucket{route="/a",le="1.0"} 2' in lines
+    assert 'x_seconds_bucket{route="/a",le="+Inf"} 3' in lines
+    assert 'x_seconds_count{route="/a"} 3' in lines
+
+
+def test_middleware_accounts_firestore_usage_per_route():
+    app = FastAPI()
+    app.add_middleware(MetricsMiddleware)
+    slots = FirestoreSlots(4)
+
+    @app.get("/items/{item_id}")
+    async def item(item_id: str):
+        # 처리 중인 요청도 route 템플릿으로 센다
+        assert metrics.http_in_flight._values[("GET", "/items/{item_id}")] == 1
+        async with slots("items.get"):
+            pass
+        metrics.count_documents(read=3)
+        return {"id": item_id}
+
+    client = TestClient(app)
+    client.get("/items/1")
+    client.get("/items/2")
+
+    text = metrics.registry.render()
+    assert 'http_requests_total{method="GET",route="/items/{item_id}",status="200"} 2' in text
+    assert 'firestore_rpcs_total{route="/items/{item_id}"} 2' in text
+    assert 'firestore_documents_read_total{route="/items/{item_id}"} 6' in text
+    assert 'http_requests_in_flight{method="GET",route="/items/{item_id}"} 0' in text
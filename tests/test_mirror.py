@@ -0,0 +1,53 @@
+import types
+
+from backend.server.mirror import CollectionMirror
+
+
+def _doc(doc_id, data):
+    return types.SimpleNamespace(id=doc_id, to_dict=lambda: data)
+
+
+def _change(kind, doc_id, data=None):
+    return types.SimpleNamespace(
+        type=types.SimpleNamespace(name=kind), document=_doc(doc_id, data or {})
+    )
+
+
+def test_mirror_query_sorted_and_paged():
+    mirror = CollectionMirror("issues", ("title", "order", "status"))
+    mirror.apply_snapshot(
+        [
+            _doc("a", {"title": "A", "order": 2, "status": "open"}),
+            _doc("b", {"title": "B", "order": 1, "status": "closed"}),
+            _doc("c", {"title": "C", "order": 1, "status": "open"}),
+        ],
+        [],
+        None,
+    )
+
+    rows, has_more = mirror.query(limit=2)
+    assert [doc_id for doc_id, _ in rows] == ["b", "c"]
+    assert has_more
+
+    rows, has_more = mirror.query(after=(1, "c"), limit=2)
+    assert [doc_id for doc_id, _ in rows] == ["a"]
+    assert not has_more
+
+    rows, _ = mirror.query(filters={"status": "open"})
+    assert [doc_id for doc_id, _ in rows] == ["c", "a"]
+
+
+def test_mirror_applies_changes_and_notifies():
+    mirror = CollectionMirror("issues", ("title", "order"))
+    seen = []
+    mirror.add_listener(seen.append)
+    mirror.apply_snapshot([_doc("a", {"title": "A", "order": 1})], [], None)
+    assert seen == []
+
+    mirror.apply_snapshot(
+        [],
+        [_change("MODIFIED", "a", {"title": "A2", "order": 1}), _change("REMOVED", "b")],
+        None,
+    )
+    assert mirror.get("a") == {"title": "A2", "order": 1}
+    assert len(seen) == 1
@@ -0,0 +1,65 @@
+from mobile import api_client
+
+
+class FakeResponse:
+    def __init__(self, status_code, payload=None, headers=None):
+        self.status_code = status_code
+        self._payload = payload
+        self.headers = headers or {}
+
+    def json(self):
+        return self._payload
+
+    def raise_for_status(self):
+        if self.status_code >= 400:
+            raise RuntimeError(self.status_code)
+
+
+def test_backend_issues_reuse_cached_body_on_304(monkeypatch):
+    sent = []
+    replies = iter(
+        [
+            FakeResponse(200, [{"id": "a"}], {"ETag": '"v1"'}),
+            FakeResponse(304),
+        ]
+    )
+
+    def fake_get(url, headers=None, timeout=None):
+        sent.append(dict(headers or {}))
+        return next(replies)
+
+    monkeypatch.setattr(api_client.requests, "get", fake_get)
+    monkeypatch.setattr(api_client, "_CONDITIONAL_CACHE", {})
+
+    assert api_client.fetch_backend_issues("http://server/") == [{"id": "a"}]
+    # 두 번째 요청은 ETag 를 보내고, 304 면 저장해 둔 본문을 돌려준다
+    assert api_client.fetch_backend_issues("http://server/") == [{"id": "a"}]
+    assert sent == [{}, {"If-None-Match": '"v1"'}]
+
+
+def test_fetch_batch_keeps_only_successful_reads(monkeypatch):
+    sent = []
+
+    def fake_post(url, headers=None, json=None, timeout=None):
+        sent.append((url, json))
+        return FakeResponse(
+            200,
+            {
+                "results": [
+                    {"op": "issue", "id": "v1", "ok": True, "data": {"title": "임금"}},
+                    {"op": "stats", "id": "v1", "ok": False, "error": "boom"},
+                ]
+            },
+        )
+
+    monkeypatch.setattr(api_client.requests, "post", fake_post)
+
+    results = api_client.fetch_batch("http://server", "token", [("issue", "v1"), ("stats", "v1")])
+
+    assert results == {("issue", "v1"): {"title": "임금"}}
+    assert sent == [
+        (
+            "http://server/batch",
+            {"operations": [{"op": "issue", "id": "v1"}, {"op": "stats", "id": "v1"}]},
+        )
+    ]
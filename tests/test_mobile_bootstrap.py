@@ -0,0 +1,36 @@
+import os
+
+os.environ["STORAGE_BACKEND"] = "memory"
+
+from fastapi.testclient import TestClient  # noqa: E402
+
+from backend.server import main  # noqa: E402
+
+
+def test_bootstrap_endpoint_answers_304_for_same_user(monkeypatch):
+    monkeypatch.setattr(main, "MOBILE_AUTH", "insecure")
+    main.repository.seed(
+        {
+            "issues_public": {"b1": {"type": "vote", "status": "open", "title": "임금"}},
+            "votes/b1/ballots": {"uid1": {"uid": "uid1", "selectedOptions": ["찬성"]}},
+            "vote_stats": {"b1": {"yes": 1}},
+        }
+    )
+    client = TestClient(main.app)
+
+    assert client.get("/mobile/bootstrap").status_code == 401
+
+    first = client.get("/mobile/bootstrap", headers={"Authorization": "Bearer uid1"})
+    assert first.status_code == 200
+    body = first.json()
+    assert body["ballots"]["b1"]["selectedOptions"] == ["찬성"]
+    assert body["stats"]["b1"]["total"] == 1
+    # 사용자별 응답이라 공유 캐시에는 남기지 않는다
+    assert first.headers["cache-control"] == "private, no-cache"
+    assert "Authorization" in first.headers["vary"]
+
+    again = client.get(
+        "/mobile/bootstrap",
+        headers={"Authorization": "Bearer uid1", "If-None-Match": first.headers["etag"]},
+    )
+    assert again.status_code == 304
@@ -0,0 +1,67 @@
+import asyncio
+import random
+
+import pytest
+
+from backend.server.ordering import (
+    ORDER_KEY_FIELD,
+    OrderRebalancer,
+    is_order_key,
+    key_between,
+    plan_rebalance,
+    spread_keys,
+)
+from backend.server.repository import MemoryRepository
+
+
+def test_key_between_stays_ordered_under_random_inserts():
+    rng = random.Random(7)
+    keys = [key_between(None, None)]
+
+    for _ in range(2000):
+        i = rng.randint(0, len(keys))
+        lower = keys[i - 1] if i > 0 else None
+        upper = keys[i] if i < len(keys) else None
+        key = key_between(lower, upper)
+        assert (lower is None or lower < key) and (upper is None or key < upper)
+        assert is_order_key(key)
+        keys.insert(i, key)
+
+    # 끝에 붙이기만 하면 키가 거의 길어지지 않는다
+    assert max(len(key) for key in spread_keys(4000)) == 4
+
+    with pytest.raises(ValueError):
+        key_between("a1", "a1")
+
+
+def test_plan_rebalance_appends_missing_and_respreads_crowded_keys():
+    rows = [
+        ("new", {"order": 1}),
+        ("old", {"order": 0}),
+        ("kept", {"order_key": "a5"}),
+    ]
+    # 키가 없는 문서만 order 순으로 맨 뒤에 붙인다
+    assert plan_rebalance(rows) == {"old": "a6", "new": "a7"}
+
+    crowded = [("x", {"order_key": "a0"}), ("y", {"order_key": "a0V" + "V" * 20})]
+    assert plan_rebalance(crowded) == {"y": "a1"}
+
+
+def test_rebalancer_skips_documents_moved_after_the_scan():
+    class MovedDuringScan(MemoryRepository):
+        async def page_issue_versions(self, after, limit, fields):
+            rows = await super().page_issue_versions(after, limit, fields)
+            # 스캔과 쓰기 사이에 다른 요청이 b 를 옮긴다
+            self.seed({"issues": {"b": {"order": 2, ORDER_KEY_FIELD: "a5"}}})
+            return rows
+
+    repository = MovedDuringScan()
+    repository.seed({"issues": {"a": {"order": 1}, "b": {"order": 2}, "c": {"order": 3}}})
+
+    written = asyncio.run(OrderRebalancer(repository).run_once())
+
+    keys = {doc_id: data.get(ORDER_KEY_FIELD) for doc_id, data in repository._scan("issues")}
+    assert written == 2
+    # 옮긴 키는 되돌리지 않는다
+    assert keys["b"] == "a5"
+    assert is_order_key(keys["a"]) and is_order_key(keys["c"])
@@ -0,0 +1,51 @@
+import os
+
+os.environ["STORAGE_BACKEND"] = "memory"
+
+import pytest  # noqa: E402
+from fastapi.testclient import TestClient  # noqa: E402
+
+from backend.server import main  # noqa: E402
+from backend.server.pagination import decode_cursor, encode_cursor  # noqa: E402
+
+
+def test_cursor_round_trip():
+    cursor = encode_cursor("a3", "abc")
+    assert decode_cursor(cursor) == ("a3", "abc")
+
+    with pytest.raises(ValueError):
+        decode_cursor("not-a-cursor")
+    # 형식은 맞아도 정렬 키가 문자열이 아니면 거부한다
+    with pytest.raises(ValueError):
+        decode_cursor(encode_cursor(1, "abc"))
+
+
+def test_bad_cursor_and_storage_failure_map_to_http_errors(monkeypatch):
+    client = TestClient(main.app)
+    assert client.get("/issues", params={"cursor": encode_cursor(1, "x")}).status_code == 400
+
+    async def failing(*args, **kwargs):
+        raise main.RepositoryError("unavailable")
+
+    monkeypatch.setattr(main.repository, "list_issues", failing)
+    main.issues_cache.invalidate()
+    assert client.get("/issues?limit=3&fields=title").status_code == 502
+
+
+def test_issues_without_limit_returns_every_page(monkeypatch):
+    main.repository.seed(
+        {"issues": {f"p{n}": {"title": f"p{n}", "order_key": f"p{n}"} for n in range(5)}}
+    )
+    main.issues_cache.invalidate()
+    # 내부에서 2개씩 끝까지 읽는다
+    monkeypatch.setattr(main, "ISSUES_MAX_LIMIT", 2)
+    client = TestClient(main.app)
+
+    response = client.get("/issues?fields=title")
+    ids = [x["id"] for x in response.json()]
+    assert [x for x in ids if x.startswith("p")] == [f"p{n}" for n in range(5)]
+    assert "x-next-cursor" not in response.headers
+
+    response = client.get("/issues?fields=title&limit=1")
+    assert len(response.json()) == 1
+    assert response.headers["x-next-cursor"]
@@ -0,0 +1,81 @@
+import types
+
+from backend.server.mirror import CollectionMirror
+from backend.server.publish import (
+    PUBLIC_DEFAULTS,
+    PublicProjector,
+    diff_public_issue,
+    project_public_issue,
+)
+
+
+def _doc(doc_id, data):
+    return types.SimpleNamespace(id=doc_id, to_dict=lambda: data)
+
+
+class _FakeDB:
+    def __init__(self):
+        self.commits = []
+
+    def collection(self, name):
+        return types.SimpleNamespace(
+            document=lambda doc_id: types.SimpleNamespace(path=f"{name}/{doc_id}")
+        )
+
+    def batch(self):
+        ops = []
+        db = self
+
+        class _Batch:
+            def set(self, ref, data, merge=False):
+                ops.append(("set", ref.path, data))
+
+            def delete(self, ref):
+                ops.append(("delete", ref.path, None))
+
+            def commit(self):
+                db.commits.append(list(ops))
+
+        return _Batch()
+
+
+def test_project_maps_union_opt_and_defaults():
+    projected = project_public_issue({"title": "T", "union_opt": "U", "order": 3})
+    assert projected["union"] == "U"
+    assert projected["order"] == 3
+    assert projected["status"] == "draft"
+    assert set(projected) == set(PUBLIC_DEFAULTS)
+
+
+def test_diff_returns_only_changed_fields():
+    projected = project_public_issue({"title": "새 제목", "options": ["a"]})
+    current = {**projected, "title": "옛 제목", "options": ("a",)}
+    assert diff_public_issue(projected, current) == {"title": "새 제목"}
+
+
+def test_projector_writes_changes_in_batches_and_skips_unchanged():
+    db = _FakeDB()
+    public = CollectionMirror("issues_public", tuple(PUBLIC_DEFAULTS))
+    unchanged = project_public_issue({"title": "같음"})
+    public.apply_snapshot([_doc("same", unchanged), _doc("gone", unchanged)], [], None)
+
+    source = CollectionMirror("issues", ("title",))
+    projector = PublicProjector(lambda: db, source, public, batch_size=2)
+
+    result = projector.publish(
+        {
+            "same": {"title": "같음"},
+            "new1": {"title": "A"},
+            "new2": {"title": "B"},
+            "gone": None,
+        }
+    )
+
+    assert result == {"checked": 4, "written": 2, "deleted": 1, "unchanged": 1}
+    assert [len(ops) for ops in db.commits] == [2, 1]
+    written = {path: data for kind, path, data in sum(db.commits, []) if kind == "set"}
+    assert "updatedAt" in written["issues_public/new1"]
+    assert "issues_public/same" not in written
+
+    # 공개 미러가 아직 따라오지 않았어도 같은 내용은 다시 쓰지 않는다
+    assert projector.publish({"new1": {"title": "A"}})["written"] == 0
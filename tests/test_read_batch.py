@@ -0,0 +1,68 @@
+import os
+
+os.environ["STORAGE_BACKEND"] = "memory"
+
+from fastapi.testclient import TestClient  # noqa: E402
+
+from backend.server import main  # noqa: E402
+
+AUTH = {"Authorization": "Bearer uid1"}
+
+
+def test_batch_returns_each_read_in_request_order(monkeypatch):
+    monkeypatch.setattr(main, "MOBILE_AUTH", "insecure")
+    main.repository.seed(
+        {
+            "issues_public": {
+                "v1": {"type": "vote", "status": "open", "title": "임금"},
+                "v2": {"type": "vote", "status": "open", "resultVisibility": "after_close"},
+            },
+            "votes/v1/ballots": {"uid1": {"uid": "uid1", "selectedOptions": ["찬성"]}},
+            "vote_stats": {"v1": {"yes": 2, "no": 1}, "v2": {"yes": 5}},
+            "meta": {"version": {"version": "3"}},
+        }
+    )
+    client = TestClient(main.app)
+
+    response = client.post(
+        "/batch",
+        headers=AUTH,
+        json={
+            "operations": [
+                {"op": "issue", "id": "v1"},
+                {"op": "ballot", "id": "v1"},
+                {"op": "stats", "id": "v1"},
+                {"op": "version"},
+                {"op": "stats", "id": "v2"},
+                {"op": "ballot"},
+            ]
+        },
+    )
+    assert response.status_code == 200
+    results = response.json()["results"]
+
+    assert [(r["op"], r["ok"]) for r in results] == [
+        ("issue", True),
+        ("ballot", True),
+        ("stats", True),
+        ("version", True),
+        ("stats", True),
+        ("ballot", False),
+    ]
+    assert results[0]["data"]["title"] == "임금"
+    assert results[1]["data"]["selectedOptions"] == ["찬성"]
+    assert results[2]["data"]["total"] == 3
+    assert results[3]["data"]["version"] == 3
+    # 마감 뒤 공개인 안건의 집계는 비어 있다
+    assert results[4]["data"] is None
+    assert "id" in results[5]["error"]
+
+
+def test_batch_requires_login_and_limits_operations(monkeypatch):
+    monkeypatch.setattr(main, "MOBILE_AUTH", "insecure")
+    monkeypatch.setattr(main, "READ_BATCH_MAX_OPS", 2)
+    client = TestClient(main.app)
+
+    assert client.post("/batch", json={"operations": []}).status_code == 401
+    too_many = {"operations": [{"op": "version"}] * 3}
+    assert client.post("/batch", headers=AUTH, json=too_many).status_code == 400
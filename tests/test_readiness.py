@@ -0,0 +1,35 @@
+import asyncio
+
+from backend.server.readiness import Readiness, warm_up
+
+
+def test_warm_up_retries_only_failed_steps():
+    readiness = Readiness()
+    calls = []
+
+    async def connect():
+        calls.append("connect")
+
+    async def fill_cache():
+        calls.append("fill_cache")
+        if calls.count("fill_cache") == 1:
+            raise ConnectionError("unavailable")
+
+    asyncio.run(
+        warm_up(readiness, [("connect", connect), ("fill_cache", fill_cache)], retry_base=0)
+    )
+
+    assert calls == ["connect", "fill_cache", "fill_cache"]
+    assert readiness.ready
+    assert readiness.snapshot()["attempts"] == 2
+    assert readiness.error is None
+
+
+def test_draining_is_not_ready():
+    readiness = Readiness()
+    readiness.mark_ready()
+    readiness.mark_draining()
+    readiness.mark_ready()
+
+    assert not readiness.ready
+    assert readiness.snapshot()["status"] == "draining"
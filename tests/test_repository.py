@@ -0,0 +1,93 @@
+import asyncio
+
+import pytest
+
+from google.api_core.exceptions import FailedPrecondition
+
+from backend.server.repository import (
+    DocumentExists,
+    DocumentNotFound,
+    FirestoreRepository,
+    MemoryRepository,
+    PreconditionFailed,
+    RepositoryError,
+    SQLiteRepository,
+)
+
+
+@pytest.fixture(params=["memory", "sqlite"])
+def repository(request, tmp_path):
+    if request.param == "memory":
+        repository = MemoryRepository()
+    else:
+        repository = SQLiteRepository(str(tmp_path / "store.db"))
+    repository.seed(
+        {
+            "issues": {
+                "a": {"title": "A", "order_key": "a1", "status": "open"},
+                "b": {"title": "B", "order_key": "a2", "status": "closed"},
+                "c": {"title": "C", "order_key": "a2", "status": "open"},
+                "x": {"title": "정렬 키 없음", "order": 1},
+            },
+            "votes/v1/ballots": {"u1": {"selectedOptions": ["찬성"]}},
+        }
+    )
+    yield repository
+    repository.close()
+
+
+def test_list_issues_pages_by_order_key_then_id(repository):
+    rows, has_more = asyncio.run(repository.list_issues(None, None, 2))
+    assert [doc_id for doc_id, _ in rows] == ["a", "b"]
+    assert has_more
+
+    rows, has_more = asyncio.run(repository.list_issues(None, ("a2", "b"), 2))
+    assert [doc_id for doc_id, _ in rows] == ["c"]
+    assert not has_more
+
+    rows, _ = asyncio.run(repository.list_issues({"status": "open", "type": None}, None, 10))
+    assert [doc_id for doc_id, _ in rows] == ["a", "c"]
+
+
+def test_update_checks_last_update_time(repository):
+    first = asyncio.run(repository.update_issue("a", {"title": "A2"}))
+    second = asyncio.run(repository.update_issue("a", {"order_key": "a5"}, first))
+    assert second != first
+
+    with pytest.raises(PreconditionFailed):
+        asyncio.run(repository.update_issue("a", {"title": "A3"}, first))
+    with pytest.raises(ValueError):
+        asyncio.run(repository.update_issue("a", {"title": "A3"}, "yesterday"))
+    with pytest.raises(DocumentNotFound):
+        asyncio.run(repository.delete_issue("nope"))
+
+    rows, _ = asyncio.run(repository.list_issues(None, ("a2", "c"), 10))
+    assert rows == [("a", {"title": "A2", "order_key": "a5", "status": "open"})]
+
+
+def test_commit_is_all_or_nothing(repository):
+    with pytest.raises(DocumentExists):
+        asyncio.run(
+            repository.commit_issue_writes(
+                [("delete", "b", None), ("create", "a", {"title": "dup", "order": 9})]
+            )
+        )
+    rows, _ = asyncio.run(repository.list_issues(None, None, 10))
+    assert [doc_id for doc_id, _ in rows] == ["a", "b", "c"]
+
+    ballots = asyncio.run(repository.get_ballots(["v1", "v2"], "u1"))
+    assert ballots == [{"selectedOptions": ["찬성"]}, None]
+
+
+def test_firestore_failed_precondition_is_412_only_for_conditional_writes():
+    repository = FirestoreRepository(slots=None)
+
+    with pytest.raises(PreconditionFailed):
+        with repository._errors(conditional=True):
+            raise FailedPrecondition("stored version does not match")
+
+    # 복합 색인이 없는 쿼리 등은 오래된 쓰기가 아니다
+    with pytest.raises(RepositoryError) as error:
+        with repository._errors():
+            raise FailedPrecondition("The query requires an index")
+    assert not isinstance(error.value, PreconditionFailed)
@@ -0,0 +1,100 @@
+import asyncio
+
+from backend.server.repository import MemoryRepository
+from backend.server.results import (
+    RESULTS_COLLECTION,
+    ResultsFreezer,
+    results_checksum,
+    serialize_results,
+    tally,
+)
+
+
+def test_tally_follows_option_order_and_counts_each_ballot_once():
+    ballots = [["찬성"], ["반대", "반대"], ["찬성", "기권"], [], ["기타"]]
+    assert tally(["찬성", "반대", "기권"], ballots) == (
+        ["찬성", "반대", "기권", "기타"],
+        [2, 1, 1, 1],
+        5,
+    )
+
+
+def test_freeze_writes_once_and_serializes_with_turnout():
+    repository = MemoryRepository()
+    repository.seed(
+        {
+            "votes/v1/ballots": {
+                f"u{n:03d}": {"selectedOptions": ["찬성" if n % 4 else "반대"]} for n in range(10)
+            }
+        }
+    )
+    freezer = ResultsFreezer(repository, eligible=20, page_size=3)
+
+    async def scenario():
+        first = await freezer.freeze("v1", ["찬성", "반대"])
+        # 이후 들어온 응답은 확정된 결과를 바꾸지 않는다
+        repository.seed({"votes/v1/ballots": {"late": {"selectedOptions": ["반대"]}}})
+        return first, await freezer.freeze("v1", ["찬성", "반대"])
+
+    first, second = asyncio.run(scenario())
+
+    assert first == second
+    assert (first["labels"], first["counts"], first["total"]) == (["찬성", "반대"], [7, 3], 10)
+    assert first["checksum"] == results_checksum(first)
+    assert len(repository._scan(RESULTS_COLLECTION)) == 1
+
+    result = serialize_results(first)
+    assert result["options"] == [
+        {"label": "찬성", "count": 7, "percent": 70.0},
+        {"label": "반대", "count": 3, "percent": 30.0},
+    ]
+    assert (result["final"], result["turnout"]) == (True, 50.0)
+
+
+def test_freeze_counts_legacy_choice_ballots():
+    repository = MemoryRepository()
+    repository.seed(
+        {
+            "votes/v1/ballots": {
+                "u1": {"choice": "yes"},
+                "u2": {"selectedOptions": ["찬성"]},
+                "u3": {"choice": "hold"},
+                "u4": {"selectedOptions": ["반대"]},
+            }
+        }
+    )
+    freezer = ResultsFreezer(repository)
+
+    data = asyncio.run(freezer.freeze("v1", ["찬성", "반대", "보류"]))
+
+    assert (data["labels"], data["counts"], data["total"]) == (
+        ["찬성", "반대", "보류"],
+        [2, 1, 1],
+        4,
+    )
+
+
+def test_sweep_freezes_closed_and_discards_reopened():
+    repository = MemoryRepository()
+    repository.seed(
+        {
+            "votes/v1/ballots": {"u1": {"selectedOptions": ["찬성"]}},
+            "votes/v2/ballots": {"u1": {"selectedOptions": ["반대"]}},
+            RESULTS_COLLECTION: {"v2": {"issueId": "v2", "total": 0}},
+        }
+    )
+    freezer = ResultsFreezer(repository)
+    issues = [
+        {"id": "v1", "status": "closed", "options": ["찬성"]},
+        # 마감 뒤 다시 열린 안건: 예전 결과를 지워야 다시 마감할 때 새로 센다
+        {"id": "v2", "status": "open", "options": ["반대"]},
+    ]
+
+    async def scenario():
+        created = await freezer.sweep(issues)
+        issues[1]["status"] = "closed"
+        return created, await freezer.sweep(issues)
+
+    assert asyncio.run(scenario()) == (1, 1)
+    (v2,) = asyncio.run(repository.get_documents(RESULTS_COLLECTION, ["v2"]))
+    assert (v2["labels"], v2["counts"], v2["total"]) == (["반대"], [1], 1)
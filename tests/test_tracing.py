@@ -0,0 +1,32 @@
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from backend.server.tracing import SlowTraceStore, TracingMiddleware, span
+
+
+def test_slow_trace_store_keeps_slowest():
+    store = SlowTraceStore(capacity=2)
+    for duration in (0.3, 0.1, 0.5, 0.2):
+        store.add(duration, {"duration": duration})
+    assert [x["duration"] for x in store.slowest()] == [0.5, 0.3]
+
+
+def test_server_timing_header_lists_spans():
+    store = SlowTraceStore(capacity=5)
+    app = FastAPI()
+    app.add_middleware(TracingMiddleware, store=store)
+
+    @app.get("/x")
+    def x():
+        with span("auth"):
+            pass
+        return {"ok": True}
+
+    r = TestClient(app).get("/x")
+    timing = r.headers["server-timing"]
+    assert timing.startswith("total;dur=")
+    assert "auth;dur=" in timing
+
+    (trace,) = store.slowest()
+    assert trace["route"] == "/x"
+    assert trace["spans"][0]["name"] == "auth"
@@ -0,0 +1,95 @@
+import asyncio
+import os
+import time
+
+os.environ["STORAGE_BACKEND"] = "memory"
+
+import pytest  # noqa: E402
+from fastapi.testclient import TestClient  # noqa: E402
+
+from backend.server import main  # noqa: E402
+from backend.server.vote_hub import VoteResultsHub, VoteSubscriber  # noqa: E402
+
+
+def test_revoke_drops_subscriptions_and_replaces_pending_stats():
+    async def scenario():
+        hub = VoteResultsHub()
+        subscriber = VoteSubscriber()
+        hub._latest["v1"] = {"total": 3, "options": []}
+        hub.subscribe(subscriber, ["v1", "v2"])
+
+        # 아직 보내지 않은 집계 대신 revoked 만 나간다
+        hub.revoke(["v1"])
+        frames = await subscriber.next_frames()
+        return hub, subscriber, frames
+
+    hub, subscriber, frames = asyncio.run(scenario())
+
+    assert frames == [{"type": "revoked", "issueId": "v1"}]
+    assert subscriber.issue_ids == {"v2"}
+    assert "v1" not in hub._subscribers
+
+
+class FakeWatchDB:
+    def collection(self, name):
+        return self
+
+    def on_snapshot(self, callback):
+        return self
+
+    def unsubscribe(self):
+        pass
+
+
+@pytest.fixture
+def ws_client(monkeypatch):
+    hub = VoteResultsHub(interval=0)
+    monkeypatch.setattr(main, "vote_results_hub", hub)
+    monkeypatch.setattr(main, "MOBILE_AUTH", "insecure")
+    monkeypatch.setattr(main, "get_watch_db", FakeWatchDB)
+    monkeypatch.setattr(main.repository, "supports_watch", True, raising=False)
+    main.repository.seed(
+        {"issues_public": {"v1": {"type": "vote", "status": "open", "title": "임금"}}}
+    )
+    yield TestClient(main.app), hub
+    main.issue_mirrors["issues_public"].stop()
+
+
+def connect(client):
+    return client.websocket_connect("/ws/votes", headers={"Authorization": "Bearer uid1"})
+
+
+def wait_until(condition, timeout=2.0):
+    deadline = time.monotonic() + timeout
+    while not condition():
+        assert time.monotonic() < deadline
+        time.sleep(0.01)
+
+
+def test_socket_sends_known_stats_on_subscribe(ws_client):
+    client, hub = ws_client
+    hub._latest["v1"] = {"total": 2, "options": [{"label": "찬성", "count": 2}]}
+
+    with connect(client) as ws:
+        ws.send_json({"subscribe": ["v1", "hidden"]})
+        frames = [ws.receive_json(), ws.receive_json()]
+
+    assert {"type": "stats", "issueId": "v1", "stats": hub._latest["v1"]} in frames
+    assert {"type": "revoked", "issueId": "hidden"} in frames
+
+
+def test_socket_fans_out_and_unsubscribes_on_disconnect(ws_client):
+    client, hub = ws_client
+    summary = {"total": 1, "options": [{"label": "찬성", "count": 1}]}
+
+    with connect(client) as first, connect(client) as second:
+        first.send_json({"subscribe": ["v1"]})
+        second.send_json({"subscribe": ["v1"]})
+        wait_until(lambda: len(hub._subscribers.get("v1", ())) == 2)
+
+        hub._loop.call_soon_threadsafe(hub._on_change, "v1", summary)
+        expected = {"type": "stats", "issueId": "v1", "stats": summary}
+        assert first.receive_json() == expected
+        assert second.receive_json() == expected
+
+    wait_until(lambda: "v1" not in hub._subscribers)